@@ -1,5 +1,7 @@
 """Base class for Computation"""
 
+from ..utils.ConversionCache import copy_on_write_enabled
+
 import pandas as pd
 
 class Computation:
@@ -22,8 +24,8 @@ class Computation:
         if not isinstance(columns, (list, type(None))):
             raise TypeError(f'columns must be a list of strings or type None, got {type(columns).__name__}')
 
-        # creating a copy of the original dataframe
-        self.df = df.copy()  
+        # creating a copy of the original dataframe, which only copies columns once they are modified when pandas copies on write
+        self.df = df.copy(deep=not copy_on_write_enabled())
 
         # if user passes a list of columns
         if columns is None: 
@@ -30,6 +30,12 @@ class Distribution(Computation):
             self.columns = self.df.columns.tolist()
         else:
             self.columns = [column for column in columns if column in self.df.columns] 
+
+        # quantiles (IQR of the robust KDE bandwidth) are computed once and shared by every method of this instance
+        self.statistics = Statistics(self.df, self.columns)
+
+        # moments (standard deviation, skewness, kurtosis) are those of the statistics, so they are only computed once
+        self.moments = self.statistics.moments
     
     def compute_histogram(self, n_bins: int =30, density: bool =False, df_axis: int=1) -> pd.DataFrame:
         """
@@ -149,16 +155,7 @@ class Distribution(Computation):
         ---------
         >>> Distribution(df).raw_kurtosis()
         """ 
-        n = len(self.df)
-
-        mean = Statistics(self.df).mean()
-        std_dev = Statistics(self.df).standard_deviation()
-
-        fourth_central_moment = (((self.df - mean)**4).sum())/n
-
-        raw_kurtosis = fourth_central_moment / ((std_dev)**4)
-
-        return raw_kurtosis.to_frame().T
+        return self.moments.raw_kurtosis().to_frame().T
 
     def excess_kurtosis(self) -> pd.DataFrame :
         """
@@ -193,11 +190,7 @@ class Distribution(Computation):
         >>> Distribution(df).excess_kurtosis()
         """
 
-        raw_kurtosis = Distribution(self.df).raw_kurtosis()
-
-        excess_kurtosis = raw_kurtosis - 3
-
-        return excess_kurtosis
+        return self.moments.excess_kurtosis().to_frame().T
 
     def compute_kde(self, bandwidth_method:str ='silverman',n_bins: int =30, density: bool =False)-> pd.DataFrame:
 
@@ -264,15 +257,14 @@ class Distribution(Computation):
 
         >>> Distribution(df).compute_kde('scott', n_bins = 50)
         """
-        from .Statistics import Statistics
-
         n = len(self.df)
 
-        std_dev =Statistics(self.df).standard_deviation()
+        std_dev = self.moments.standard_deviation()
 
-        IQR = Statistics(self.df).iqr()
+        # the IQR is only needed by the robust bandwidth
+        IQR = self.statistics.iqr() if bandwidth_method not in ['scott', 'silverman'] else None
 
-        histogram = Distribution(self.df).compute_histogram(n_bins=n_bins, density=density)
+        histogram = self.compute_histogram(n_bins=n_bins, density=density)
         
         KDE_dict = {}
 
@@ -343,4 +335,4 @@ class Distribution(Computation):
         >>> Distribution(df).skewness()
         """ 
 
-        return self.df[self.columns].skew().to_frame().T
\ No newline at end of file
+        return self.moments.skewness().to_frame().T
\ No newline at end of file
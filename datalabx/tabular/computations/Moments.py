@@ -0,0 +1,353 @@
+"""Computes the moments of one or multiple Numerical columns in a single pass, from which variance, skewness, kurtosis and range are derived."""
+
+import numpy as np
+import pandas as pd
+
+# Number of rows of a column converted to floats at once, before being merged into the moments of the column
+BLOCK_ROWS = 65_536
+
+# Moments kept for each column, where m2, m3 and m4 are the sums of the 2nd, 3rd and 4th powers of deviations from the mean
+MOMENT_NAMES = ['count', 'min', 'max', 'mean', 'm2', 'm3', 'm4']
+
+def empty_moments() -> dict[str, float]:
+    """Returns the moments of a column without any values."""
+    return {'count': 0, 'min': np.nan, 'max': np.nan, 'mean': np.nan, 'm2': 0.0, 'm3': 0.0, 'm4': 0.0}
+
+def block_moments(values: np.ndarray) -> dict[str, float]:
+    """Computes the moments of a block of values, ignoring missing values (NaN)."""
+    values = values[~np.isnan(values)]
+
+    if values.size == 0:
+        return empty_moments()
+
+    mean = float(values.mean())
+
+    # deviations of a block are computed from its own mean, so large offsets do not swamp them
+    deviations = values - mean
+    squared_deviations = deviations * deviations
+
+    return {'count': int(values.size),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'mean': mean,
+            'm2': float(squared_deviations.sum()),
+            'm3': float((squared_deviations * deviations).sum()),
+            'm4': float((squared_deviations * squared_deviations).sum())}
+
+def merge_moments(left: dict[str, float], right: dict[str, float]) -> dict[str, float]:
+    """
+    Merges the moments of two disjoint sets of values, as if they were computed over both at once.
+
+    Uses the pairwise update of Chan, Golub & LeVeque (and Pébay for the 3rd and 4th moments), which stays numerically stable
+    for any split of the values.
+    """
+    if left['count'] == 0:
+        return dict(right)
+
+    if right['count'] == 0:
+        return dict(left)
+
+    left_count, right_count = left['count'], right['count']
+    count = left_count + right_count
+
+    delta = right['mean'] - left['mean']
+    delta_per_count = delta / count
+    cross_count = left_count * right_count
+
+    m2 = left['m2'] + right['m2'] + delta * delta_per_count * cross_count
+
+    m3 = (left['m3'] + right['m3']
+          + delta * delta_per_count ** 2 * cross_count * (left_count - right_count)
+          + 3 * delta_per_count * (left_count * right['m2'] - right_count * left['m2']))
+
+    m4 = (left['m4'] + right['m4']
+          + delta * delta_per_count ** 3 * cross_count * (left_count ** 2 - cross_count + right_count ** 2)
+          + 6 * delta_per_count ** 2 * (left_count ** 2 * right['m2'] + right_count ** 2 * left['m2'])
+          + 4 * delta_per_count * (left_count * right['m3'] - right_count * left['m3']))
+
+    return {'count': count,
+            'min': min(left['min'], right['min']),
+            'max': max(left['max'], right['max']),
+            'mean': left['mean'] + delta_per_count * right_count,
+            'm2': m2,
+            'm3': m3,
+            'm4': m4}
+
+def column_moments(series: pd.Series, block_rows: int = BLOCK_ROWS) -> dict[str, float]:
+    """Computes the moments of a column, one block of rows at a time."""
+    moments = empty_moments()
+
+    for start in range(0, len(series), block_rows):
+        values = series.iloc[start:start + block_rows].to_numpy(dtype='float64', na_value=np.nan)
+
+        moments = merge_moments(moments, block_moments(values))
+
+    return moments
+
+class Moments:
+    """
+    Initializing the Moments Computation.
+
+    Parameters
+    -----------
+    df: pd.DataFrame
+        A pandas DataFrame
+
+    columns: list, optional
+        A list of columns you wish to compute moments of, default is None.
+
+    Considerations
+    ---------------
+        1. Moments are computed once, on first use, and shared by every measure of the same instance.
+           mean() and range() only need a single reduction each, so they use pandas' vectorized reductions until the moments are computed.
+        2. Each column is read once, a block of rows at a time, and the moments of each block are merged into those of the column,
+           which stays numerically stable for large columns with a large mean.
+        3. Missing values are ignored, so every measure is based on the number of non-missing values of each column.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list = None):
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f'df must be a pandas DataFrame, got {type(df).__name__}')
+
+        if not isinstance(columns, (list, type(None))):
+            raise TypeError(f'columns must be a list of strings or type None, got {type(columns).__name__}')
+
+        self.df = df
+
+        if columns is None:
+            self.columns = self.df.columns.tolist()
+        else:
+            self.columns = [column for column in columns if column in self.df.columns]
+
+        if not all(pd.api.types.is_numeric_dtype(self.df[column]) for column in self.columns):
+            raise ValueError('All columns passed for computation must be numeric')
+
+        self._moments = None
+
+    @classmethod
+    def from_moments(cls, moments: pd.DataFrame) -> 'Moments':
+        """
+        Creates a Moments Computation from moments that were already computed (e.g: merged from chunks by PartialStatistics).
+
+        Parameters
+        -----------
+        moments: pd.DataFrame
+            A pandas DataFrame with one row per column and the columns count, min, max, mean, m2, m3 and m4.
+
+        Returns
+        --------
+        Moments
+            A Moments Computation, without a DataFrame, whose measures are derived from the moments passed.
+
+        Example
+        --------
+        >>> Moments.from_moments(partial_statistics.moments()).skewness()
+        """
+        if not isinstance(moments, pd.DataFrame):
+            raise TypeError(f'moments must be a pandas DataFrame, got {type(moments).__name__}')
+
+        missing_moments = [name for name in MOMENT_NAMES if name not in moments.columns]
+
+        if missing_moments:
+            raise ValueError(f'moments must have the columns {MOMENT_NAMES}, missing {missing_moments}')
+
+        instance = cls.__new__(cls)
+
+        instance.df = None
+        instance.columns = moments.index.tolist()
+        instance._moments = moments[MOMENT_NAMES]
+
+        return instance
+
+    def compute(self) -> pd.DataFrame:
+        """
+        Computes count, min, max, mean and the sums of 2nd, 3rd and 4th powers of deviations from the mean (m2, m3, m4) of each column.
+
+        Returns
+        --------
+        pd.DataFrame
+            A pandas DataFrame with one row per column.
+
+        Example
+        --------
+        >>> Moments(df).compute()
+        """
+        if self._moments is None:
+            moments = {column: column_moments(self.df[column]) for column in self.columns}
+
+            self._moments = pd.DataFrame.from_dict(moments, orient='index', columns=MOMENT_NAMES)
+
+        return self._moments
+
+    def _reduce(self, reduction: str) -> pd.Series:
+        """Returns a pandas reduction (e.g: 'mean', 'min' or 'max') of each column as floats, same as the moments, ignoring missing values."""
+        values = [getattr(self.df[column], reduction)() for column in self.columns]
+
+        return pd.Series([np.nan if pd.isna(value) else float(value) for value in values], index=self.columns, dtype='float64')
+
+    def _deviation_sums(self) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+        """Returns count, m2, m3 and m4, with m2 and m3 set to 0 when they are only floating point error (e.g: a constant column)."""
+        moments = self.compute()
+
+        count = moments['count']
+
+        # same tolerance as pandas' skew and kurt, so constant columns have a skewness of exactly 0
+        largest_value = pd.concat([moments['min'].abs(), moments['max'].abs()], axis=1).max(axis=1)
+        tolerance = np.finfo(np.float64).eps * largest_value
+
+        m2 = moments['m2'].where(moments['m2'].abs() >= (tolerance ** 2) * count, 0.0)
+        m3 = moments['m3'].where(moments['m3'].abs() >= (tolerance ** 3) * count, 0.0)
+
+        return count, m2, m3, moments['m4']
+
+    def mean(self) -> pd.Series:
+        """Computes the mean (Average) per column.
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).mean()
+        """
+        if self._moments is None:
+            # a single vectorized reduction is much faster than the block pass computing every moment
+            return self._reduce('mean')
+
+        return self._moments['mean'].rename(None)
+
+    def range(self) -> pd.Series:
+        """Computes the range (max - min) per column.
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).range()
+        """
+        if self._moments is None:
+            return self._reduce('max') - self._reduce('min')
+
+        return (self._moments['max'] - self._moments['min']).rename(None)
+
+    def variance(self, ddof: int = 1) -> pd.Series:
+        """
+        Computes the variance per column.
+
+        Parameters
+        -----------
+        ddof: int, optional
+            Delta degrees of freedom, 1 for the sample variance and 0 for the population variance, default is 1.
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).variance()
+
+        >>> Moments(df).variance(ddof=0)
+        """
+        if not isinstance(ddof, int) or isinstance(ddof, bool):
+            raise TypeError(f'ddof must be an integer, got {type(ddof).__name__}')
+
+        count, m2, _, _ = self._deviation_sums()
+
+        divisor = count - ddof
+
+        # columns with too few values have no variance (same as pandas)
+        return (m2 / divisor.where(divisor > 0)).rename(None)
+
+    def standard_deviation(self, ddof: int = 1) -> pd.Series:
+        """
+        Computes the standard deviation per column.
+
+        Parameters
+        -----------
+        ddof: int, optional
+            Delta degrees of freedom, 1 for the sample standard deviation and 0 for the population standard deviation, default is 1.
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).standard_deviation()
+        """
+        return np.sqrt(self.variance(ddof))
+
+    def skewness(self) -> pd.Series:
+        """
+        Computes the adjusted Fisher-Pearson skewness per column, same as pandas' skew().
+
+        Formula
+        --------
+            skewness = n * (n - 1)^(1/2) / (n - 2) * m3 / m2^(3/2)
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).skewness()
+        """
+        count, m2, m3, _ = self._deviation_sums()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+
+        skewness = skewness.mask(m2 == 0, 0.0)
+
+        return skewness.where(count >= 3).rename(None)
+
+    def raw_kurtosis(self) -> pd.Series:
+        """
+        Computes the raw kurtosis per column.
+
+        Formula
+        --------
+            raw_kurtosis = (average of (x - mean)^4) / (sample variance^2)
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).raw_kurtosis()
+        """
+        count, m2, _, m4 = self._deviation_sums()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            raw_kurtosis = (m4 / count) / (m2 / (count - 1)) ** 2
+
+        # constant columns and columns with a single value have no kurtosis
+        return raw_kurtosis.where((m2 > 0) & (count > 1)).rename(None)
+
+    def excess_kurtosis(self) -> pd.Series:
+        """
+        Computes the excess kurtosis (raw kurtosis - 3) per column.
+
+        Returns
+        --------
+        pd.Series
+            A pandas Series
+
+        Example
+        --------
+        >>> Moments(df).excess_kurtosis()
+        """
+        return self.raw_kurtosis() - 3
@@ -2,6 +2,7 @@
 
 import pandas as pd
 from .Computation import Computation
+from .Statistics import Statistics
 
 class Outliers(Computation):
     """
@@ -30,6 +31,9 @@ class Outliers(Computation):
         else:
             self.columns = [column for column in columns if column in self.df.columns]
 
+        # quantiles (and quantile sketches) are computed once and shared by every method of this instance
+        self.statistics = Statistics(self.df, self.columns)
+
     def zscore_outliers(self, zscore_threshold: int|float = 3)-> pd.DataFrame:
         """
         Computes outliers in a column using the Z-score method.
@@ -70,10 +74,15 @@ class Outliers(Computation):
 
         return zscore_outliers
 
-    def iqr_outliers(self)-> pd.DataFrame:
+    def iqr_outliers(self, approx: bool = False)-> pd.DataFrame:
         """
         Computes outliers in a column using the IQR (Inter-Quartile Range) method.
 
+        Parameters
+        ----------
+        approx: bool, optional
+            Whether to approximate the quartiles with a quantile sketch instead of sorting each column, default is False.
+
         Returns
         -------
         pd.DataFrame
@@ -88,15 +97,20 @@ class Outliers(Computation):
             1. This method keeps rows with values that are not outliers and they automatically convert to NaN.
             2. However, those rows remain preserved since this method is just meant purely for computation.
             3. Outliers are those below (q1 - 1.5 x IQR) or above (q3 + 1.5 x IQR).
+            4. With approx=True, the ranks of q1 and q3 are within config.quantile_error (1% by default) of the exact ones.
 
         Example
         -------
         >>> Outliers(df).iqr_outliers()
+
+        >>> Outliers(df).iqr_outliers(approx=True)
         """
         # calculating 25th and 75th percentiles
 
-        q1 = self.df.quantile(0.25)               # 1st quartile
-        q3 = self.df.quantile(0.75)               # 3rd quartile
+        quartiles = self.statistics.quantiles([0.25, 0.75], approx=approx)
+
+        q1 = quartiles.loc[0.25]                  # 1st quartile
+        q3 = quartiles.loc[0.75]                  # 3rd quartile
 
         # calculating IQR.
         IQR = q3 - q1
@@ -105,12 +119,15 @@ class Outliers(Computation):
         lower_boundary = q1 - (1.5 * IQR)
         upper_boundary = q3 + (1.5 * IQR)
 
+        # boundaries are only computed for the columns of this instance
+        df = self.df[self.columns]
+
         # outliers are values that are lower than lower boundary or higher than higher boundary.
-        iqr_outliers = self.df[(self.df < lower_boundary) | (self.df > upper_boundary)]
+        iqr_outliers = df[(df < lower_boundary) | (df > upper_boundary)]
 
         return iqr_outliers
 
-    def quantile_outliers(self, lower_quantile: int|float|None = None , upper_quantile: int|float|None = None) -> pd.DataFrame:
+    def quantile_outliers(self, lower_quantile: int|float|None = None , upper_quantile: int|float|None = None, approx: bool = False) -> pd.DataFrame:
         """
         Computes outliers in a column using the user-defined quantiles.
 
@@ -122,6 +139,9 @@ class Outliers(Computation):
         upper_quantile: int or float, optional
             percentile above which a value is flagged as an outlier, default is 0.99.
 
+        approx: bool, optional
+            Whether to approximate the quantiles with a quantile sketch instead of sorting each column, default is False.
+
         Returns
         -------
         pd.DataFrame
@@ -142,6 +162,8 @@ class Outliers(Computation):
         >>> Outliers(df).quantile_outliers()
 
         >>> Outliers(df).quantile_outliers(0.02, 0.98)
+
+        >>> Outliers(df).quantile_outliers(0.001, 0.999, approx=True)
         """
         if not isinstance(lower_quantile, (int, float, type(None))):
             raise TypeError(f'lower quantile must be an int or float, got {type(lower_quantile).__name__}')
@@ -154,14 +176,20 @@ class Outliers(Computation):
         if upper_quantile is None:
             upper_quantile = 0.99  # 99th percentile
 
+        # equal quantiles are only computed once, so each boundary is a single row
+        boundaries = self.statistics.quantiles(list(dict.fromkeys([float(lower_quantile), float(upper_quantile)])), approx=approx)
+
         # lower boundary would be any quantile passed in by the user.
-        lower_boundary = self.df.quantile(q=lower_quantile)
+        lower_boundary = boundaries.loc[float(lower_quantile)]
         
         # upper boundary would be any quantile passed in by the user.
-        upper_boundary = self.df.quantile(q=upper_quantile)
+        upper_boundary = boundaries.loc[float(upper_quantile)]
+
+        # boundaries are only computed for the columns of this instance
+        df = self.df[self.columns]
 
         # outliers are values that are lower than lower boundary or higher than higher boundary.
-        quantile_outliers = self.df[(self.df < lower_boundary) | (self.df > upper_boundary)]
+        quantile_outliers = df[(df < lower_boundary) | (df > upper_boundary)]
 
         return quantile_outliers
 
@@ -0,0 +1,326 @@
+"""Accumulates statistics of Numerical columns over chunks of a dataset, which can be merged across workers and serialized."""
+
+from .Moments import Moments, BLOCK_ROWS, MOMENT_NAMES, block_moments, empty_moments, merge_moments
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import polars.selectors as cs
+
+class PartialStatistics:
+    """
+    Initializing Partial Statistics.
+
+    Parameters
+    -----------
+    columns: list, optional
+        A list of columns you wish to accumulate statistics of, default is None (every numerical column of the first batch).
+
+    histogram_edges: dict, optional
+        A dictionary of column names and bin edges (increasing numbers) of the histograms you wish to accumulate, default is None (no histograms).
+
+        Edges are fixed up front, so histograms of different chunks can be added together exactly.
+
+    Usage Recommendation
+    ---------------------
+        1. Use this class when a dataset is too large for one DataFrame, e.g: with DataLoader(...).iter_batches().
+        2. Use merge() to combine statistics computed by separate workers or processes, and to_dict()/from_dict() to send them between processes.
+
+    Considerations
+    ---------------
+        1. Statistics are kept as count, min, max, mean and sums of powers of deviations from the mean (m2, m3, m4),
+           which are merged with the Chan/Pébay pairwise update, so merged results match a single pass over the whole data
+           without the cancellation errors of raw power sums.
+        2. Missing values are ignored. Values outside the histogram edges are counted as below or above the histogram.
+
+    Example
+    --------
+    >>> partial = PartialStatistics(histogram_edges={'price': np.linspace(0, 1_000, 51)})
+
+        for batch in DataLoader('data/*.parquet').iter_batches(return_type='polars'):
+            partial.update(batch)
+
+        partial.to_moments().skewness()
+        partial.histogram()
+    """
+
+    def __init__(self, columns: list = None, histogram_edges: dict = None):
+
+        if not isinstance(columns, (list, type(None))):
+            raise TypeError(f'columns must be a list of strings or type None, got {type(columns).__name__}')
+
+        if not isinstance(histogram_edges, (dict, type(None))):
+            raise TypeError(f'histogram_edges must be a dictionary of column names and bin edges, got {type(histogram_edges).__name__}')
+
+        self.columns = list(columns) if columns is not None else None
+
+        self._moments = {}
+        self._histograms = {}
+
+        for column, edges in (histogram_edges or {}).items():
+
+            edges = np.asarray(edges, dtype='float64')
+
+            if edges.ndim != 1 or len(edges) < 2 or not np.all(np.diff(edges) > 0):
+                raise ValueError(f'histogram edges of column {column} must be at least 2 increasing numbers')
+
+            self._histograms[column] = {'edges': edges, 'counts': np.zeros(len(edges) - 1, dtype='int64'), 'below': 0, 'above': 0}
+
+    def update(self, batch: pd.DataFrame|pl.DataFrame) -> 'PartialStatistics':
+        """
+        Adds the values of a batch (a chunk of rows) to the statistics.
+
+        Parameters
+        -----------
+        batch: pd.DataFrame or pl.DataFrame
+            A pandas or polars DataFrame
+
+        Returns
+        --------
+        PartialStatistics
+            The same Partial Statistics, so calls can be chained.
+
+        Example
+        --------
+        >>> PartialStatistics().update(first_chunk).update(second_chunk)
+        """
+        if not isinstance(batch, (pd.DataFrame, pl.DataFrame)):
+            raise TypeError(f'batch must be a pandas or polars DataFrame, got {type(batch).__name__}')
+
+        if self.columns is None:
+            if isinstance(batch, pl.DataFrame):
+                self.columns = batch.select(cs.numeric()).columns
+            else:
+                self.columns = batch.select_dtypes(include='number').columns.tolist()
+
+        missing_columns = [column for column in self.columns if column not in batch.columns]
+
+        if missing_columns:
+            raise ValueError(f'Columns not found in batch: {missing_columns}')
+
+        for column in self.columns:
+
+            values = self._float_values(batch, column)
+
+            moments = self._moments.get(column, empty_moments())
+
+            for start in range(0, len(values), BLOCK_ROWS):
+                moments = merge_moments(moments, block_moments(values[start:start + BLOCK_ROWS]))
+
+            self._moments[column] = moments
+
+            if column in self._histograms:
+                self._add_to_histogram(self._histograms[column], values[~np.isnan(values)])
+
+        return self
+
+    @staticmethod
+    def _float_values(batch: pd.DataFrame|pl.DataFrame, column: str) -> np.ndarray:
+        """Returns the values of a column as float64, with missing values as NaN."""
+        if isinstance(batch, pl.DataFrame):
+            series = batch[column]
+
+            if not series.dtype.is_numeric() and series.dtype != pl.Boolean:
+                raise ValueError('All columns passed for computation must be numeric')
+
+            return series.cast(pl.Float64).fill_null(np.nan).to_numpy()
+
+        if not pd.api.types.is_numeric_dtype(batch[column]):
+            raise ValueError('All columns passed for computation must be numeric')
+
+        return batch[column].to_numpy(dtype='float64', na_value=np.nan)
+
+    @staticmethod
+    def _add_to_histogram(histogram: dict, values: np.ndarray) -> None:
+        """Counts values into the bins of a histogram, and the values outside of its edges."""
+        edges = histogram['edges']
+
+        counts, _ = np.histogram(values, bins=edges)
+
+        histogram['counts'] += counts
+        histogram['below'] += int((values < edges[0]).sum())
+        histogram['above'] += int((values > edges[-1]).sum())
+
+    def merge(self, other: 'PartialStatistics') -> 'PartialStatistics':
+        """
+        Adds the statistics of another Partial Statistics (e.g: computed by another worker on other rows).
+
+        Parameters
+        -----------
+        other: PartialStatistics
+            Partial Statistics with the same histogram edges.
+
+        Returns
+        --------
+        PartialStatistics
+            The same Partial Statistics, so calls can be chained.
+
+        Example
+        --------
+        >>> functools.reduce(PartialStatistics.merge, worker_results, PartialStatistics())
+        """
+        if not isinstance(other, PartialStatistics):
+            raise TypeError(f'other must be PartialStatistics, got {type(other).__name__}')
+
+        for column, histogram in other._histograms.items():
+
+            if column in self._histograms and not np.array_equal(self._histograms[column]['edges'], histogram['edges']):
+                raise ValueError(f'Histograms of column {column} have different edges and cannot be merged')
+
+        for column, moments in other._moments.items():
+            self._moments[column] = merge_moments(self._moments.get(column, empty_moments()), moments)
+
+        for column, histogram in other._histograms.items():
+
+            if column not in self._histograms:
+                self._histograms[column] = {'edges': histogram['edges'].copy(), 'counts': np.zeros_like(histogram['counts']), 'below': 0, 'above': 0}
+
+            self._histograms[column]['counts'] += histogram['counts']
+            self._histograms[column]['below'] += histogram['below']
+            self._histograms[column]['above'] += histogram['above']
+
+        if self.columns is None:
+            # copying the list, so extending it later does not change the columns of other
+            self.columns = list(other.columns) if other.columns is not None else None
+        elif other.columns is not None:
+            self.columns += [column for column in other.columns if column not in self.columns]
+
+        return self
+
+    def moments(self) -> pd.DataFrame:
+        """
+        Returns count, min, max, mean, m2, m3 and m4 of each column.
+
+        Returns
+        --------
+        pd.DataFrame
+            A pandas DataFrame with one row per column.
+
+        Example
+        --------
+        >>> partial.moments()
+        """
+        columns = self.columns or []
+
+        moments = {column: self._moments.get(column, empty_moments()) for column in columns}
+
+        return pd.DataFrame.from_dict(moments, orient='index', columns=MOMENT_NAMES)
+
+    def to_moments(self) -> Moments:
+        """
+        Returns a Moments Computation over every value added so far, for mean, variance, standard deviation, skewness, kurtosis and range.
+
+        Returns
+        --------
+        Moments
+            A Moments Computation
+
+        Example
+        --------
+        >>> partial.to_moments().standard_deviation()
+        """
+        return Moments.from_moments(self.moments())
+
+    def histogram(self, density: bool = False, df_axis: int = 1) -> pd.DataFrame:
+        """
+        Returns the accumulated histograms, in the same layout as Distribution.compute_histogram().
+
+        Parameters
+        -----------
+        density :bool, optional
+            Whether to return the probability density of values inside the edges instead of counts, by default False.
+
+        df_axis: int, optional
+            Whether you wish to see a concatenated dataframe column wise (1) or row wise (0), default is 1.
+
+        Returns
+        --------
+        pd.DataFrame
+            A pandas DataFrame of counts, bin_edges and bin_centers.
+
+        Example
+        --------
+        >>> partial.histogram(density=True)
+        """
+        if not isinstance(density, bool):
+            raise TypeError(f'density must be a bool, got {type(density).__name__}')
+
+        if df_axis not in [0, 1]:
+            raise ValueError(f"df_axis must either be 0 (for combining df row-wise) or 1 (for combining df column-wise), got {df_axis}")
+
+        counts_dict = {}
+        bin_edges_dict = {}
+        bin_centers_dict = {}
+
+        for column, histogram in self._histograms.items():
+
+            edges = histogram['edges']
+            counts = histogram['counts']
+
+            if density:
+                # same as numpy's density, over the values inside the edges
+                counts = counts / (counts.sum() * np.diff(edges)) if counts.sum() else np.zeros(len(counts))
+
+            # columns may have a different number of bins, so shorter ones are padded with NaN
+            counts_dict[column] = pd.Series(counts)
+            bin_edges_dict[column] = pd.Series(edges)
+            bin_centers_dict[column] = pd.Series(0.5 * (edges[1:] + edges[:-1]))
+
+        return pd.concat({"counts": pd.DataFrame(counts_dict), "bin_edges": pd.DataFrame(bin_edges_dict), "bin_centers": pd.DataFrame(bin_centers_dict)}, axis=df_axis)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the statistics as a dictionary of plain Python values, which can be saved as JSON or sent to another process.
+
+        Returns
+        --------
+        dict
+            A dictionary which can be passed to PartialStatistics.from_dict().
+
+        Example
+        --------
+        >>> json.dumps(partial.to_dict())
+        """
+        return {
+            'columns': self.columns,
+            'moments': {column: dict(moments) for column, moments in self._moments.items()},
+            'histograms': {column: {'edges': histogram['edges'].tolist(),
+                                    'counts': histogram['counts'].tolist(),
+                                    'below': histogram['below'],
+                                    'above': histogram['above']}
+                           for column, histogram in self._histograms.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PartialStatistics':
+        """
+        Restores Partial Statistics from PartialStatistics.to_dict().
+
+        Parameters
+        -----------
+        data: dict
+            A dictionary returned by to_dict().
+
+        Returns
+        --------
+        PartialStatistics
+            A Partial Statistics
+
+        Example
+        --------
+        >>> PartialStatistics.from_dict(json.loads(saved_statistics))
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f'data must be a dictionary, got {type(data).__name__}')
+
+        histograms = data.get('histograms', {})
+
+        partial = cls(columns=data.get('columns'), histogram_edges={column: histogram['edges'] for column, histogram in histograms.items()})
+
+        partial._moments = {column: {name: moments[name] for name in MOMENT_NAMES} for column, moments in data.get('moments', {}).items()}
+
+        for column, histogram in histograms.items():
+            partial._histograms[column]['counts'] = np.asarray(histogram['counts'], dtype='int64')
+            partial._histograms[column]['below'] = int(histogram['below'])
+            partial._histograms[column]['above'] = int(histogram['above'])
+
+        return partial
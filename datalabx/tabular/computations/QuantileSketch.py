@@ -0,0 +1,344 @@
+"""Approximates quantiles of Numerical columns with a mergeable KLL sketch, without sorting or keeping every value in memory."""
+
+from .Moments import BLOCK_ROWS
+from ..utils.Config import config
+
+import math
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# Smallest number of values kept at any level of the sketch
+MIN_LEVEL_CAPACITY = 8
+
+# Ratio between the capacities of consecutive levels
+LEVEL_CAPACITY_RATIO = 2 / 3
+
+def k_for_error(error: float) -> int:
+    """Returns the size (k) of a KLL sketch whose rank error is about error, from the empirical bound rank_error ~ 2.296 / k^0.9723."""
+    return max(math.ceil((2.296 / error) ** (1 / 0.9723)), MIN_LEVEL_CAPACITY)
+
+def _weighted_quantiles(items: np.ndarray, weights: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+    """Returns the items at the given quantiles of the cumulative weights."""
+    order = np.argsort(items, kind='stable')
+
+    items = items[order]
+    cumulative_weights = np.cumsum(weights[order])
+
+    positions = np.searchsorted(cumulative_weights, quantiles * cumulative_weights[-1], side='left')
+
+    return items[np.clip(positions, 0, len(items) - 1)]
+
+class QuantileSketch:
+    """
+    Initializing a Quantile Sketch.
+
+    Parameters
+    -----------
+    error: float, optional
+        Rank error you are willing to accept, as a fraction of the number of values, default is None (config.quantile_error, 0.01).
+
+        E.g: with error=0.01 the median of 1 billion values is between the 49th and 51st percentiles, with high probability.
+
+    seed: int, optional
+        Seed of the random choices made while compacting the sketch, default is None.
+
+    Usage Recommendation
+    ---------------------
+        1. Use this class for quantiles of columns too large to sort in memory, or spread over chunks, files or processes.
+        2. Call update() with each chunk of a column, merge() with sketches of other chunks and to_dict()/from_dict() to send sketches between processes.
+
+    Considerations
+    ---------------
+        1. This is a KLL sketch (Karnin, Lang & Liberty): values are kept in levels, and when a level is full,
+           it is sorted and every other value is promoted to the next level with twice the weight.
+        2. Memory stays around 3 * k values (k ~ 270 for error=0.01), whatever the number of values.
+        3. Quantiles are values that were actually seen (no interpolation). Minimum and maximum are exact.
+
+    Example
+    --------
+    >>> sketch = QuantileSketch(error=0.005)
+
+        for batch in DataLoader('data/*.parquet').iter_batches(return_type='polars'):
+            sketch.update(batch['price'])
+
+        sketch.quantile(0.5)
+    """
+
+    def __init__(self, error: float = None, seed: int = None):
+
+        if error is None:
+            error = config.quantile_error
+
+        if not isinstance(error, float):
+            raise TypeError(f'error must be a float, got {type(error).__name__}')
+
+        if not 0 < error < 1:
+            raise ValueError(f'error must be between 0 and 1, got {error}')
+
+        if not isinstance(seed, (int, type(None))):
+            raise TypeError(f'seed must be an integer or type None, got {type(seed).__name__}')
+
+        self.error = error
+        self.k = k_for_error(error)
+
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+
+        self._levels = [np.empty(0, dtype='float64')]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        """Returns how many values a level can keep before being compacted, where the top level keeps k values."""
+        depth = len(self._levels) - 1 - level
+
+        return max(math.ceil(self.k * LEVEL_CAPACITY_RATIO ** depth), MIN_LEVEL_CAPACITY)
+
+    def _compress(self) -> None:
+        """Compacts full levels until the sketch fits its capacity."""
+        while sum(len(level) for level in self._levels) > sum(self._capacity(level) for level in range(len(self._levels))):
+
+            level = next(level for level in range(len(self._levels)) if len(self._levels[level]) >= self._capacity(level))
+
+            items = np.sort(self._levels[level])
+
+            # an odd value out stays at its level
+            kept = items[len(items) - len(items) % 2:]
+            items = items[:len(items) - len(items) % 2]
+
+            # promoting either the even or the odd values keeps the expected rank of every value unchanged
+            promoted = items[self._rng.integers(2)::2]
+
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0, dtype='float64'))
+
+            self._levels[level] = kept
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+
+    def update(self, values: pd.Series|pl.Series|np.ndarray|list) -> 'QuantileSketch':
+        """
+        Adds values (e.g: a chunk of a column) to the sketch, ignoring missing values.
+
+        Parameters
+        -----------
+        values: pd.Series, pl.Series, np.ndarray or list
+            Numerical values
+
+        Returns
+        --------
+        QuantileSketch
+            The same Quantile Sketch, so calls can be chained.
+
+        Example
+        --------
+        >>> QuantileSketch().update(df['price'])
+        """
+        if isinstance(values, pl.Series):
+            values = values.cast(pl.Float64).fill_null(np.nan).to_numpy()
+
+        elif isinstance(values, pd.Series):
+            values = values.to_numpy(dtype='float64', na_value=np.nan)
+
+        elif isinstance(values, (np.ndarray, list)):
+            values = np.asarray(values, dtype='float64')
+
+        else:
+            raise TypeError(f'values must be a pandas Series, polars Series, numpy array or list, got {type(values).__name__}')
+
+        values = values[~np.isnan(values)]
+
+        if values.size == 0:
+            return self
+
+        self.count += int(values.size)
+        self.min = float(np.fmin(self.min, values.min()))
+        self.max = float(np.fmax(self.max, values.max()))
+
+        # adding a block at a time, so only a block is ever sorted
+        for start in range(0, values.size, BLOCK_ROWS):
+            self._levels[0] = np.concatenate([self._levels[0], values[start:start + BLOCK_ROWS]])
+            self._compress()
+
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Adds the values of another sketch with the same error (e.g: computed by another worker on other rows).
+
+        Parameters
+        -----------
+        other: QuantileSketch
+            A Quantile Sketch
+
+        Returns
+        --------
+        QuantileSketch
+            The same Quantile Sketch, so calls can be chained.
+
+        Example
+        --------
+        >>> functools.reduce(QuantileSketch.merge, worker_sketches, QuantileSketch())
+        """
+        if not isinstance(other, QuantileSketch):
+            raise TypeError(f'other must be a QuantileSketch, got {type(other).__name__}')
+
+        if other.k != self.k:
+            raise ValueError(f'Only sketches with the same error can be merged, got {self.error} and {other.error}')
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype='float64'))
+
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+
+        self.count += other.count
+        self.min = float(np.fmin(self.min, other.min))
+        self.max = float(np.fmax(self.max, other.max))
+
+        self._compress()
+
+        return self
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the values kept by the sketch, and how many values each of them stands for."""
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level_items), 2 ** level, dtype='float64') for level, level_items in enumerate(self._levels)])
+
+        return items, weights
+
+    def quantiles(self, quantiles: list|np.ndarray) -> np.ndarray:
+        """
+        Approximates several quantiles at once.
+
+        Parameters
+        -----------
+        quantiles: list or np.ndarray
+            Quantiles between 0 and 1.
+
+        Returns
+        --------
+        np.ndarray
+            A numpy array, with NaN if no values were added.
+
+        Example
+        --------
+        >>> sketch.quantiles([0.25, 0.5, 0.75])
+        """
+        quantiles = np.asarray(quantiles, dtype='float64')
+
+        if np.any((quantiles < 0) | (quantiles > 1)):
+            raise ValueError(f'quantiles must be between 0 and 1, got {quantiles.tolist()}')
+
+        if self.count == 0:
+            return np.full(quantiles.shape, np.nan)
+
+        items, weights = self._weighted_items()
+
+        result = _weighted_quantiles(items, weights, quantiles)
+
+        # the extremes are kept exactly
+        return np.where(quantiles == 0, self.min, np.where(quantiles == 1, self.max, result))
+
+    def quantile(self, quantile: int|float) -> float:
+        """
+        Approximates a quantile.
+
+        Parameters
+        -----------
+        quantile: int or float
+            A quantile between 0 and 1.
+
+        Returns
+        --------
+        float
+
+        Example
+        --------
+        >>> sketch.quantile(0.99)
+        """
+        if not isinstance(quantile, (int, float)):
+            raise TypeError(f'quantile must be float or int, got {type(quantile).__name__}')
+
+        return float(self.quantiles([quantile])[0])
+
+    def median_absolute_deviation(self) -> float:
+        """
+        Approximates the MAD (Median Absolute Deviation) from the sketch alone, without a second pass over the values.
+
+        Returns
+        --------
+        float
+
+        Considerations
+        ---------------
+            The absolute deviations of the values kept by the sketch (with their weights) stand for those of every value,
+            so the rank error of the MAD is about twice the error of the sketch.
+
+        Example
+        --------
+        >>> sketch.median_absolute_deviation()
+        """
+        if self.count == 0:
+            return np.nan
+
+        median = self.quantile(0.5)
+
+        items, weights = self._weighted_items()
+
+        return float(_weighted_quantiles(np.abs(items - median), weights, np.array([0.5]))[0])
+
+    def to_dict(self) -> dict:
+        """
+        Returns the sketch as a dictionary of plain Python values, which can be saved as JSON or sent to another process.
+
+        Returns
+        --------
+        dict
+            A dictionary which can be passed to QuantileSketch.from_dict().
+
+        Example
+        --------
+        >>> json.dumps(sketch.to_dict())
+        """
+        return {'error': self.error, 'count': self.count, 'min': self.min, 'max': self.max,
+                'levels': [level.tolist() for level in self._levels]}
+
+    @classmethod
+    def from_dict(cls, data: dict, seed: int = None) -> 'QuantileSketch':
+        """
+        Restores a sketch from QuantileSketch.to_dict().
+
+        Parameters
+        -----------
+        data: dict
+            A dictionary returned by to_dict().
+
+        seed: int, optional
+            Seed of the random choices made while compacting the sketch, default is None.
+
+        Returns
+        --------
+        QuantileSketch
+            A Quantile Sketch
+
+        Example
+        --------
+        >>> QuantileSketch.from_dict(json.loads(saved_sketch))
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f'data must be a dictionary, got {type(data).__name__}')
+
+        sketch = cls(error=data['error'], seed=seed)
+
+        sketch.count = int(data['count'])
+        sketch.min = float(data['min'])
+        sketch.max = float(data['max'])
+        sketch._levels = [np.asarray(level, dtype='float64') for level in data['levels']] or [np.empty(0, dtype='float64')]
+
+        return sketch
+
+def sketch_columns(df: pd.DataFrame, columns: list, error: float = None) -> dict[str, QuantileSketch]:
+    """Builds a Quantile Sketch for each column of a DataFrame."""
+    return {column: QuantileSketch(error).update(df[column]) for column in columns}
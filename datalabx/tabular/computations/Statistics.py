@@ -1,6 +1,8 @@
 """Computes descriptive statistics for one or more Numerical columns of the DataFrame"""
 
 from .Computation import Computation
+from .Moments import Moments
+from .QuantileSketch import QuantileSketch, sketch_columns
 
 import pandas as pd
 import numpy as np
@@ -30,6 +32,14 @@ class Statistics(Computation):
             self.columns = self.df.columns.tolist()
         else:
             self.columns = [column for column in columns if column in self.df.columns]
+
+        # moments (mean, variance, range) are computed once and shared by every measure of this instance
+        self.moments = Moments(self.df, self.columns)
+
+        self._sketches = None
+
+        # quantiles already computed, keyed by (approx, quantile), so iqr(), median() and outlier fences reuse them
+        self._quantiles = {}
     
     def max(self)-> pd.Series:
         """Computes maximum value per column.
@@ -72,9 +82,7 @@ class Statistics(Computation):
         --------
         >>>  Statistics(df).range()
         """
-        range = Statistics(self.df).max() - Statistics(self.df).min()
-
-        return range
+        return self.moments.range()
 
     def mean(self) -> pd.Series:
         """
@@ -89,12 +97,39 @@ class Statistics(Computation):
         --------
         >>>  Statistics(df).mean()   
         """
-        return self.df[self.columns].mean()
+        return self.moments.mean()
     
-    def median(self)-> pd.Series:
+    def quantile_sketches(self) -> dict[str, QuantileSketch]:
+        """
+        Builds a Quantile Sketch for each column, once, which is shared by every approx=True measure of this instance.
+
+        Returns
+        --------
+        dict[str, QuantileSketch]
+            A dictionary of column names and Quantile Sketches, with the error of config.quantile_error.
+
+        Usage Recommendation
+        ---------------------
+            Use this function to merge the sketches of this DataFrame with sketches of other chunks of the same dataset.
+
+        Example
+        --------
+        >>> Statistics(df).quantile_sketches()['price'].merge(other_sketch)
+        """
+        if self._sketches is None:
+            self._sketches = sketch_columns(self.df, self.columns)
+
+        return self._sketches
+
+    def median(self, approx: bool = False)-> pd.Series:
         """
         Computes the median (middle value).
 
+        Parameters
+        -----------
+        approx: bool, optional
+            Whether to approximate the median with a quantile sketch instead of sorting each column, default is False.
+
         Returns
         --------
         pd.Series
@@ -103,8 +138,13 @@ class Statistics(Computation):
         Example
         --------
         >>>  Statistics(df).median()   
+
+        >>>  Statistics(df).median(approx=True)
         """
-        return self.df[self.columns].median()
+        if not isinstance(approx, bool):
+            raise TypeError(f'approx must be either True or False, got {type(approx).__name__}')
+
+        return self.quantiles(0.5, approx=approx).rename(None)
 
     def standard_deviation(self)-> pd.Series:
         """
@@ -119,30 +159,98 @@ class Statistics(Computation):
         --------
         >>>  Statistics(df).standard_deviation()  
         """
-        return self.df[self.columns].std()
+        return self.moments.standard_deviation()
 
-    def quantiles(self, quantile:int|float, **kwargs)-> pd.Series:
+    def quantiles(self, quantile:int|float|list, approx: bool = False, **kwargs)-> pd.Series|pd.DataFrame:
         """
         Computes the quantiles.
 
+        Parameters
+        -----------
+        quantile: int, float or list
+            A quantile between 0 and 1, or a list of quantiles.
+
+        approx: bool, optional
+            Whether to approximate the quantiles with a quantile sketch instead of sorting each column, default is False.
+
         Returns
         --------
-        pd.Series
-            A pandas Series
+        pd.Series or pd.DataFrame
+            A pandas Series for a single quantile, or a pandas DataFrame with one row per quantile for a list of quantiles.
+
+        Usage Recommendation
+        ---------------------
+            1. Pass every quantile you need in one list, so each column is only partitioned once.
+            2. Use approx=True for very large columns, where the rank of the result is within config.quantile_error (1% by default) of the exact one.
+
+        Considerations
+        ---------------
+            1. Quantiles are cached on the instance, so median(), iqr() and median_absolute_deviation() reuse those already computed.
+            2. Keyword arguments (e.g: interpolation='nearest') are passed to pandas' DataFrame.quantile() and are not cached.
 
         Example
         --------
         >>>  Statistics(df).quantiles(0.75)  
+
+        >>>  Statistics(df).quantiles([0.01, 0.25, 0.5, 0.75, 0.99])
+
+        >>>  Statistics(df).quantiles(0.75, approx=True)
         """
-        if not isinstance(quantile, (float, int)):
-            raise TypeError(f'quantile must be float or int, got {type(quantile).__name__}')
+        if not isinstance(quantile, (float, int, list)):
+            raise TypeError(f'quantile must be float, int or a list of them, got {type(quantile).__name__}')
+
+        quantile_list = quantile if isinstance(quantile, list) else [quantile]
+
+        if not all(isinstance(value, (float, int)) for value in quantile_list):
+            raise TypeError('quantile must be float, int or a list of them')
+
+        if not all(0 <= value <= 1 for value in quantile_list):
+            raise ValueError(f'quantiles must be between 0 and 1, got {quantile}')
+
+        if not isinstance(approx, bool):
+            raise TypeError(f'approx must be either True or False, got {type(approx).__name__}')
+
+        if kwargs and not approx:
+            return self.df[self.columns].quantile(q=quantile, **kwargs)
+
+        missing_quantiles = [value for value in dict.fromkeys(map(float, quantile_list)) if (approx, value) not in self._quantiles]
+
+        if missing_quantiles:
+            self._compute_quantiles(missing_quantiles, approx)
+
+        if isinstance(quantile, list):
+            return pd.DataFrame([self._quantiles[(approx, float(value))] for value in quantile_list], index=pd.Index([float(value) for value in quantile_list]))
+
+        return self._quantiles[(approx, float(quantile))].rename(quantile)
+
+    def _compute_quantiles(self, quantiles: list[float], approx: bool) -> None:
+        """Computes several quantiles of each column with one partition (or one sketch) per column, and caches them."""
+        values_by_column = {}
 
-        return self.df.quantile(q=quantile, **kwargs)
+        for column in self.columns:
+
+            if approx:
+                values_by_column[column] = self.quantile_sketches()[column].quantiles(quantiles)
+                continue
+
+            values = self.df[column].to_numpy(dtype='float64', na_value=np.nan)
+            values = values[~np.isnan(values)]
+
+            # numpy partitions the column once around every position needed by the quantiles (same linear interpolation as pandas)
+            values_by_column[column] = np.quantile(values, quantiles) if values.size else np.full(len(quantiles), np.nan)
+
+        for position, quantile in enumerate(quantiles):
+            self._quantiles[(approx, quantile)] = pd.Series({column: values[position] for column, values in values_by_column.items()}, index=self.columns, dtype='float64')
             
-    def iqr(self)-> pd.Series:
+    def iqr(self, approx: bool = False)-> pd.Series:
         """
         Computes the IQR (Inter-Quartile Range).
 
+        Parameters
+        -----------
+        approx: bool, optional
+            Whether to approximate the quartiles with a quantile sketch instead of sorting each column, default is False.
+
         Returns
         --------
         pd.Series
@@ -151,11 +259,12 @@ class Statistics(Computation):
         Example
         --------
         >>> Statistics(df).iqr()
+
+        >>> Statistics(df).iqr(approx=True)
         """
-        Q1 = Statistics(self.df).quantiles(0.25)
-        Q3 = Statistics(self.df).quantiles(0.75)
+        quartiles = self.quantiles([0.25, 0.75], approx=approx)
 
-        IQR = Q3 - Q1 
+        IQR = quartiles.loc[0.75] - quartiles.loc[0.25]
 
         return IQR
 
@@ -180,20 +289,23 @@ class Statistics(Computation):
         if method not in ['sample', 'population']:
             raise ValueError(f"method must either be 'sample' or 'population', got {method}")
 
-        n = len(self.df)
-                
         if method == 'sample':
 
-            return ((self.df - self.df.mean())**2).sum()/(n-1)
+            return self.moments.variance(ddof=1)
 
         elif method == 'population':
 
-            return ((self.df - self.df.mean())**2).sum()/(n)
+            return self.moments.variance(ddof=0)
 
-    def median_absolute_deviation(self) -> pd.Series :
+    def median_absolute_deviation(self, approx: bool = False) -> pd.Series :
         """
         Computes the MAD (Median Absolute Deviation).
 
+        Parameters
+        -----------
+        approx: bool, optional
+            Whether to approximate the MAD with a quantile sketch, in a single pass over each column, default is False.
+
         Returns
         --------
         pd.Series
@@ -202,16 +314,29 @@ class Statistics(Computation):
         Example
         --------
         >>> Statistics(df).median_absolute_deviation()
+
+        >>> Statistics(df).median_absolute_deviation(approx=True)
         """
-        median = self.df.median()
+        if not isinstance(approx, bool):
+            raise TypeError(f'approx must be either True or False, got {type(approx).__name__}')
+
+        if approx:
+            return pd.Series({column: sketch.median_absolute_deviation() for column, sketch in self.quantile_sketches().items()}, dtype='float64')
+
+        median = self.median()
 
         # subtracting median value from the values
-        return (self.df.sub(median)).abs().median() 
+        return (self.df[self.columns].sub(median)).abs().median() 
 
-    def scaled_median_absolute_deviation(self)-> pd.Series:
+    def scaled_median_absolute_deviation(self, approx: bool = False)-> pd.Series:
         """
         Computes the scaled MAD (Median Absolute Deviation), which is ~1.4826 * median_absolute_deviation().
 
+        Parameters
+        -----------
+        approx: bool, optional
+            Whether to approximate the MAD with a quantile sketch, in a single pass over each column, default is False.
+
         Returns
         --------
         pd.Series
@@ -221,4 +346,4 @@ class Statistics(Computation):
         --------
         >>> Statistics(df).scaled_median_absolute_deviation()
         """
-        return 1.4826 * Statistics(self.df).median_absolute_deviation()
\ No newline at end of file
+        return 1.4826 * self.median_absolute_deviation(approx=approx)
\ No newline at end of file
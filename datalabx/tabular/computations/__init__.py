@@ -2,5 +2,8 @@ from .Distribution import Distribution
 from .Statistics import Statistics
 from .Outliers import Outliers
 from .Correlation import Correlation
+from .Moments import Moments
+from .PartialStatistics import PartialStatistics
+from .QuantileSketch import QuantileSketch
 
-__all__ = ['Statistics','Distribution', 'Outliers', 'Correlation']
\ No newline at end of file
+__all__ = ['Statistics','Distribution', 'Outliers', 'Correlation', 'Moments', 'PartialStatistics', 'QuantileSketch']
\ No newline at end of file
@@ -3,6 +3,8 @@
 import pandas as pd
 import polars as pl
 
+from ..utils.BackendConverter import BackendConverter
+
 class DataCleaner:
     """
     Initializing Base Cleaner
@@ -49,6 +51,14 @@ class DataCleaner:
         if missing_columns:
             raise TypeError(f'Columns not found in dataframe: {missing_columns}')
     
+    def _to_polars(self) -> pl.DataFrame:
+        """
+        This is an internal function that converts the columns to clean to a polars DataFrame.
+        """
+        # converting the whole DataFrame before selecting columns, so the conversion is cached for the next method (or class) using it,
+        # whereas self.df[self.columns] would be a new DataFrame on every call
+        return BackendConverter(self.df).pandas_to_polars().select(self.columns)
+
     def track_not_cleaned(self, *, method:str, col:str, before: pd.Series|pl.Series, mask:pd.Series|pl.Series, after:pd.Series|pl.Series)-> set:
         """
         This is an internal function used for tracking values that remain dirty even after cleaning.
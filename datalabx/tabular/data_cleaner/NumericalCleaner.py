@@ -5,6 +5,7 @@ import polars as pl
 
 from .BaseCleaner import DataCleaner # base data cleaner class 
 from ..utils.BackendConverter import BackendConverter
+from ..utils.Config import config
 from ..utils.Logger import datalabx_logger # logger for logging
 
 logger = datalabx_logger(name = __name__.split('.')[-1])
@@ -25,13 +26,13 @@ class NumericalCleaner(DataCleaner):
             Whether you wish to apply changes in place, by default False.
         
         array_type: str, optional
-            The backend you wish to work with in pandas: 'numpy' or 'pyarrow', by default 'auto'.
+            The backend you wish to work with in pandas: 'numpy' or 'pyarrow', by default None (config.array_type, which is 'auto' unless changed).
 
         conversion_threshold: int, optional
-            The number of rows upon which backend automatically switches to 'pyarrow' in pandas, by default 100000.
+            The number of rows upon which backend automatically switches to 'pyarrow' in pandas, by default None (config.conversion_threshold, which is 100000 unless changed).
     """
     
-    def __init__(self, df: pd.DataFrame, columns: list = None, inplace:bool=False, array_type:str='auto', conversion_threshold:int=None):
+    def __init__(self, df: pd.DataFrame, columns: list = None, inplace:bool=False, array_type:str|None=None, conversion_threshold:int|None=None):
 
         #Initializing the base data cleaner
         super().__init__(df, columns, inplace)
@@ -44,10 +45,11 @@ class NumericalCleaner(DataCleaner):
             self.columns = [column for column in columns if column in self.df.columns]
         
         self.inplace = inplace
-        self.array_type = array_type
+        # options that are not passed fall back to the global config
+        self.array_type = array_type if array_type is not None else config.array_type
 
         if conversion_threshold is None:
-            self.conversion_threshold = 100_000
+            self.conversion_threshold = config.conversion_threshold
         else:
             self.conversion_threshold = conversion_threshold
 
@@ -86,7 +88,7 @@ class NumericalCleaner(DataCleaner):
         if not isinstance(decimals, int):
             raise TypeError(f'decimals must be a int, got {type(decimals).__name__}')
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for col in polars_df.columns:
             # getting values before conversion
@@ -135,7 +137,7 @@ class NumericalCleaner(DataCleaner):
         """
         SPACES_PATTERN = r'^\s+|\s+$'
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for col in polars_df.columns:
             # keeping a track of values before conversion
@@ -189,7 +191,7 @@ class NumericalCleaner(DataCleaner):
         # pattern for detecting only text, so we can use this to replace the units
         units = r'\s*[A-Za-z]+$'
         
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for col in polars_df.columns:
 
@@ -240,7 +242,7 @@ class NumericalCleaner(DataCleaner):
 
         CURRENCY_SYMBOLS = r'^[$€£¥₹₩₺₫₦₱₪฿₲₴₡]\s*|\s*[$€£¥₹₩₺₫₦₱₪฿₲₴₡]$'
         
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for col in polars_df.columns:
             before = polars_df.select(pl.col(col)).to_series()
@@ -304,7 +306,7 @@ class NumericalCleaner(DataCleaner):
 
         PATTERN = r'^\d*,\d*$'
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for col in polars_df.columns:
             before = polars_df.select(pl.col(col)).to_series()
@@ -362,7 +364,7 @@ class NumericalCleaner(DataCleaner):
             except:
                 return text
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
         
         for col in polars_df.columns:
             before = polars_df.select(pl.col(col)).to_series()
@@ -414,7 +416,7 @@ class NumericalCleaner(DataCleaner):
         --------
         >>>    NumericalCleaner(df).convert_text_to_numbers({'five': 5, 'two': 2, 'one': 1})
         """
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         if not isinstance(text_to_number, (dict,type(None))):
             raise TypeError(f'text to number must be a dictionary of text and its replacement number, got {type(text_to_number).__name__}')
@@ -490,7 +492,7 @@ class NumericalCleaner(DataCleaner):
         # regex pattern for removing square brackets and everything inside except ']'
         PATTERN = r'\[[^\]]*\]'
 
-        pol_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        pol_df = self._to_polars()
 
         for col in pol_df.columns:
             # maintaining before, mask, cleaned and after for tracking dirty values after cleaning
@@ -535,7 +537,7 @@ class NumericalCleaner(DataCleaner):
         # regex pattern for removing parantheses and everything inside except ')'
         PATTERN = r'\s*\([^\)].*\)\s*'
 
-        pol_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        pol_df = self._to_polars()
 
         for col in pol_df.columns:
 
@@ -66,7 +66,7 @@ class TextCleaner(DataCleaner):
         --------
         >>>    TextCleaner(df, columns=['user_status']).to_lowercase()
         """
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         polars_df = polars_df.with_columns(
             cs.string()
@@ -100,7 +100,7 @@ class TextCleaner(DataCleaner):
         --------
         >>>    TextCleaner(df, columns=['user_status']).to_uppercase()
         """
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         polars_df = polars_df.with_columns(
             cs.string().str.to_uppercase()
@@ -136,7 +136,7 @@ class TextCleaner(DataCleaner):
         """
         multiple_spaces_pattern = r'\s{2,}'
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         polars_df = polars_df.with_columns(cs.string().str.replace_all(multiple_spaces_pattern, ""))
 
@@ -185,7 +185,7 @@ class TextCleaner(DataCleaner):
         if not isinstance(splitters_and_replacements, dict):
             raise TypeError(f'splitters and replacements must be a dict, got {type(splitters_and_replacements).__name__}')
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for column in polars_df.columns:
             
@@ -242,7 +242,7 @@ class TextCleaner(DataCleaner):
         if not isinstance(symbols_and_replacements, dict):
             raise TypeError(f'symbols and replacements must be a dict, got {type(symbols_and_replacements).__name__}')
 
-        polars_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        polars_df = self._to_polars()
 
         for col in polars_df.columns:
 
@@ -301,7 +301,7 @@ class TextCleaner(DataCleaner):
         # regex pattern for removing square brackets and everything inside except ']'
         PATTERN = r'\[[^\]]*\]'
 
-        pol_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        pol_df = self._to_polars()
 
         for col in pol_df.columns:
             # maintaining before, mask, cleaned and after for tracking dirty values after cleaning
@@ -346,7 +346,7 @@ class TextCleaner(DataCleaner):
         # regex pattern for removing parantheses and everything inside except ')'
         PATTERN = r'\s*\([^\)].*\)\s*'
 
-        pol_df = BackendConverter(self.df[self.columns]).pandas_to_polars()
+        pol_df = self._to_polars()
 
         for col in pol_df.columns:
 
@@ -1,5 +1,6 @@
 """Diagnoses Dirty Data in a pandas DataFrame"""
 
+from ..utils.Config import config
 from ..utils.Logger import datalabx_logger
 import pandas as pd
 import polars as pl
@@ -19,12 +20,12 @@ class DirtyDataDiagnosis:
         A list of columns you wish to diagnose, by default None.
 
     array_type: str, optional
-        The backend you wish to work with in pandas: 'numpy' or 'pyarrow', by default 'auto'.
+        The backend you wish to work with in pandas: 'numpy' or 'pyarrow', by default None (config.array_type, which is 'auto' unless changed).
 
     conversion_threshold: int, optional
-        The number of rows upon which backend automatically switches to 'pyarrow' in pandas, by default 100000.
+        The number of rows upon which backend automatically switches to 'pyarrow' in pandas, by default None (config.conversion_threshold, which is 100000 unless changed).
     """
-    def __init__(self, df: pd.DataFrame, columns: list|None = None, array_type:str='auto', conversion_threshold: int|None= None):
+    def __init__(self, df: pd.DataFrame, columns: list|None = None, array_type:str|None=None, conversion_threshold: int|None= None):
         
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f'df must be a pandas DataFrame, got {type(df).__name__}')
@@ -32,8 +33,8 @@ class DirtyDataDiagnosis:
         if not isinstance(columns, (list, type(None))):
             raise TypeError(f'columns must be list of strings or type None, got {type(columns).__name__}')
 
-        if not isinstance(array_type, str):
-            raise TypeError(f'array type must be a string, got {type(array_type).__name__}')
+        if not isinstance(array_type, (str, type(None))):
+            raise TypeError(f'array type must be a string or type None, got {type(array_type).__name__}')
 
         if not isinstance(conversion_threshold, (int, type(None))):
             raise TypeError(f'conversion threshold must be an integer or type None, got {type(conversion_threshold).__name__}')
@@ -51,8 +52,9 @@ class DirtyDataDiagnosis:
         else:
             self.columns = [column for column in columns if column in self.df.columns]
 
-        self.array_type= array_type
-        self.conversion_threshold = conversion_threshold
+        # options that are not passed fall back to the global config
+        self.array_type= array_type if array_type is not None else config.array_type
+        self.conversion_threshold = conversion_threshold if conversion_threshold is not None else config.conversion_threshold
 
         logger.info(f'Dirty Data Diagnosis initialized with {self.array_type} backend.')
 
@@ -93,9 +95,9 @@ class DirtyDataDiagnosis:
 
         Considerations
         ---------------
-            1. This method adds a default **index** column by resetting the DataFrame's index.
-            2. This is necessary to preserve original row IDs during conversion to Polars and back.
-            3. The index column DOES NOT AFFECT your transformations and are automatically restored in all returned DataFrames
+            1. The index of your DataFrame is kept aside as row ids during conversion to Polars, instead of being reset into a column.
+            2. Row ids of the matching rows are gathered and set as the index of every returned DataFrame.
+            3. Your DataFrame is neither modified nor copied to preserve row ids.
             4. This method also uses Polars regex under the hood for pattern matching
             5. This method is intended for diagnostic purposes, not data mutation.
 
@@ -107,11 +109,10 @@ class DirtyDataDiagnosis:
         """
         from ..utils.BackendConverter import BackendConverter
         
-        # resetting index to ensure index is turned into a new column 'index' in pandas dataframe
-        self.df = self.df.reset_index()   
+        # keeping the index aside as row ids, which are reattached to the results
+        converter = BackendConverter(self.df)
 
-        # passing dataframe including the new column 'index'
-        polars_df = BackendConverter(self.df).pandas_to_polars()
+        polars_df = converter.pandas_to_polars()
 
         ## keeping a cache of masks to store the masks results
         pattern_masks = {}
@@ -138,8 +139,7 @@ class DirtyDataDiagnosis:
             'has_text': r'(?i)(?:[A-Za-z]+.*\d+|\d+.*[A-Za-z])'
             }
 
-        # excluding index column so that it is not involved in diagnosis 
-        columns_to_diagnose = [column for column in polars_df.columns if column != 'index']
+        columns_to_diagnose = polars_df.columns
 
         for col in columns_to_diagnose:
             
@@ -169,8 +169,8 @@ class DirtyDataDiagnosis:
                 # filtering pattern masks out of the polars dataframe 
                 result_df = BackendConverter(result_df).polars_to_pandas(array_type = self.array_type, conversion_threshold = self.conversion_threshold)
 
-                # setting default index to be 'index'
-                result_df.set_index('index', inplace=True)
+                # setting the original row ids of the filtered rows as index
+                result_df = converter.attach_row_ids(result_df, mask.arg_true())
 
                 numeric_diagnosis[column][pat] = result_df
                 
@@ -209,9 +209,9 @@ class DirtyDataDiagnosis:
 
         Considerations
         ---------------
-            1. This method adds a default **index** column by resetting the DataFrame's index.
-            2. This is necessary to preserve original row IDs during conversion to Polars and back.
-            3. The index column DOES NOT AFFECT your transformations and are automatically restored in all returned DataFrames
+            1. The index of your DataFrame is kept aside as row ids during conversion to Polars, instead of being reset into a column.
+            2. Row ids of the matching rows are gathered and set as the index of every returned DataFrame.
+            3. Your DataFrame is neither modified nor copied to preserve row ids.
             4. This method also uses Polars regex under the hood for pattern matching
             5. This method is intended for diagnostic purposes, not data mutation.
 
@@ -223,11 +223,9 @@ class DirtyDataDiagnosis:
         """
         from ..utils.BackendConverter import BackendConverter
 
-        self.df = self.df.reset_index()
-        
-        polars_df = BackendConverter(self.df).pandas_to_polars()
+        converter = BackendConverter(self.df)
 
-        columns_to_diagnose = [column for column in polars_df.columns if column!= 'index']
+        polars_df = converter.pandas_to_polars()
 
         pattern_masks={}
 
@@ -244,7 +242,7 @@ class DirtyDataDiagnosis:
                 'has_numbers': r'\p{N}'
             }
 
-        columns_to_diagnose = [column for column in polars_df.columns if column != 'index']
+        columns_to_diagnose = polars_df.columns
 
         for col in columns_to_diagnose:
             
@@ -268,8 +266,8 @@ class DirtyDataDiagnosis:
                 # filtering pattern masks out of the polars dataframe 
                 result_df = BackendConverter(result_df).polars_to_pandas(array_type = self.array_type, conversion_threshold = self.conversion_threshold)
 
-                # setting default index to be 'index'
-                result_df.set_index('index', inplace=True)
+                # setting the original row ids of the filtered rows as index
+                result_df = converter.attach_row_ids(result_df, mask.arg_true())
 
                 text_diagnosis[column][pat] = result_df
 
@@ -308,9 +306,9 @@ class DirtyDataDiagnosis:
 
         Considerations
         ---------------
-            1. This method adds a default **index** column by resetting the DataFrame's index.
-            2. This is necessary to preserve original row IDs during conversion to Polars and back.
-            3. The index column DOES NOT AFFECT your transformations and are automatically restored in all returned DataFrames
+            1. The index of your DataFrame is kept aside as row ids during conversion to Polars, instead of being reset into a column.
+            2. Row ids of the matching rows are gathered and set as the index of every returned DataFrame.
+            3. Your DataFrame is neither modified nor copied to preserve row ids.
             4. This method also uses Polars regex under the hood for pattern matching
             5. This method is intended for diagnostic purposes, not data mutation.
 
@@ -322,9 +320,9 @@ class DirtyDataDiagnosis:
         """
         from ..utils.BackendConverter import BackendConverter
         
-        self.df = self.df.reset_index()
+        converter = BackendConverter(self.df)
 
-        pol_df = BackendConverter(self.df).pandas_to_polars()
+        pol_df = converter.pandas_to_polars()
         pattern_masks={}
         datetime_diagnosis = {}
 
@@ -338,7 +336,7 @@ class DirtyDataDiagnosis:
             'is_dirty': None
             }
 
-        cols_to_diagnose = [column for column in pol_df.columns if column!='index']
+        cols_to_diagnose = pol_df.columns
 
         for col in cols_to_diagnose:
             pattern_masks[col] = {}
@@ -364,7 +362,7 @@ class DirtyDataDiagnosis:
                 # ensuring by default, pyarrow is used for datasets over 100000 rows
                 result_df =BackendConverter(result_df).polars_to_pandas(array_type = self.array_type, conversion_threshold = self.conversion_threshold)
 
-                result_df.set_index('index', inplace=True)
+                result_df = converter.attach_row_ids(result_df, mask.arg_true())
 
                 datetime_diagnosis[column][pat] = result_df
 
@@ -1,5 +1,6 @@
 """Diagnoses the Numerical Data in your DataFrame"""
 
+from ..computations.Moments import Moments
 from ..utils.Logger import datalabx_logger
 
 from pathlib import Path
@@ -37,6 +38,9 @@ class NumericalDiagnosis:
         else:
             self.columns = [column for column in columns if column in self.df.columns]
 
+        # moments (variance, skewness, kurtosis) are computed once, on first use, and shared by every check
+        self.moments = Moments(self.df, self.columns)
+
         logger.info('Numerical Diagnosis initialized.')
             
     def check_sparsity(self, value: int|float = 0) -> dict[str, float]:
@@ -109,18 +113,20 @@ class NumericalDiagnosis:
 
         outliers_dict  = {}
 
-        for col in self.df[self.columns]:
-            
-            if method == 'IQR':
-                
-                outliers_dict[col] = Outliers(self.df).iqr_outliers()[col].dropna()
+        if method == 'IQR':
+            # computing the outliers of every column once, with the quartiles of each column in a single pass
+            outliers = Outliers(self.df).iqr_outliers()
 
-            elif method == 'z_score':
+        elif method == 'z_score':
 
-                outliers_dict[col] = Outliers(self.df).zscore_outliers()[col].dropna()
+            outliers = Outliers(self.df).zscore_outliers()
 
-            else:
-                raise ValueError(f"method must either be 'IQR' or 'z_score', got {method}")
+        else:
+            raise ValueError(f"method must either be 'IQR' or 'z_score', got {method}")
+
+        for col in self.df[self.columns]:
+
+            outliers_dict[col] = outliers[col].dropna()
 
         outliers_dict = {col: series for col, series in outliers_dict.items() if not series.empty}
 
@@ -147,11 +153,9 @@ class NumericalDiagnosis:
         ------- 
         >>> Diagnosis(df).check_skewness()
         """
-        from ..computations.Distribution import Distribution
+        skewness = self.moments.skewness()
 
-        skewness = Distribution(self.df[self.columns]).skewness()
-
-        skewness_dict = {col: (round(float(skewness[col].iloc[0]), 4) if pd.notna(skewness[col].iloc[0]) else None) for col in self.df[self.columns]}
+        skewness_dict = {col: (round(float(skewness[col]), 4) if pd.notna(skewness[col]) else None) for col in self.df[self.columns]}
 
         return skewness_dict
 
@@ -190,16 +194,13 @@ class NumericalDiagnosis:
         if kurtosis_type not in ['raw', 'excess']:
             raise ValueError("Available kurtosis types: 'raw' or 'excess'.")
 
-        from ..computations import Distribution
-
-        raw_kurtosis = Distribution(self.df[self.columns]).raw_kurtosis()
-        excess_kurtosis = Distribution(self.df[self.columns]).excess_kurtosis()
-
         if kurtosis_type == 'raw':
-            kurtosis_dict = {col: ((round(float(raw_kurtosis[col].iloc[0]), 4)) if pd.notna(raw_kurtosis[col].iloc[0]) else None) for col in self.df[self.columns]}
+            kurtosis = self.moments.raw_kurtosis()
 
         if kurtosis_type == 'excess':
-            kurtosis_dict = {col: ((round(float(excess_kurtosis[col].iloc[0]), 4)) if pd.notna(excess_kurtosis[col].iloc[0]) else None) for col in self.df[self.columns]}
+            kurtosis = self.moments.excess_kurtosis()
+
+        kurtosis_dict = {col: ((round(float(kurtosis[col]), 4)) if pd.notna(kurtosis[col]) else None) for col in self.df[self.columns]}
 
         return kurtosis_dict
 
@@ -222,13 +223,13 @@ class NumericalDiagnosis:
         ------- 
         >>> Diagnosis(df).check_variance()
         """
-        from ..computations.Statistics import Statistics
-        
+        variances = self.moments.variance()
+
         variance_dict = {}
 
         for col in self.df[self.columns]:
 
-            variance = Statistics(self.df).variance()[col]
+            variance = variances[col]
 
             if (variance == 0):
                 variance_dict[col] = variance
@@ -273,16 +274,12 @@ class NumericalDiagnosis:
         if not isinstance(kurtosis_threshold, (int, float)):
             raise TypeError(f'skewness threshold must be an int or float, got {type(skewness_threshold).__name__}')
 
-        from ..computations.Distribution import Distribution
-
-        distribution_dict = {}
-        
-        skewness = Distribution(self.df[self.columns]).skewness().abs()
-        kurtosis = Distribution(self.df[self.columns]).excess_kurtosis().abs()
+        skewness = self.moments.skewness().abs()
+        kurtosis = self.moments.excess_kurtosis().abs()
 
         distribution_mask = ((skewness > skewness_threshold) & (kurtosis > kurtosis_threshold)).fillna(False)
 
-        distribution_dict = pd.Series(np.where(distribution_mask.iloc[0], "Non-Normal Distribution", 'Normal Distribution'), index = skewness.columns).to_dict()
+        distribution_dict = pd.Series(np.where(distribution_mask, "Non-Normal Distribution", 'Normal Distribution'), index = skewness.index).to_dict()
 
         return distribution_dict
 
@@ -58,13 +58,12 @@ class TextDiagnosis:
         """
         empty_strings_dict = {}
 
-        # generating index as a column
-        self.df = self.df.reset_index()
+        # converting pandas -> polars, keeping the index aside as row ids to preserve rows
+        converter = BackendConverter(self.df)
 
-        # converting pandas -> polars with the index column, to preserve rows
-        polars_df = BackendConverter(self.df).pandas_to_polars()
+        polars_df = converter.pandas_to_polars()
 
-        columns_to_diagnose = [column for column in polars_df.columns if column!='index']
+        columns_to_diagnose = polars_df.columns
         
         for column in columns_to_diagnose:
             # ensuring that length of string should be equal to 0
@@ -72,7 +71,7 @@ class TextDiagnosis:
             
             result_df = BackendConverter(polars_df.filter(series_mask)).polars_to_pandas()
 
-            result_df.set_index('index', inplace=True)
+            result_df = converter.attach_row_ids(result_df, series_mask.arg_true())
 
             empty_strings_dict[column] = result_df
 
@@ -114,11 +113,11 @@ class TextDiagnosis:
         
         splitters_dict = {}
 
-        self.df = self.df.reset_index()
+        converter = BackendConverter(self.df)
 
-        polars_df = BackendConverter(self.df).pandas_to_polars()
+        polars_df = converter.pandas_to_polars()
 
-        columns_to_diagnose = [column for column in polars_df.columns if column!='index']
+        columns_to_diagnose = polars_df.columns
 
         # joining splitters to convert them into a regex pattern for detecting splitters
         joined_splitters=f'[{"".join(splitters)}]+'
@@ -128,8 +127,8 @@ class TextDiagnosis:
             series_mask = (polars_df[column].str.contains(joined_splitters))
             
             result_df = BackendConverter(polars_df.filter(series_mask)).polars_to_pandas()
-            # setting 'index' as index of pandas DataFrame
-            result_df.set_index('index', inplace=True)
+            # setting the original row ids of the filtered rows as index of pandas DataFrame
+            result_df = converter.attach_row_ids(result_df, series_mask.arg_true())
 
             splitters_dict[column] = result_df
 
@@ -0,0 +1,141 @@
+"""Caches parsed DataFrames on disk, so the same file is not parsed again."""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import polars as pl
+
+from ..utils.Logger import datalabx_logger
+
+logger = datalabx_logger(name = __name__.split('.')[-1])
+
+# Number of bytes hashed from the start and from the end of each file
+FINGERPRINT_BYTES = 64 * 1024
+
+# Suffix of cached files
+CACHE_SUFFIX = '.arrow'
+
+class DataCache:
+    """
+    Initializing the Data Cache.
+
+    Parameters
+    -----------
+    cache_dir: str or Path
+        Directory where parsed DataFrames are stored as zstd compressed Arrow IPC files.
+
+    max_bytes: int, optional
+        Maximum total size of the cache directory in bytes, by default 10 GB.
+        Least recently used files are removed once the cache grows beyond this size.
+    """
+
+    def __init__(self, cache_dir: str|Path, max_bytes: int = 10 * 1024**3):
+
+        if not isinstance(cache_dir, (str, Path)):
+            raise TypeError(f'cache_dir must be a string or a path, got {type(cache_dir).__name__}')
+
+        if not isinstance(max_bytes, int):
+            raise TypeError(f'max_bytes must be an integer, got {type(max_bytes).__name__}')
+
+        if max_bytes <= 0:
+            raise ValueError(f'max_bytes must be greater than 0, got {max_bytes}')
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.max_bytes = max_bytes
+
+    def key(self, file_paths: list[Path], **options) -> str:
+        """
+        Builds a cache key from the path, size, modification time and head/tail content of each file,
+        along with the reader options used for parsing.
+        """
+        fingerprint = hashlib.sha256()
+
+        for file_path in file_paths:
+            file_stat = file_path.stat()
+
+            fingerprint.update(str(file_path.resolve()).encode())
+            fingerprint.update(f'{file_stat.st_size}:{file_stat.st_mtime_ns}'.encode())
+
+            # hashing the start and the end of the file, in case it was rewritten with the same size and time
+            with open(file_path, 'rb') as file:
+                fingerprint.update(file.read(FINGERPRINT_BYTES))
+
+                if file_stat.st_size > FINGERPRINT_BYTES:
+                    file.seek(max(file_stat.st_size - FINGERPRINT_BYTES, FINGERPRINT_BYTES))
+                    fingerprint.update(file.read(FINGERPRINT_BYTES))
+
+        fingerprint.update(repr(sorted(options.items(), key=lambda option: option[0])).encode())
+
+        return fingerprint.hexdigest()
+
+    def get(self, key: str) -> pl.DataFrame|None:
+        """Returns the cached polars DataFrame for a key, or None if it is not cached."""
+
+        cache_path = self.cache_dir / f'{key}{CACHE_SUFFIX}'
+
+        if not cache_path.exists():
+            return None
+
+        try:
+            polars_df = pl.read_ipc(cache_path)
+
+        except (OSError, pl.exceptions.ComputeError):
+            logger.info('Removing unreadable cache file.')
+            cache_path.unlink(missing_ok=True)
+            return None
+
+        # updating modification time, which is used as last access time for eviction
+        os.utime(cache_path)
+
+        logger.info(f'Loaded parsed DataFrame from cache: {cache_path.name}')
+
+        return polars_df
+
+    def put(self, key: str, polars_df: pl.DataFrame) -> None:
+        """Stores a polars DataFrame in the cache, and evicts least recently used files if the cache is too large."""
+
+        cache_path = self.cache_dir / f'{key}{CACHE_SUFFIX}'
+        # named after the process and thread, so concurrent writers of the same key never share a temporary file
+        temporary_path = self.cache_dir / f'{key}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+        # writing to a temporary file first, so other processes never read a half written file
+        polars_df.write_ipc(temporary_path, compression='zstd')
+        os.replace(temporary_path, cache_path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used files until the cache is smaller than max_bytes."""
+
+        cache_files = []
+
+        for cache_path in self.cache_dir.glob(f'*{CACHE_SUFFIX}'):
+            try:
+                cache_stat = cache_path.stat()
+            except FileNotFoundError:
+                continue
+
+            cache_files.append((cache_stat.st_mtime, cache_stat.st_size, cache_path))
+
+        total_bytes = sum(size for _, size, _ in cache_files)
+
+        # oldest accessed files are removed first
+        for _, size, cache_path in sorted(cache_files, key=lambda cache_file: cache_file[0]):
+
+            if total_bytes <= self.max_bytes:
+                break
+
+            cache_path.unlink(missing_ok=True)
+            total_bytes -= size
+
+            logger.info(f'Evicted {cache_path.name} from cache.')
+
+    def clear(self) -> None:
+        """Removes all cached files."""
+
+        for cache_path in self.cache_dir.glob(f'*{CACHE_SUFFIX}'):
+            cache_path.unlink(missing_ok=True)
@@ -1,17 +1,61 @@
 """Loads pandas DataFrame from a tabular dataset"""
 
 import pandas as pd
+import asyncio
+import contextvars
+import copy
+import glob
+import io
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import AsyncIterator, Iterator
+import numpy as np
 import polars as pl
+import pyarrow as pa
 import json5
 
+from .DataCache import DataCache
+from .LoadProfiler import LoadProfiler
+from .MemoryOptimizer import column_memory, optimize_dtypes
+from .ReaderOptions import arrow_csv_options, arrow_file_options, polars_column_names
+from .JSONReader import is_json_array, iter_json_records, iter_json_lines, records_to_polars
+from .Sampling import sample_csv_lines, parquet_row_groups, sample_rows, reservoir_sample, systematic_positions
+from .SchemaInference import sample_csv_schema, parse_error_column, widen_dtype
+from ..utils.BackendConverter import BackendConverter
+from ..utils.Config import config
 from ..utils.Logger import datalabx_logger
 
 logger = datalabx_logger(name = __name__.split('.')[-1])
 
 ## List of Supported file types
 
-SUPPORTED_FILE_TYPES = ['txt','csv', 'xlsx', 'xls', 'parquet', 'json']
+SUPPORTED_FILE_TYPES = ['txt','csv', 'xlsx', 'xls', 'parquet', 'json', 'jsonl', 'ndjson', 'arrow', 'feather', 'ipc', 'orc']
+
+## File types that are read with pyarrow, and handed to pandas without going through polars
+
+ARROW_FILE_TYPES = ['arrow', 'feather', 'ipc', 'orc']
+
+## Newline delimited JSON file types, with one record per line
+
+NDJSON_FILE_TYPES = ['jsonl', 'ndjson']
+
+## DataFrame types that can be returned by the Data Loader
+
+SUPPORTED_RETURN_TYPES = ['pandas', 'polars', 'arrow']
+
+## Compression suffixes and their pyarrow codecs (xz is not supported by pyarrow, hence read with lzma)
+
+COMPRESSION_CODECS = {'gz': 'gzip', 'bz2': 'bz2', 'zst': 'zstd', 'xz': None}
+
+SUPPORTED_COMPRESSIONS = list(COMPRESSION_CODECS)
+
+## File types that can be read from a compressed file
+
+COMPRESSIBLE_FILE_TYPES = ['txt', 'csv', 'json', 'jsonl', 'ndjson']
 
 # Error that gets raised when File is Empty.
 class EmptyFileError(Exception):
@@ -50,6 +94,115 @@ class _FileTypeMismatchError(Exception):
         f"File type mismatch: expected: {self.expected_type}, received: {self.received_type} from file: {self.file_path}"
         )
 
+def _detect_compression(path: Path) -> str|None:
+    """Detects compression from the suffix of a file. E.g: data.csv.gz -> gz, data.csv -> None"""
+    suffix = path.suffix.split('.')[-1].lower()
+
+    return suffix if suffix in SUPPORTED_COMPRESSIONS else None
+
+def _detect_file_type(path: Path) -> str:
+    """Detects file type from the suffix of a file. E.g: data.csv -> csv, data.csv.gz -> csv"""
+    # for compressed files, file type is the suffix before the compression suffix
+    if _detect_compression(path) is not None:
+        path = Path(path.stem)
+
+    # removing (.) from file type suffix. E.g: .csv -> csv
+    return path.suffix.split('.')[-1].lower()
+
+def _open_source(file_path: Path):
+    """Opens a compressed file as a decompressing stream. Files that are not compressed are returned as they are."""
+    compression = _detect_compression(file_path)
+
+    if compression is None:
+        return nullcontext(file_path)
+
+    codec = COMPRESSION_CODECS[compression]
+
+    # pyarrow decompresses in C++, without holding the GIL
+    if codec is not None and pa.Codec.is_available(codec):
+        return pa.input_stream(str(file_path), compression=codec)
+
+    if compression == 'gz':
+        import gzip
+        return gzip.open(file_path, 'rb')
+
+    elif compression == 'bz2':
+        import bz2
+        return bz2.open(file_path, 'rb')
+
+    elif compression == 'xz':
+        import lzma
+        return lzma.open(file_path, 'rb')
+
+    raise ImportError(f"Reading .{compression} files requires pyarrow built with {codec} support.")
+
+def _open_text(file_path: Path):
+    """Opens a file as a UTF-8 text stream, decompressing it first if it is compressed."""
+    if _detect_compression(file_path) is None:
+        return open(file_path, encoding='utf-8')
+
+    return io.TextIOWrapper(_open_source(file_path), encoding='utf-8')
+
+def _import_fastexcel():
+    """Imports fastexcel, which polars uses for reading excel files."""
+    # trying to import fastexcel for reading excel files
+    try:
+        import fastexcel
+
+    except:
+        raise ImportError(
+            "Excel file support requires 'fastexcel'. " 
+            "You can install 'fastexcel' with: pip install datalabx[excel]"
+            )
+
+    return fastexcel
+
+def _is_glob_pattern(file_path: str) -> bool:
+    """Checks whether the file path is a glob pattern, like 'data/*.csv'"""
+    return any(character in file_path for character in '*?[')
+
+def _glob_root(path: Path) -> Path:
+    """Returns the directory before the first wildcard of a glob pattern. E.g: data/date=*/*.parquet -> data"""
+    root_parts = []
+
+    for part in path.parts:
+        if _is_glob_pattern(part):
+            break
+        root_parts.append(part)
+
+    return Path(*root_parts) if root_parts else Path('.')
+
+def _hive_partitions(file_path: Path, root_path: Path|None) -> dict[str, str]:
+    """Returns hive partitions (key=value directories) between the root directory and the file. E.g: date=2026-10-01/part-0.parquet -> {'date': '2026-10-01'}"""
+    if root_path is None:
+        return {}
+
+    try:
+        directories = file_path.relative_to(root_path).parent.parts
+    except ValueError:
+        directories = file_path.parent.parts
+
+    return dict(directory.split('=', 1) for directory in directories if '=' in directory)
+
+def _complete_lines_end(file_path: Path, file_size: int, start: int = 0) -> int:
+    """Returns the position after the last newline between start and file_size, so a line that is still being written is not read."""
+    end = file_size
+
+    with open(file_path, 'rb') as file:
+        # searching backwards from the end of the file, since the last newline is usually close to it
+        while end > start:
+            chunk_start = max(start, end - 65_536)
+
+            file.seek(chunk_start)
+            newline = file.read(end - chunk_start).rfind(b'\n')
+
+            if newline != -1:
+                return chunk_start + newline + 1
+
+            end = chunk_start
+
+    return start
+
 ### ------- DATA LOADER --------- ###
 
 class DataLoader:
@@ -58,7 +211,9 @@ class DataLoader:
     ------------
 
     file_path: str
-        Path of your data file or just file name
+        Path of your data file or just file name.
+
+        A directory or a glob pattern (e.g: 'data/date=*/part-*.parquet') can also be passed for loading multiple files at once.
   
     file_type: str, optional
         Type of file user passed in the Data Loader (Automatically detected)
@@ -69,29 +224,52 @@ class DataLoader:
         - 'excel'
         - 'parquet'
         - 'JSON'
+        - 'jsonl' or 'ndjson' (newline delimited JSON)
         - 'txt'
+        - 'arrow', 'feather' or 'ipc' (Arrow IPC)
+        - 'orc'
+
+        CSV, TXT, JSON and NDJSON files can also be compressed with gzip (.gz), zstandard (.zst), bzip2 (.bz2) or xz (.xz). E.g: 'events.csv.gz'
 
     array_type: str, optional
 
-        Determines the array/backend type used in pandas operations, by default 'auto'.
+        Determines the array/backend type used in pandas operations, by default None (config.array_type, which is 'auto' unless changed).
 
         Options are:
 
         - 'numpy' -> usual NumPy backend (slower for very large datasets with object types)
         - 'pyarrow' -> PyArrow backend for better performance on large datasets
         - 'auto' -> automatically selects backend based on input and dataset size 
+        - 'adaptive' -> selects backend for each column separately (strings and integers with nulls -> pyarrow, floats -> numpy)
                 
     conversion_threshold: int, optional
 
-        The number of rows at which the conversion from Polars to pandas switches to Arrow-backed pandas arrays for performance, default is 100000.
+        The number of rows at which the conversion from Polars to pandas switches to Arrow-backed pandas arrays for performance,
+        default is None (config.conversion_threshold, which is 100000 unless changed).
         Users can increase or decrease this threshold depending on their dataset size and memory availability.
+
+    max_workers: int, optional
+
+        The number of threads used for reading multiple files in parallel, by default None (config.max_workers, chosen by Python's ThreadPoolExecutor unless changed).
+
+    cache_dir: str, optional
+
+        Directory for caching parsed DataFrames on disk, by default None (no caching).
+        When the same file is loaded again with the same options, it is read from the cache instead of being parsed again.
+
+    cache_max_bytes: int, optional
+
+        Maximum total size of the cache directory in bytes, by default 10 GB. Least recently used files are removed first.
     """
     def __init__(
         self,
         file_path:str,
         file_type: str|None = None,
-        array_type: str = 'auto',
-        conversion_threshold: int|None = None):
+        array_type: str|None = None,
+        conversion_threshold: int|None = None,
+        max_workers: int|None = None,
+        cache_dir: str|Path|None = None,
+        cache_max_bytes: int = 10 * 1024**3):
 
         if not isinstance(file_path, (str, Path)):
             raise TypeError(f'file path must be a string or a file path, got {type(file_path).__name__}')
@@ -99,42 +277,86 @@ class DataLoader:
         if not isinstance(file_type, (str, type(None))):
             raise TypeError(f'file type must be a string, got {type(file_type).__name__}')
 
-        if not isinstance(array_type, str):
-            raise TypeError(f'array type must be a string, got {type(array_type).__name__}')
+        if not isinstance(array_type, (str, type(None))):
+            raise TypeError(f'array type must be a string or type None, got {type(array_type).__name__}')
         
         if not isinstance(conversion_threshold,(int, type(None))):
             raise TypeError(f'conversion threshold must be an integer, got {type(conversion_threshold).__name__}')
 
-        if array_type not in ['numpy', 'pyarrow', 'auto']:
-            raise ValueError(f"array_type must either be 'numpy', 'pyarrow' or 'auto', got '{array_type}'")
+        # options that are not passed fall back to the global config
+        if array_type is None:
+            array_type = config.array_type
+
+        if array_type not in ['numpy', 'pyarrow', 'auto', 'adaptive']:
+            raise ValueError(f"array_type must either be 'numpy', 'pyarrow', 'auto' or 'adaptive', got '{array_type}'")
         
+        if not isinstance(max_workers, (int, type(None))):
+            raise TypeError(f'max workers must be an integer or type None, got {type(max_workers).__name__}')
+
+        if not isinstance(cache_dir, (str, Path, type(None))):
+            raise TypeError(f'cache dir must be a string, a path or type None, got {type(cache_dir).__name__}')
+
+        # time spent checking the file system, which is reported along with the load timings
+        stat_start_time = time.perf_counter()
+
         # reading file path using Path Lib
         path = Path(file_path)
 
-        # if path does not exist for file
-        if not path.exists():
-            raise FileNotFoundError(f"File {path} does not exist.")
+        # ---- COLLECTING FILES FROM A FILE, DIRECTORY OR GLOB PATTERN ------
 
-        # if path is a directory instead of file
-        if not path.is_file():
-            raise IsADirectoryError(f"{path} is not a file.")
+        if _is_glob_pattern(str(file_path)):
+            # the part of the pattern before the first wildcard is the root of hive partitions
+            self.root_path = _glob_root(path)
 
-        file_size = path.stat().st_size
+            file_paths = sorted(
+                Path(match) for match in glob.glob(str(path), recursive=True)
+                if Path(match).is_file())
 
-        if file_size == 0:
-            raise EmptyFileError("Received an empty file.")
+            if not file_paths:
+                raise FileNotFoundError(f"No files match the pattern {path}.")
 
-        file_size_in_MB = file_size/1024/1024        
+        else:
+            # if path does not exist for file
+            if not path.exists():
+                raise FileNotFoundError(f"File {path} does not exist.")
 
-        self.file_size = file_size_in_MB
+            if path.is_dir():
+                self.root_path = path
+
+                # skipping hidden and marker files like .DS_Store or _SUCCESS
+                file_paths = sorted(
+                    child for child in path.rglob('*')
+                    if child.is_file() and not child.name.startswith(('.', '_'))
+                    and (_detect_file_type(child) in SUPPORTED_FILE_TYPES))
 
-        self.file_path = path
+                if not file_paths:
+                    raise FileNotFoundError(f"Directory {path} does not contain any supported files.")
+
+            elif path.is_file():
+                self.root_path = None
+                file_paths = [path]
+
+            else:
+                raise IsADirectoryError(f"{path} is not a file.")
 
         # ---- DETECTING FILE TYPES------
 
+        if file_type is not None and len(file_paths) > 1:
+            # keeping only the files of the type passed by the user
+            file_paths = [file for file in file_paths if _detect_file_type(file) == file_type.lower()]
+
+            if not file_paths:
+                raise FileNotFoundError(f"No {file_type.lower()} files found in {path}.")
+
+        detected_types = {_detect_file_type(file) for file in file_paths}
+
+        if len(detected_types) > 1:
+            raise ValueError(f"All files must be of the same type, got: {', '.join(sorted(detected_types))}")
+
+        detected_type = detected_types.pop()
+
         if file_type is None:
-            # removing (.) from file type suffix. E.g: .csv -> csv
-            self.file_type = path.suffix.split('.')[-1].lower()
+            self.file_type = detected_type
         else:
             self.file_type = file_type.lower()
 
@@ -145,29 +367,94 @@ class DataLoader:
 
         # if user passed file type does not match the auto detected file type, raise File Type Mismatch error
 
-        if self.file_type.lower() != self.file_path.suffix.split('.')[-1].lower():
+        if self.file_type != detected_type:
             raise _FileTypeMismatchError(
 
-                expected_type= self.file_path.suffix.split('.')[-1].lower(),
-                received_type= self.file_type.lower(),
-                file_path = self.file_path
+                expected_type= detected_type,
+                received_type= self.file_type,
+                file_path = str(path)
                 )
 
+        if self.file_type not in COMPRESSIBLE_FILE_TYPES and any(_detect_compression(file) is not None for file in file_paths):
+            raise ValueError(f"Compressed files are only supported for {', '.join(COMPRESSIBLE_FILE_TYPES)} files, got a compressed {self.file_type} file.")
+
+        # skipping empty files, and raising an error only if all of the files are empty
+        file_sizes = {file: file.stat().st_size for file in file_paths}
+
+        if len(file_paths) > 1:
+            empty_files = [file for file, size in file_sizes.items() if size == 0]
+
+            if empty_files:
+                logger.info(f'Skipping {len(empty_files)} empty files.')
+
+            file_paths = [file for file in file_paths if file_sizes[file] > 0]
+
+        file_size = sum(file_sizes[file] for file in file_paths)
+
+        if file_size == 0:
+            raise EmptyFileError("Received an empty file.")
+
+        self._stat_seconds = time.perf_counter() - stat_start_time
+
+        self._file_bytes = file_size
+
+        file_size_in_MB = file_size/1024/1024        
+
+        self.file_size = file_size_in_MB
+
+        self.file_paths = file_paths
+
+        self.file_path = file_paths[0] if len(file_paths) == 1 else path
+
+        self.max_workers = max_workers if max_workers is not None else config.max_workers
+
+        # schema resolved during the last load_tabular() call
+        self.schema = None
+
+        # JSON records that could not be parsed even after being repaired, and were skipped
+        self.malformed_records = []
+
+        if cache_dir is not None:
+            self.cache = DataCache(cache_dir, max_bytes=cache_max_bytes)
+        else:
+            self.cache = None
+
         self.array_type = array_type
 
-        # If conversion threshold is None, it defaults to 100k rows for converting to pyarrow datatype
+        # backend and memory of each column chosen during the last conversion with array_type='adaptive'
+        self.backend_report = None
+
+        # dtype and memory of each column before and after the last load_tabular(optimize_memory=True) call
+        self.memory_report = None
+
+        # timings, size and memory of the last load_tabular() call
+        self.load_report = None
+
+        # byte offset, header and schema of each file, remembered between load_new_rows() calls
+        self._tail_state = {}
+
+        self._profiler = LoadProfiler()
+
+        # If conversion threshold is None, it defaults to config.conversion_threshold (100k rows unless changed) for converting to pyarrow datatype
 
         if conversion_threshold is None:
-            self.conversion_threshold = 100_000 
+            self.conversion_threshold = config.conversion_threshold
         else:
             self.conversion_threshold = conversion_threshold
 
-        logger.info(f'Data Loader initialized with {self.file_type} file of {self.file_size:.2f} MB.')
+        if len(self.file_paths) > 1:
+            logger.info(f'Data Loader initialized with {len(self.file_paths)} {self.file_type} files of {self.file_size:.2f} MB.')
+        else:
+            logger.info(f'Data Loader initialized with {self.file_type} file of {self.file_size:.2f} MB.')
 
     def load_tabular(
             self,
             load_csv_as_string:bool = False,
-            **kwargs:dict) -> pd.DataFrame:
+            schema:dict|None = None,
+            return_type:str = 'pandas',
+            optimize_memory:bool = False,
+            report:bool = False,
+            **kwargs:dict) -> pd.DataFrame|pl.DataFrame|pa.Table:
         """
         Use this function for loading your tabular data as a pandas DataFrame.
 
@@ -176,6 +463,36 @@ class DataLoader:
         load_csv_as_string: bool, optional 
         
             Whether you would like to load your data as strings, instead of original datatypes, default is False
+
+        schema: dict, optional
+
+            A dictionary of column names and polars datatypes, used instead of inferring datatypes of those columns, default is None.
+            The schema resolved during the previous load is available as DataLoader.schema and can be passed here.
+
+        return_type: str, optional
+
+            Type of DataFrame returned, default is 'pandas'.
+
+            Options are:
+
+            - 'pandas' -> returns a pandas DataFrame (array type follows the DataLoader's array_type)
+            - 'polars' -> returns a polars DataFrame, without converting it to pandas
+            - 'arrow' -> returns a pyarrow Table, without converting it to pandas
+
+        optimize_memory: bool, optional
+
+            Whether you would like to shrink the DataFrame after loading it, default is False.
+            Integer and float columns are downcast to the smallest type that holds their values without loss,
+            and string columns with few unique values (at most half of their values) are converted to categoricals.
+            The dtype and memory of each column before and after are stored in DataLoader.memory_report, measured on the returned DataFrame
+            (e.g: with memory_usage(deep=True) for pandas). With a numpy backend, downcast integer columns with nulls are Arrow backed,
+            since numpy integers cannot hold nulls and would become float64.
+
+        report: bool, optional
+
+            Whether you would like to track the peak memory of the load and log a summary of the load report, default is False.
+            A report of the timings (file stat, parse, schema inference, fallback retries, cache, conversion), rows, columns and bytes read
+            is always stored in DataLoader.load_report. Peak memory is only measured when report is True.
         
         kwargs: dict, optional
 
@@ -183,9 +500,9 @@ class DataLoader:
 
         Returns
         ---------
-        pd.DataFrame
+        pd.DataFrame | pl.DataFrame | pa.Table
 
-            A pandas DataFrame
+            A pandas DataFrame, a polars DataFrame or a pyarrow Table, depending on return_type
         
         Usage Recommendation
         ---------------------
@@ -197,6 +514,17 @@ class DataLoader:
         ---------------
 
             - Adjust array_type and conversion_threshold for very large datasets to optimize performance and memory usage.
+            - Use return_type='polars' or 'arrow' if the next steps of your pipeline work on polars or Arrow data, so the data is never converted to pandas and back.
+            - Use optimize_memory=True for large DataFrames with repeated strings or small numbers, which often shrink to a fraction of their size.
+              Downcast columns can overflow in later arithmetic (e.g: summing Int8 values), so cast them back if needed.
+            - Use report=True (or DataLoader.load_report) to find out whether a slow load is spent parsing, retrying after a parse error or converting to pandas.
+              Timings of files read in parallel are summed, so they can add up to more than the total time.
+            - Pass cache_dir to the DataLoader if you load the same large file repeatedly, e.g: from different notebook kernels.
+            - If a CSV value does not match the datatype inferred from the first rows, the schema is inferred again from samples of
+              the head, middle and tail of the file, and only the columns that still fail are widened (e.g: Int64 -> Float64 -> String).
+            - Only one sheet of an excel file is loaded (the first one, unless sheet_name is passed). Use load_sheets() for loading multiple sheets.
+            - If a JSON or NDJSON file fails to parse, it is read again record by record. Records with trailing commas, single quotes
+              or comments are repaired, and records that cannot be repaired are skipped and listed in DataLoader.malformed_records.
 
         Example
         --------
@@ -220,85 +548,1515 @@ class DataLoader:
 
         >>> # Load a JSON file from a subdirectory with auto array backend
             df7 = DataLoader('some/path/to/data.json').load_tabular()
+
+        >>> # Reuse the schema resolved for a CSV file while loading the next file
+            loader = DataLoader('january.csv')
+            df8 = loader.load_tabular()
+            df9 = DataLoader('february.csv').load_tabular(schema=loader.schema)
+
+        >>> # Load a parquet file as a polars DataFrame
+            df10 = DataLoader('example.parquet').load_tabular(return_type='polars')
+
+        >>> # Load a large CSV file with downcast numbers and categorical strings
+            loader = DataLoader('large_dataset.csv')
+            df11 = loader.load_tabular(optimize_memory=True)
+            print(loader.memory_report)
+
+        >>> # Find out where the time of a slow load is spent
+            loader = DataLoader('large_dataset.json')
+            df12 = loader.load_tabular(report=True)
+            print(loader.load_report['timings'])
+
+        >>> # Load a newline delimited JSON file
+            df13 = DataLoader('events.jsonl').load_tabular()
+
+        >>> # Load a large CSV file, parsing it only once across sessions
+            df14 = DataLoader('large_dataset.csv', cache_dir='.datalabx_cache').load_tabular()
         """    
         
         if not isinstance(load_csv_as_string, bool):
             raise TypeError(f'load_as_string must be a boolean, got {type(load_csv_as_string).__name__}')
 
-        # ----- LOADING POLARS DATAFRAMES DEPENDING ON FILE TYPE ------
+        if not isinstance(schema, (dict, type(None))):
+            raise TypeError(f'schema must be a dictionary of column names and polars datatypes, got {type(schema).__name__}')
 
-        if self.file_type in ['csv','txt']:
+        self._validate_return_type(return_type)
 
-            if load_csv_as_string:
-                logger.info('Loading csv with string datatype.')
-                polars_df = pl.read_csv(self.file_path, infer_schema_length=0, **kwargs)
+        if not isinstance(optimize_memory, bool):
+            raise TypeError(f'optimize_memory must be either True or False, got {type(optimize_memory).__name__}')
 
-            else:
-                try:
-                    # load the file with schema inference
-                    polars_df = pl.read_csv(self.file_path, **kwargs)
+        if not isinstance(report, bool):
+            raise TypeError(f'report must be either True or False, got {type(report).__name__}')
 
-                    # if polars throw Compute Error
-                except pl.exceptions.ComputeError as error:
-                    
-                    if 'CSV parsing' in str(error):
+        self._profiler = LoadProfiler(track_memory=report)
+        self._profiler.start()
 
-                        logger.info("Schema inference issue. Loading CSV without schema inference.")
-                        
-                        polars_df = pl.read_csv(self.file_path, infer_schema_length=None, **kwargs)
+        start_time = time.perf_counter()
 
-                    else:
-                        raise
+        try:
+            result = self._load(load_csv_as_string, schema, return_type, optimize_memory, **kwargs)
 
-        elif self.file_type == 'parquet':
-            polars_df = pl.read_parquet(self.file_path, **kwargs)
+        finally:
+            self._profiler.stop()
 
-        elif self.file_type == 'json':
-            try:
-                polars_df = pl.read_json(self.file_path, **kwargs)
-            
-            except pl.exceptions.ComputeError as error:
+        self.load_report = self._build_load_report(result, time.perf_counter() - start_time)
+
+        if report:
+            timings = ', '.join(f'{stage}: {seconds:.3f}s' for stage, seconds in self.load_report['timings'].items())
+            logger.info(f"Loaded {self.load_report['rows']} rows and {self.load_report['columns']} columns. {timings}")
+
+        return result
 
-                if "Syntax" in str(error):
+    def _load(
+            self,
+            load_csv_as_string:bool,
+            schema:dict|None,
+            return_type:str,
+            optimize_memory:bool,
+            **kwargs:dict) -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        This is an internal function that loads the files for load_tabular(), after its arguments are validated.
+        """
+        # records skipped by a previous load are not reported again, e.g: when this load is served from the cache
+        self.malformed_records = []
 
-                    logger.info("Encountered an issue while reading JSON. Loading JSON using json5")
+        # a load without optimize_memory (or returning polars) does not report the memory or backends of a previous load
+        self.memory_report = None
+        self.backend_report = None
 
-                    with open(self.file_path, 'r') as json_file:
-                        data = json5.loads(json_file.read())
+        if schema is not None and self.file_type in ['csv', 'txt']:
+            # CSV readers use the schema directly instead of inferring those columns
+            kwargs['schema_overrides'] = {**(kwargs.get('schema_overrides') or {}), **schema}
 
-                    polars_df = pl.DataFrame(data)
-                
+        if self.file_type in ARROW_FILE_TYPES and self.root_path is None and schema is None and not optimize_memory:
+            with self._profiler.stage('parse'):
+                arrow_table = self._read_arrow(self.file_path, **kwargs)
+
+            self.schema = dict(pl.from_arrow(arrow_table.slice(0, 0)).schema)
+
+            if return_type == 'arrow':
+                return arrow_table
+
+            elif return_type == 'polars' or self.array_type == 'adaptive':
+                return self._convert(pl.from_arrow(arrow_table, rechunk=False), return_type)
+
+            with self._profiler.stage('conversion'):
+                # handing arrow buffers straight to pandas, since converting through polars would copy string columns
+                if self._uses_pyarrow_backend(arrow_table.num_rows):
+                    return arrow_table.to_pandas(types_mapper=pd.ArrowDtype)
                 else:
-                    raise
+                    return arrow_table.to_pandas()
 
-        elif self.file_type in ['xlsx', 'xls']:
-            # trying to import fastexcel for reading excel files
-            try:
-                import fastexcel
+        if self.cache is not None:
+            # cache key changes whenever the file or the reader options change
+            with self._profiler.stage('cache'):
+                cache_key = self.cache.key(
+                    self.file_paths,
+                    file_type=self.file_type,
+                    root_path=str(self.root_path),
+                    load_csv_as_string=load_csv_as_string,
+                    **kwargs)
+
+                polars_df = self.cache.get(cache_key)
 
-            except:
-                raise ImportError(
-                    "Excel file support requires 'fastexcel'. " 
-                    "You can install 'fastexcel' with: pip install datalabx[excel]"
-                    )
+            if polars_df is None:
+                polars_df = self._read_polars(load_csv_as_string=load_csv_as_string, **kwargs)
 
-            polars_df = pl.read_excel(self.file_path, **kwargs)
+                with self._profiler.stage('cache'):
+                    self.cache.put(cache_key, polars_df)
+            else:
+                self._profiler.count('cache_hits')
+
+        else:
+            polars_df = self._read_polars(load_csv_as_string=load_csv_as_string, **kwargs)
 
-        df_size = polars_df.height 
+        if schema is not None and self.file_type not in ['csv', 'txt']:
+            polars_df = polars_df.cast({column: dtype for column, dtype in schema.items() if column in polars_df.columns})
 
-        # ------ RETURNING ARRAY TYPE DEPENDING ON USER'S CHOICE
+        # keeping the resolved schema, so it can be reused for loading similar files
+        self.schema = dict(polars_df.schema)
+
+        if not optimize_memory:
+            return self._convert(polars_df, return_type)
+
+        with self._profiler.stage('optimize_memory'):
+            optimized_df, _ = optimize_dtypes(polars_df)
+
+        result = self._convert(optimized_df, return_type, nullable_integers=True)
+
+        with self._profiler.stage('optimize_memory'):
+            self.memory_report = self._memory_report(polars_df, result, return_type)
+
+        before_bytes = sum(report['before_bytes'] for report in self.memory_report.values())
+        after_bytes = sum(report['after_bytes'] for report in self.memory_report.values())
+
+        logger.info(f'Optimized memory from {before_bytes/1024/1024:.2f} MB to {after_bytes/1024/1024:.2f} MB.')
+
+        return result
+
+    def _memory_report(self, polars_df: pl.DataFrame, result: pd.DataFrame|pl.DataFrame|pa.Table, return_type: str) -> dict:
+        """
+        This is an internal function that reports the dtype and memory of each column, as returned with and without optimize_memory.
+        """
+        # the backend report describes the returned DataFrame, not the columns converted below
+        backend_report = self.backend_report
+
+        memory_report = {}
+
+        for column in polars_df.columns:
+            before_df = polars_df.select(column)
+
+            # converting one column at a time, so the DataFrame without optimization is never held in full
+            if return_type == 'pandas':
+                before_df = self._to_pandas(before_df)
+
+            elif return_type == 'arrow':
+                before_df = before_df.to_arrow()
+
+            before_dtype, before_bytes = column_memory(before_df, column)
+            after_dtype, after_bytes = column_memory(result, column)
+
+            memory_report[column] = {'before_dtype': before_dtype, 'after_dtype': after_dtype, 'before_bytes': before_bytes, 'after_bytes': after_bytes}
+
+        self.backend_report = backend_report
+
+        return memory_report
+
+    def _build_load_report(self, result: pd.DataFrame|pl.DataFrame|pa.Table, total_seconds: float) -> dict:
+        """
+        This is an internal function that summarizes the timings, size and memory of the last load_tabular() call.
+        """
+        rows, columns = result.shape
+
+        # the file system is only checked once, when the DataLoader is initialized
+        timings = {'stat': self._stat_seconds, **self._profiler.timings, 'total': total_seconds}
+
+        load_report = {
+            'file_type': self.file_type,
+            'files': len(self.file_paths),
+            'bytes_read': self._file_bytes,
+            'rows': rows,
+            'columns': columns,
+            'cache_hit': self._profiler.counters.get('cache_hits', 0) > 0,
+            'fallback_retries': self._profiler.counters.get('fallback_retries', 0),
+            'timings': timings,
+            'peak_memory_bytes': self._profiler.peak_memory,
+            'memory_increase_bytes': None}
+
+        if self._profiler.peak_memory is not None and self._profiler.start_memory is not None:
+            load_report['memory_increase_bytes'] = self._profiler.peak_memory - self._profiler.start_memory
+
+        return load_report
+
+    async def aload_tabular(self, **kwargs:dict) -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        Use this function for loading your tabular data from asyncio code, without blocking the event loop.
+
+        Parameters
+        ------------
+        kwargs: dict, optional
+
+            Arguments passed into load_tabular() (e.g: load_csv_as_string, schema or return_type).
+
+        Returns
+        ---------
+        pd.DataFrame | pl.DataFrame | pa.Table
+
+            The same DataFrame returned by load_tabular()
+
+        Example
+        --------
+        >>> # Load a CSV file inside a coroutine
+            df = await DataLoader('example.csv').aload_tabular()
+        """
+        # file is read on a worker thread, so the event loop keeps serving other tasks
+        return await asyncio.to_thread(self.load_tabular, **kwargs)
+
+    @classmethod
+    async def aload_many(
+            cls,
+            file_paths: list,
+            max_workers: int|None = None,
+            return_exceptions: bool = False,
+            loader_options: dict|None = None,
+            **kwargs:dict) -> AsyncIterator[tuple[str, pd.DataFrame|pl.DataFrame|pa.Table|Exception]]:
+        """
+        Use this function for loading many files concurrently from asyncio code, getting each file as soon as it is loaded.
+
+        Parameters
+        ------------
+        file_paths: list
+
+            A list of file paths, directories or glob patterns. Each of them is loaded by its own DataLoader.
+
+        max_workers: int, optional
+
+            Maximum number of files loaded at the same time, by default None (config.max_workers, chosen by Python's ThreadPoolExecutor unless changed).
+
+        return_exceptions: bool, optional
+
+            Whether files that fail to load are yielded with their exception instead of raising it, default is False.
+
+        loader_options: dict, optional
+
+            Arguments passed into each DataLoader (e.g: array_type or cache_dir), default is None.
+
+        kwargs: dict, optional
+
+            Arguments passed into load_tabular() of each DataLoader (e.g: load_csv_as_string or return_type).
+
+        Returns
+        ---------
+        AsyncIterator[tuple[str, pd.DataFrame | pl.DataFrame | pa.Table | Exception]]
+
+            An async iterator of (file path, DataFrame) tuples, in the order files finish loading.
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function in asyncio based services that load hundreds of small or medium files per job.
+            - Files are read on a bounded thread pool, so disk reads of some files overlap with parsing of others, and the event loop is never blocked.
+
+        Considerations
+        ---------------
+
+            - Results are yielded in completion order, not in the order of file_paths. Use the returned file path to match them.
+            - Leaving the loop early cancels files that have not started loading yet.
+
+        Example
+        --------
+        >>> # Load many extracts, 8 files at a time
+            async for file_path, df in DataLoader.aload_many(paths, max_workers=8):
+                print(file_path, df.shape)
+
+        >>> # Keep loading when some of the files are broken
+            async for file_path, result in DataLoader.aload_many(paths, return_exceptions=True, return_type='polars'):
+                if isinstance(result, Exception):
+                    print(f'Failed to load {file_path}: {result}')
+        """
+
+        if not isinstance(file_paths, list):
+            raise TypeError(f'file paths must be a list, got {type(file_paths).__name__}')
+
+        if not isinstance(max_workers, (int, type(None))):
+            raise TypeError(f'max workers must be an integer or type None, got {type(max_workers).__name__}')
+
+        if not isinstance(return_exceptions, bool):
+            raise TypeError(f'return_exceptions must be either True or False, got {type(return_exceptions).__name__}')
+
+        if not isinstance(loader_options, (dict, type(None))):
+            raise TypeError(f'loader options must be a dictionary or type None, got {type(loader_options).__name__}')
+
+        loader_options = loader_options or {}
+
+        if max_workers is None:
+            max_workers = config.max_workers
+
+        def load_file(file_path: str) -> pd.DataFrame|pl.DataFrame|pa.Table:
+            return cls(file_path, **loader_options).load_tabular(**kwargs)
+
+        loop = asyncio.get_running_loop()
+
+        # a dedicated pool bounds the number of files in memory, instead of sharing the default executor of the event loop
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # each file is loaded with a copy of the caller's context, so options of config.options() blocks apply to it
+        futures = {
+            loop.run_in_executor(executor, contextvars.copy_context().run, load_file, file_path): str(file_path)
+            for file_path in file_paths}
+        pending = set(futures)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    try:
+                        result = future.result()
+
+                    except Exception as error:
+                        if not return_exceptions:
+                            raise
+
+                        result = error
+
+                    yield futures[future], result
+
+        finally:
+            # cancelling files that have not started loading, when the caller stops early or a file fails
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _validate_return_type(self, return_type: str) -> None:
+        """
+        This is an internal function that checks whether the return type is supported.
+        """
+        if not isinstance(return_type, str):
+            raise TypeError(f'return type must be a string, got {type(return_type).__name__}')
+
+        if return_type not in SUPPORTED_RETURN_TYPES:
+            raise ValueError(f"return_type must either be 'pandas', 'polars' or 'arrow', got '{return_type}'")
+
+    def _convert(self, polars_df: pl.DataFrame, return_type: str, nullable_integers: bool = False) -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        This is an internal function that converts a polars DataFrame to the return type chosen by the user.
+        """
+        if return_type == 'polars':
+            return polars_df
+
+        with self._profiler.stage('conversion'):
+            if return_type == 'arrow':
+                return polars_df.to_arrow()
+
+            return self._to_pandas(polars_df, nullable_integers)
+
+    def _uses_pyarrow_backend(self, df_size: int) -> bool:
+        """
+        This is an internal function that checks whether pandas DataFrame should be backed by pyarrow, depending on the array type.
+        """
         if self.array_type == 'auto':
-            if df_size >= self.conversion_threshold:
-                return polars_df.to_pandas(use_pyarrow_extension_array=True)
-            else:
-                return polars_df.to_pandas()
+            return df_size >= self.conversion_threshold
 
         elif self.array_type == 'numpy':
-            return polars_df.to_pandas()
+            return False
 
         elif self.array_type == 'pyarrow':
-            return polars_df.to_pandas(use_pyarrow_extension_array=True)
+            return True
 
         else:
             raise ValueError(f'Unsupported array type: {self.array_type}')
 
+    def _to_pandas(self, polars_df:pl.DataFrame, nullable_integers: bool = False) -> pd.DataFrame:
+        """
+        This is an internal function that converts a polars DataFrame to pandas, depending on the array type.
+        """
+        # ------ RETURNING ARRAY TYPE DEPENDING ON USER'S CHOICE
+        if self.array_type == 'adaptive':
+            converter = BackendConverter(polars_df)
+            pandas_df = converter.polars_to_pandas(array_type='adaptive')
+
+            self.backend_report = converter.backend_report
+
+            return pandas_df
+
+        if self._uses_pyarrow_backend(polars_df.height):
+            return polars_df.to_pandas(use_pyarrow_extension_array=True)
+
+        pandas_df = polars_df.to_pandas()
+
+        if nullable_integers:
+            # numpy integers cannot hold nulls, so integer columns with nulls are Arrow backed instead of becoming float64
+            for column, dtype in polars_df.schema.items():
+                if dtype.is_integer() and polars_df.get_column(column).null_count() > 0:
+                    pandas_df[column] = polars_df.get_column(column).to_pandas(use_pyarrow_extension_array=True)
+
+        return pandas_df
+
+    def _read_arrow(self, file_path: Path, **kwargs:dict) -> pa.Table:
+        """
+        This is an internal function that reads an Arrow IPC (Feather) or ORC file into a pyarrow Table.
+        """
+        if self.file_type == 'orc':
+            try:
+                import pyarrow.orc as orc
+
+            except ImportError:
+                raise ImportError("ORC file support requires pyarrow built with ORC support.")
+
+            # passing columns to ORC reader, so only those columns are read from the file
+            return orc.read_table(file_path, **kwargs)
+
+        import pyarrow.feather as feather
+
+        try:
+            # memory mapping the file, so data is paged in from disk only when it is accessed
+            return feather.read_table(file_path, memory_map=True, **kwargs)
+
+        except pa.ArrowInvalid:
+            # .arrow files can also be written in the IPC streaming format
+            with pa.ipc.open_stream(pa.memory_map(str(file_path), 'r')) as reader:
+                arrow_table = reader.read_all()
+
+            columns = kwargs.get('columns')
+
+            return arrow_table.select(columns) if columns is not None else arrow_table
+
+    def _read_polars(self, load_csv_as_string:bool = False, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that reads all of the files into a single polars DataFrame.
+        """
+        self.malformed_records = []
+
+        if self.root_path is None:
+            with self._profiler.stage('parse'):
+                return self._read_file(self.file_path, load_csv_as_string=load_csv_as_string, **kwargs)
+
+        def read_partition(file_path: Path) -> pl.DataFrame:
+            # timing every file on its own thread, so retries of a file are not counted as parsing
+            with self._profiler.stage('parse'):
+                polars_df = self._read_file(file_path, load_csv_as_string=load_csv_as_string, **kwargs)
+
+            return self._add_partitions(polars_df, file_path)
+
+        # reading files in parallel, since polars readers release the GIL while parsing
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            polars_dfs = list(executor.map(read_partition, self.file_paths))
+
+        logger.info(f'Combining {len(polars_dfs)} {self.file_type} files into a single DataFrame.')
+
+        # combining files only once, columns missing from some files are filled with nulls
+        return pl.concat(polars_dfs, how='diagonal_relaxed', rechunk=False)
+
+    def _add_partitions(self, polars_df: pl.DataFrame|pl.LazyFrame, file_path: Path) -> pl.DataFrame|pl.LazyFrame:
+        """
+        This is an internal function that adds hive partitions (key=value directories) of a file as columns.
+        """
+        existing_columns = polars_df.collect_schema().names()
+
+        partitions = {
+            key: value for key, value in _hive_partitions(file_path, self.root_path).items()
+            if key not in existing_columns}
+
+        if not partitions:
+            return polars_df
+
+        return polars_df.with_columns(pl.lit(value, dtype=pl.String).alias(key) for key, value in partitions.items())
+
+    def _read_file(self, file_path: Path, load_csv_as_string:bool = False, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that reads a single file into a polars DataFrame, depending on the file type.
+        """
+        # ----- LOADING POLARS DATAFRAMES DEPENDING ON FILE TYPE ------
+
+        if self.file_type in ['csv','txt']:
+
+            if load_csv_as_string:
+                logger.info('Loading csv with string datatype.')
+
+                with _open_source(file_path) as source:
+                    polars_df = pl.read_csv(source, infer_schema_length=0, **kwargs)
+
+            else:
+                schema_overrides = dict(kwargs.pop('schema_overrides', None) or {})
+
+                try:
+                    # load the file with schema inference
+                    with _open_source(file_path) as source:
+                        polars_df = pl.read_csv(source, schema_overrides=schema_overrides or None, **kwargs)
+
+                    # if polars throw Compute Error
+                except pl.exceptions.ComputeError as error:
+                    
+                    if 'CSV parsing' in str(error) or parse_error_column(error) is not None:
+                        polars_df = self._read_csv_progressively(file_path, schema_overrides, **kwargs)
+
+                    else:
+                        raise
+
+        elif self.file_type == 'parquet':
+            polars_df = pl.read_parquet(file_path, **kwargs)
+
+        elif self.file_type in ARROW_FILE_TYPES:
+            polars_df = pl.from_arrow(self._read_arrow(file_path, **kwargs), rechunk=False)
+
+        elif self.file_type == 'json':
+            try:
+                with _open_source(file_path) as source:
+                    polars_df = pl.read_json(source, **kwargs)
+            
+            except pl.exceptions.ComputeError:
+
+                logger.info("Encountered an issue while reading JSON. Loading JSON record by record.")
+
+                polars_df = self._read_json_leniently(file_path)
+
+        elif self.file_type in NDJSON_FILE_TYPES:
+            try:
+                with _open_source(file_path) as source:
+                    polars_df = pl.read_ndjson(source, **kwargs)
+
+            except pl.exceptions.ComputeError:
+
+                logger.info("Encountered an issue while reading NDJSON. Loading NDJSON line by line.")
+
+                polars_df = self._read_json_leniently(file_path)
+
+        elif self.file_type in ['xlsx', 'xls']:
+            _import_fastexcel()
+
+            polars_df = pl.read_excel(file_path, **kwargs)
+
+        return polars_df
+
+    def _read_json_leniently(self, file_path: Path) -> pl.DataFrame:
+        """
+        This is an internal function that reads a JSON or NDJSON file record by record, repairing or skipping malformed records.
+        """
+        malformed_records = []
+
+        self._profiler.count('fallback_retries')
+
+        with self._profiler.stage('fallback'):
+            if self.file_type in NDJSON_FILE_TYPES:
+                with _open_text(file_path) as stream:
+                    polars_df = records_to_polars(iter_json_lines(stream, malformed_records))
+
+            else:
+                with _open_text(file_path) as stream:
+                    is_array = is_json_array(stream)
+
+                with _open_text(file_path) as stream:
+                    if is_array:
+                        polars_df = records_to_polars(iter_json_records(stream, malformed_records))
+                    else:
+                        # a single JSON object (e.g: {"column": [values]}) cannot be split into records, hence parsing it at once
+                        polars_df = pl.DataFrame(json5.loads(stream.read()))
+
+        self._track_malformed_records(file_path, malformed_records)
+
+        return polars_df
+
+    def _track_malformed_records(self, file_path: Path, malformed_records: list) -> None:
+        """
+        This is an internal function that keeps track of JSON records that were skipped while reading a file.
+        """
+        if not malformed_records:
+            return
+
+        logger.info(f'Skipped {len(malformed_records)} malformed records in {file_path.name}. See DataLoader.malformed_records for details.')
+
+        self.malformed_records.extend({'file': str(file_path), **record} for record in malformed_records)
+
+    def _read_csv_progressively(self, file_path: Path, schema_overrides: dict, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that reads a CSV file that failed to parse, by sampling its schema and widening only the columns that fail.
+        """
+        schema_overrides = dict(schema_overrides)
+
+        # compressed files cannot be sampled at byte offsets
+        if _detect_compression(file_path) is None:
+            logger.info("Schema inference issue. Inferring schema from the head, middle and tail of the CSV.")
+
+            with self._profiler.stage('schema_inference'):
+                # columns passed by the user take priority over sampled columns
+                schema_overrides = {**sample_csv_schema(file_path, **kwargs), **schema_overrides}
+
+        while True:
+            self._profiler.count('fallback_retries')
+
+            try:
+                with self._profiler.stage('fallback'), _open_source(file_path) as source:
+                    return pl.read_csv(source, schema_overrides=schema_overrides or None, **kwargs)
+
+            except pl.exceptions.ComputeError as error:
+
+                parsed_error = parse_error_column(error)
+
+                if parsed_error is None:
+                    if 'CSV parsing' in str(error):
+                        break
+                    raise
+
+                column, value, dtype = parsed_error
+
+                widened_dtype = widen_dtype(value, dtype)
+
+                # column cannot be widened any further
+                if schema_overrides.get(column) == widened_dtype:
+                    break
+
+                logger.info(f"Widening column '{column}' from {dtype} to {widened_dtype} after failing to parse '{value}'.")
+
+                schema_overrides[column] = widened_dtype
+
+        logger.info("Schema could not be resolved. Loading CSV without schema inference.")
+
+        self._profiler.count('fallback_retries')
+
+        with self._profiler.stage('fallback'), _open_source(file_path) as source:
+            return pl.read_csv(source, infer_schema_length=None, **kwargs)
+
+    def load_sheets(
+            self,
+            sheets: str|list = 'all',
+            sheet_column: str|None = None,
+            n_rows: int|None = None,
+            return_type: str = 'pandas',
+            **kwargs:dict) -> dict[str, pd.DataFrame|pl.DataFrame|pa.Table]|pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        Use this function for loading multiple sheets of an excel workbook at once.
+
+        Parameters
+        ------------
+        sheets: str or list, optional
+
+            'all' for loading every sheet of the workbook, or a list of sheet names and/or sheet indexes, default is 'all'.
+
+        sheet_column: str, optional
+
+            Name of a column holding the sheet name of each row, default is None.
+            If passed, all sheets are combined into a single DataFrame, otherwise a dictionary of DataFrames is returned.
+
+        n_rows: int, optional
+
+            Maximum number of rows read from each sheet, default is None (all rows). Useful for a quick preview of large workbooks.
+
+        return_type: str, optional
+
+            Type of DataFrame returned for each sheet, 'pandas', 'polars' or 'arrow', default is 'pandas'.
+
+        kwargs: dict, optional
+
+            Extra arguments you want to pass into fastexcel's load_sheet (e.g: header_row, use_columns or dtypes).
+
+        Returns
+        ---------
+        dict[str, pd.DataFrame] | pd.DataFrame
+
+            A dictionary of sheet names and DataFrames, or a single DataFrame if sheet_column is passed.
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function for workbooks with many sheets, instead of calling load_tabular() once for every sheet.
+            - Sheets are read in parallel on a thread pool (see max_workers), and the workbook is opened once per thread instead of once per sheet.
+
+        Considerations
+        ---------------
+
+            - Sheets combined with sheet_column may have different columns. Columns missing from a sheet are filled with nulls.
+            - Requires 'fastexcel', which can be installed with: pip install datalabx[excel]
+
+        Example
+        --------
+        >>> # Load every sheet of a workbook as a dictionary of DataFrames
+            sheets = DataLoader('finance.xlsx').load_sheets()
+
+        >>> # Load 2 sheets as a single DataFrame with a 'sheet' column
+            df = DataLoader('finance.xlsx').load_sheets(sheets=['January', 'February'], sheet_column='sheet')
+
+        >>> # Preview the first 10 rows of every sheet
+            previews = DataLoader('finance.xlsx', max_workers=8).load_sheets(n_rows=10)
+        """
+
+        if self.file_type not in ['xlsx', 'xls']:
+            raise ValueError(f'load_sheets only supports excel files, got a {self.file_type} file.')
+
+        if self.root_path is not None:
+            raise ValueError('load_sheets only supports a single excel file, got a directory or a glob pattern.')
+
+        if not isinstance(sheets, (str, list)):
+            raise TypeError(f"sheets must be 'all' or a list of sheet names and indexes, got {type(sheets).__name__}")
+
+        if isinstance(sheets, str) and sheets != 'all':
+            raise ValueError(f"sheets must be 'all' or a list of sheet names and indexes, got '{sheets}'")
+
+        if not isinstance(sheet_column, (str, type(None))):
+            raise TypeError(f'sheet column must be a string or type None, got {type(sheet_column).__name__}')
+
+        if not isinstance(n_rows, (int, type(None))):
+            raise TypeError(f'n_rows must be an integer or type None, got {type(n_rows).__name__}')
+
+        if n_rows is not None and n_rows <= 0:
+            raise ValueError(f'n_rows must be greater than 0, got {n_rows}')
+
+        self._validate_return_type(return_type)
+
+        fastexcel = _import_fastexcel()
+
+        sheet_names = fastexcel.read_excel(self.file_path).sheet_names
+
+        # ---- RESOLVING SHEET NAMES AND INDEXES ------
+
+        if sheets == 'all':
+            selected_sheets = sheet_names
+        else:
+            selected_sheets = []
+
+            for sheet in sheets:
+                if isinstance(sheet, int) and not isinstance(sheet, bool):
+                    if not -len(sheet_names) <= sheet < len(sheet_names):
+                        raise ValueError(f'Sheet index {sheet} is out of range, the workbook has {len(sheet_names)} sheets.')
+
+                    selected_sheets.append(sheet_names[sheet])
+
+                elif isinstance(sheet, str):
+                    if sheet not in sheet_names:
+                        raise ValueError(f"Sheet '{sheet}' not found. Available sheets are: {', '.join(sheet_names)}")
+
+                    selected_sheets.append(sheet)
+
+                else:
+                    raise TypeError(f'sheets must only contain sheet names or indexes, got {type(sheet).__name__}')
+
+        # ---- READING SHEETS IN PARALLEL ------
+
+        thread_readers = threading.local()
+
+        def read_sheet(sheet_name: str) -> pl.DataFrame:
+            # fastexcel readers cannot be shared between threads, hence every thread opens the workbook once
+            if not hasattr(thread_readers, 'reader'):
+                thread_readers.reader = fastexcel.read_excel(self.file_path)
+
+            return thread_readers.reader.load_sheet(sheet_name, n_rows=n_rows, **kwargs).to_polars()
+
+        logger.info(f'Loading {len(selected_sheets)} sheets from {self.file_path.name}.')
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            polars_dfs = dict(zip(selected_sheets, executor.map(read_sheet, selected_sheets)))
+
+        if sheet_column is None:
+            return {sheet_name: self._convert(polars_df, return_type) for sheet_name, polars_df in polars_dfs.items()}
+
+        if any(sheet_column in polars_df.columns for polars_df in polars_dfs.values()):
+            raise ValueError(f"sheet column '{sheet_column}' already exists in the workbook, pass a different sheet_column.")
+
+        # combining sheets only once, columns missing from some sheets are filled with nulls
+        polars_df = pl.concat(
+            [polars_df.select(pl.lit(sheet_name, dtype=pl.String).alias(sheet_column), pl.all())
+             for sheet_name, polars_df in polars_dfs.items()],
+            how='diagonal_relaxed')
+
+        self.schema = dict(polars_df.schema)
+
+        return self._convert(polars_df, return_type)
+
+    def load_sample(
+            self,
+            n_rows: int = 100_000,
+            method: str = 'random',
+            seed: int|None = None,
+            return_type: str = 'pandas',
+            **kwargs:dict) -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        Use this function for loading a sample of rows from a large file, without parsing the whole file.
+
+        Parameters
+        ------------
+        n_rows: int, optional
+
+            Number of rows in the sample, default is 100000.
+
+        method: str, optional
+
+            How rows are picked, default is 'random'.
+
+            Options are:
+
+            - 'head' -> the first n_rows rows
+            - 'random' -> n_rows rows picked at random
+            - 'systematic' -> n_rows evenly spaced rows, starting at a random offset
+
+        seed: int, optional
+
+            Seed of the random number generator, for getting the same sample again, default is None.
+
+        return_type: str, optional
+
+            Type of DataFrame returned, 'pandas', 'polars' or 'arrow', default is 'pandas'.
+
+        kwargs: dict, optional
+
+            Extra arguments you want to pass into the file readers, with the same names as polars readers (e.g: separator or columns).
+            Files that are streamed (e.g: compressed CSV files) support the options listed in iter_batches().
+
+        Returns
+        ---------
+        pd.DataFrame | pl.DataFrame | pa.Table
+
+            A DataFrame with at most n_rows rows, in the order they appear in the file.
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function for a first pass of diagnosis (e.g: DirtyDataDiagnosis) on files with hundreds of millions of rows.
+            - Prefer 'random' or 'systematic' over 'head', since the first rows of a file are often not representative (e.g: sorted by date).
+
+        Considerations
+        ---------------
+
+            - CSV and TXT files are sampled by seeking to byte offsets, so only the sampled lines are read. Lines following long lines are
+              slightly more likely to be picked, and quoted values spanning multiple lines are not supported by seeking.
+            - Parquet files are sampled by row groups: whole row groups are picked from the file metadata, and rows are sampled within them.
+              Rows of the same row group are read together, so the sample is less spread out than a truly random sample.
+            - Compressed, NDJSON, Arrow IPC and ORC files cannot be seeked, so they are streamed once in batches with reservoir sampling.
+              Systematic samples of those files are streamed twice, since the number of rows must be known first.
+            - JSON and Excel files have no batched reader, so they are read at once and then sampled.
+
+        Example
+        --------
+        >>> # Load a random sample of 300000 rows from a very large CSV file
+            df = DataLoader('large_dataset.csv').load_sample(n_rows=300_000, seed=42)
+
+        >>> # Load every n-th row of a parquet file
+            df = DataLoader('large_dataset.parquet').load_sample(n_rows=50_000, method='systematic')
+        """
+
+        if not isinstance(n_rows, int):
+            raise TypeError(f'n_rows must be an integer, got {type(n_rows).__name__}')
+
+        if n_rows <= 0:
+            raise ValueError(f'n_rows must be greater than 0, got {n_rows}')
+
+        if not isinstance(method, str):
+            raise TypeError(f'method must be a string, got {type(method).__name__}')
+
+        if method not in ['head', 'random', 'systematic']:
+            raise ValueError(f"method must either be 'head', 'random' or 'systematic', got '{method}'")
+
+        if not isinstance(seed, (int, type(None))):
+            raise TypeError(f'seed must be an integer or type None, got {type(seed).__name__}')
+
+        self._validate_return_type(return_type)
+
+        rng = np.random.default_rng(seed)
+
+        is_compressed = any(_detect_compression(file_path) is not None for file_path in self.file_paths)
+
+        # ----- SAMPLING DEPENDING ON FILE TYPE ------
+
+        if method == 'head':
+            if self.file_type in ['csv', 'txt', 'parquet', 'arrow', 'feather', 'ipc', *NDJSON_FILE_TYPES] and not is_compressed:
+                # lazy readers stop reading once enough rows are found
+                polars_df = self.scan_tabular(**kwargs).head(n_rows).collect()
+            else:
+                polars_df = self._head_from_batches(n_rows, **kwargs)
+
+        elif self.file_type == 'parquet':
+            row_groups = parquet_row_groups(self.file_paths, n_rows, method, rng)
+
+            logger.info(f'Sampling {sum(len(groups) for _, groups in row_groups)} parquet row groups.')
+
+            polars_dfs = [
+                self._add_partitions(pl.from_arrow(self._read_row_groups(file_path, groups, **kwargs)), file_path)
+                for file_path, groups in row_groups]
+
+            polars_df = sample_rows(pl.concat(polars_dfs, how='diagonal_relaxed'), n_rows, method, rng)
+
+        elif self.file_type in ['csv', 'txt'] and self.root_path is None and not is_compressed:
+            sampled_csv = sample_csv_lines(self.file_path, n_rows, method, rng)
+
+            if sampled_csv is None:
+                logger.info('CSV file is not much larger than the sample. Reading the whole file.')
+                polars_df = sample_rows(self._read_polars(**kwargs), n_rows, method, rng)
+
+            else:
+                try:
+                    polars_df = pl.read_csv(io.BytesIO(sampled_csv), infer_schema_length=None, **kwargs)
+
+                except pl.exceptions.ComputeError:
+                    # quoted values spanning multiple lines cannot be sampled by seeking
+                    logger.info('Sampled CSV lines could not be parsed. Streaming the file instead.')
+                    polars_df = self._sample_from_batches(n_rows, method, rng, **kwargs)
+
+        elif self.file_type in ['json', 'xlsx', 'xls']:
+            polars_df = sample_rows(self._read_polars(**kwargs), n_rows, method, rng)
+
+        else:
+            polars_df = self._sample_from_batches(n_rows, method, rng, **kwargs)
+
+        logger.info(f'Loaded a {method} sample of {polars_df.height} rows.')
+
+        return self._convert(polars_df, return_type)
+
+    def _read_row_groups(self, file_path: Path, row_groups: list[int], **kwargs:dict) -> pa.Table:
+        """
+        This is an internal function that reads only some of the row groups of a parquet file.
+        """
+        import pyarrow.parquet as pq
+
+        # polars read_parquet options are accepted, like when the head of the file is read with polars
+        return pq.ParquetFile(file_path).read_row_groups(row_groups, **arrow_file_options(['columns'], **kwargs))
+
+    def _head_from_batches(self, n_rows: int, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that streams batches until n_rows rows are read.
+        """
+        polars_dfs = []
+        collected_rows = 0
+
+        for batch in self.iter_batches(batch_rows=min(n_rows, config.chunk_rows), return_type='polars', **kwargs):
+            polars_dfs.append(batch.head(n_rows - collected_rows))
+            collected_rows += polars_dfs[-1].height
+
+            if collected_rows >= n_rows:
+                break
+
+        return pl.concat(polars_dfs, how='diagonal_relaxed')
+
+    def _sample_from_batches(self, n_rows: int, method: str, rng: np.random.Generator, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that samples rows from files that cannot be seeked, by streaming them in batches.
+        """
+        if method == 'random':
+            return reservoir_sample(self.iter_batches(return_type='polars', **kwargs), n_rows, rng)
+
+        # systematic samples need the number of rows, hence counting them in a first pass
+        total_rows = sum(batch.num_rows for batch in self.iter_batches(return_type='arrow', **kwargs))
+
+        if total_rows <= n_rows:
+            return pl.concat(self.iter_batches(return_type='polars', **kwargs), how='diagonal_relaxed')
+
+        positions = systematic_positions(total_rows, n_rows, rng)
+
+        polars_dfs = []
+        rows_seen = 0
+
+        for batch in self.iter_batches(return_type='polars', **kwargs):
+            # positions falling inside this batch
+            start, end = np.searchsorted(positions, [rows_seen, rows_seen + batch.height])
+
+            if end > start:
+                polars_dfs.append(batch[positions[start:end] - rows_seen])
+
+            rows_seen += batch.height
+
+        return pl.concat(polars_dfs, how='diagonal_relaxed')
+
+    def load_new_rows(self, return_type: str = 'pandas', **kwargs:dict) -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        Use this function for loading only the rows appended to a growing CSV or NDJSON file since the previous call.
+
+        Parameters
+        ------------
+        return_type: str, optional
+
+            Type of DataFrame returned, 'pandas', 'polars' or 'arrow', default is 'pandas'.
+
+        kwargs: dict, optional
+
+            Extra arguments you want to pass into the CSV or NDJSON reader (e.g: separator=';').
+
+        Returns
+        ---------
+        pd.DataFrame | pl.DataFrame | pa.Table
+
+            The whole file on the first call, and then only the rows appended since the previous call (an empty DataFrame if there are none).
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function for log-like files that are appended to continuously, and diagnosed again every few minutes.
+            - Keep the same DataLoader between calls, since the byte offset and schema of each file are remembered by the DataLoader.
+
+        Considerations
+        ---------------
+
+            - Only complete lines are read, so a line that is still being written is read by the next call.
+            - New rows are parsed with the schema of the previous rows. Columns holding values that do not fit their type
+              (e.g: 'n/a' in an integer column) are widened, and new NDJSON keys are added as new columns.
+            - Files that shrank or were replaced (e.g: log rotation) are read again from the start.
+            - Compressed files cannot be read from a byte offset, hence are not supported.
+
+        Example
+        --------
+        >>> # Diagnose only the rows appended to a log file every 5 minutes
+            loader = DataLoader('events.csv')
+
+            while True:
+                new_rows = loader.load_new_rows()
+                time.sleep(300)
+        """
+
+        if self.file_type not in ['csv', 'txt', *NDJSON_FILE_TYPES]:
+            raise ValueError(f"load_new_rows only supports csv, txt, jsonl and ndjson files, got {self.file_type}")
+
+        if any(_detect_compression(file_path) is not None for file_path in self.file_paths):
+            raise ValueError("Compressed files cannot be read from a byte offset, hence load_new_rows does not support them.")
+
+        self._validate_return_type(return_type)
+
+        polars_dfs = [self._add_partitions(self._read_new_rows(file_path, **kwargs), file_path) for file_path in self.file_paths]
+
+        polars_df = pl.concat(polars_dfs, how='diagonal_relaxed')
+
+        logger.info(f'Loaded {polars_df.height} new rows.')
+
+        return self._convert(polars_df, return_type)
+
+    def _read_new_rows(self, file_path: Path, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that reads the complete lines appended to a file since the previous call, with the remembered schema.
+        """
+        file_stat = file_path.stat()
+
+        state = self._tail_state.get(file_path)
+
+        # a file that shrank or was replaced by a new file is read again from the start
+        if state is not None and (file_stat.st_ino != state['inode'] or file_stat.st_size < state['offset']):
+            logger.info(f'{file_path.name} was truncated or replaced. Reading it again from the start.')
+            state = None
+
+        start = 0 if state is None else state['offset']
+        end = _complete_lines_end(file_path, file_stat.st_size, start)
+
+        if end == start:
+            return pl.DataFrame(schema=state['schema'] if state is not None else None)
+
+        is_csv = self.file_type in ['csv', 'txt']
+
+        if state is None:
+            if end == file_stat.st_size:
+                # the whole file is complete, hence read with the same fallbacks as load_tabular()
+                polars_df = self._read_file(file_path, **kwargs)
+            else:
+                with open(file_path, 'rb') as file:
+                    polars_df = self._parse_new_rows(file_path, file.read(end), None, 0, **kwargs)
+
+            header = b''
+
+            if is_csv and kwargs.get('has_header', True):
+                with open(file_path, 'rb') as file:
+                    header = file.readline()
+
+            state = self._tail_state[file_path] = {'inode': file_stat.st_ino, 'header': header}
+
+        else:
+            with open(file_path, 'rb') as file:
+                file.seek(start)
+                new_bytes = file.read(end - start)
+
+            polars_df = self._parse_new_rows(file_path, state['header'] + new_bytes, state['schema'], start, **kwargs)
+
+            # keeping the remembered columns and types, and widening them if the new rows do not fit them
+            polars_df = pl.concat([pl.DataFrame(schema=state['schema']), polars_df], how='diagonal_relaxed')
+
+            widened_columns = [column for column, dtype in state['schema'].items() if polars_df.schema[column] != dtype]
+
+            if widened_columns:
+                logger.info(f"New rows do not fit the previous types of {', '.join(widened_columns)}. Widening them.")
+
+        state['offset'] = end
+        state['schema'] = polars_df.schema
+
+        return polars_df
+
+    def _parse_new_rows(self, file_path: Path, new_bytes: bytes, schema: pl.Schema|None, start: int, **kwargs:dict) -> pl.DataFrame:
+        """
+        This is an internal function that parses new lines of a CSV or NDJSON file, falling back to lenient parsing if they do not fit the schema.
+        """
+        if self.file_type in ['csv', 'txt']:
+            user_overrides = kwargs.pop('schema_overrides', None) or {}
+
+            # columns passed by the user take priority over remembered columns
+            schema_overrides = {**(schema or {}), **user_overrides}
+
+            try:
+                return pl.read_csv(io.BytesIO(new_bytes), schema_overrides=schema_overrides or None, **kwargs)
+
+            except pl.exceptions.ComputeError:
+                self._profiler.count('fallback_retries')
+
+                # values that do not fit the remembered schema (e.g: 'n/a' in an integer column) are inferred from every new row,
+                # while columns passed by the user keep their types
+                return pl.read_csv(io.BytesIO(new_bytes), schema_overrides=user_overrides or None, infer_schema_length=None, **kwargs)
+
+        try:
+            return pl.read_ndjson(io.BytesIO(new_bytes), **kwargs)
+
+        except pl.exceptions.ComputeError:
+            logger.info("Encountered an issue while reading new NDJSON lines. Loading them line by line.")
+
+            # counting the lines before the new rows, so malformed records are reported with their line number in the file
+            first_line = 1
+
+            with open(file_path, 'rb') as file:
+                while start > 0 and (chunk := file.read(min(start, 1024**2))):
+                    first_line += chunk.count(b'\n')
+                    start -= len(chunk)
+
+            malformed_records = []
+
+            polars_df = records_to_polars(iter_json_lines(io.StringIO(new_bytes.decode('utf-8')), malformed_records, first_line=first_line))
+
+            self._track_malformed_records(file_path, malformed_records)
+
+            return polars_df
+
+    def scan_tabular(
+            self,
+            columns: list|None = None,
+            filters: pl.Expr|list|None = None,
+            load_csv_as_string: bool = False,
+            **kwargs:dict) -> pl.LazyFrame:
+        """
+        Use this function for building a lazy query plan over your tabular data, without reading the file.
+
+        Parameters
+        ------------
+        columns: list, optional
+
+            A list of columns you wish to read from the file, default is None (all columns).
+
+        filters: pl.Expr or list, optional
+
+            A polars expression (or a list of polars expressions) that rows must satisfy, default is None.
+
+        load_csv_as_string: bool, optional
+
+            Whether you would like to load your data as strings, instead of original datatypes, default is False
+
+        kwargs: dict, optional
+
+            Extra arguments you want to pass into polars file scanners.
+
+        Returns
+        ---------
+        pl.LazyFrame
+
+            A polars LazyFrame, which reads the data only when .collect() is called.
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function when you only need a few columns or a subset of rows from a very large file.
+            - Columns and filters are pushed down to the file reader, so parquet row groups and CSV columns that are not needed are never parsed.
+
+        Considerations
+        ---------------
+
+            - CSV, TXT, NDJSON, Parquet and Arrow IPC files are scanned lazily. JSON, Excel, ORC and compressed files have no lazy reader in polars, so they are read eagerly first.
+            - Malformed NDJSON lines are not repaired while scanning. Use load_tabular() for reading NDJSON files with malformed lines.
+            - Call .collect() on the returned LazyFrame to get a polars DataFrame, and .to_pandas() on it to get a pandas DataFrame.
+
+        Example
+        --------
+        >>> # Read 2 columns of a large parquet file
+            lazy_df = DataLoader('large_dataset.parquet').scan_tabular(columns=['date', 'amount'])
+
+        >>> # Read only the rows of one month
+            lazy_df = DataLoader('large_dataset.parquet').scan_tabular(filters=pl.col('month') == '2026-10')
+
+        >>> # Collect the query plan into a pandas DataFrame
+            df = lazy_df.collect().to_pandas()
+        """
+
+        if not isinstance(columns, (list, type(None))):
+            raise TypeError(f'columns must be a list of strings or type None, got {type(columns).__name__}')
+
+        if not isinstance(filters, (pl.Expr, list, type(None))):
+            raise TypeError(f'filters must be a polars expression, a list of polars expressions or type None, got {type(filters).__name__}')
+
+        if not isinstance(load_csv_as_string, bool):
+            raise TypeError(f'load_as_string must be a boolean, got {type(load_csv_as_string).__name__}')
+
+        # ----- BUILDING POLARS LAZYFRAMES DEPENDING ON FILE TYPE ------
+
+        is_compressed = any(_detect_compression(file_path) is not None for file_path in self.file_paths)
+
+        if self.file_type in ['csv', 'txt', 'parquet', 'arrow', 'feather', 'ipc', *NDJSON_FILE_TYPES] and not is_compressed:
+
+            if load_csv_as_string:
+                logger.info('Scanning csv with string datatype.')
+
+            if self.root_path is None:
+                lazy_df = self._scan_file(self.file_path, load_csv_as_string=load_csv_as_string, **kwargs)
+            else:
+                lazy_dfs = [
+                    self._add_partitions(self._scan_file(file_path, load_csv_as_string=load_csv_as_string, **kwargs), file_path)
+                    for file_path in self.file_paths]
+
+                lazy_df = pl.concat(lazy_dfs, how='diagonal_relaxed')
+
+        else:
+            # JSON, Excel, ORC and compressed files do not have lazy readers, hence reading them eagerly
+            logger.info(f'No lazy reader available for {"compressed " if is_compressed else ""}{self.file_type} files. Reading the file eagerly.')
+
+            if self.file_type == 'orc' and columns is not None:
+                # ORC reader can still skip columns that are not needed
+                kwargs['columns'] = columns
+
+            lazy_df = self._read_polars(load_csv_as_string=load_csv_as_string, **kwargs).lazy()
+
+        # ----- PUSHING DOWN FILTERS AND COLUMNS TO THE READER ------
+
+        if filters is not None:
+            if isinstance(filters, pl.Expr):
+                filters = [filters]
+
+            if not all(isinstance(expression, pl.Expr) for expression in filters):
+                raise TypeError('filters must only contain polars expressions')
+
+            # filtering before selecting, so filters can use columns that are not selected
+            lazy_df = lazy_df.filter(*filters)
+
+        if columns is not None:
+            lazy_df = lazy_df.select(columns)
+
+        return lazy_df
+
+    def _scan_file(self, file_path: Path, load_csv_as_string: bool = False, **kwargs:dict) -> pl.LazyFrame:
+        """
+        This is an internal function that builds a polars LazyFrame over a single file, depending on the file type.
+        """
+        if self.file_type in ['csv', 'txt']:
+
+            if load_csv_as_string:
+                return pl.scan_csv(file_path, infer_schema_length=0, **kwargs)
+
+            return pl.scan_csv(file_path, **kwargs)
+
+        elif self.file_type == 'parquet':
+            return pl.scan_parquet(file_path, **kwargs)
+
+        elif self.file_type in ['arrow', 'feather', 'ipc']:
+            return pl.scan_ipc(file_path, **kwargs)
+
+        elif self.file_type in NDJSON_FILE_TYPES:
+            return pl.scan_ndjson(file_path, **kwargs)
+
+        raise ValueError(f'No lazy reader available for {self.file_type} files.')
+
+    def iter_batches(
+            self,
+            batch_rows: int|None = None,
+            columns: list|None = None,
+            return_type: str = 'pandas',
+            load_csv_as_string: bool = False,
+            **kwargs:dict) -> Iterator[pd.DataFrame|pl.DataFrame|pa.Table]:
+        """
+        Use this function for reading your tabular data in batches of N rows, without loading the whole file in memory.
+
+        Parameters
+        ------------
+        batch_rows: int, optional
+
+            Number of rows in each batch, default is None (config.chunk_rows, which is 100000 unless changed).
+
+        columns: list, optional
+
+            A list of columns you wish to read from the file, default is None (all columns).
+
+        return_type: str, optional
+
+            Type of DataFrame yielded for each batch, default is 'pandas'.
+
+            Options are:
+
+            - 'pandas' -> yields pandas DataFrames (array type follows the DataLoader's array_type)
+            - 'polars' -> yields polars DataFrames
+            - 'arrow' -> yields pyarrow Tables
+
+        load_csv_as_string: bool, optional
+
+            Whether you would like to load your data as strings, instead of original datatypes, default is False
+
+        kwargs: dict, optional
+
+            Extra arguments you want to pass into the file readers, with the same names as polars readers.
+
+            CSV and TXT files are streamed with pyarrow, which supports these polars read_csv options:
+            separator, quote_char, has_header, skip_rows, null_values (a string or a list), encoding, schema_overrides and decimal_comma.
+            pyarrow's read_options, parse_options and convert_options can be passed too.
+
+            NDJSON, JSON and Excel files take the options of their polars readers. Parquet, Arrow IPC and ORC files take no options.
+            Polars options that only tune polars itself (e.g: parallel, low_memory or rechunk) are ignored by pyarrow readers.
+
+        Returns
+        ---------
+        Iterator[pd.DataFrame | pl.DataFrame | pa.Table]
+
+            An iterator of DataFrames with at most batch_rows rows each.
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function when your dataset is larger than the memory available on your machine.
+            - Peak memory stays close to the size of a single batch, instead of roughly twice the size of the file.
+
+        Considerations
+        ---------------
+
+            - CSV and TXT files (including compressed ones) are streamed block by block, Parquet files row group by row group and ORC files stripe by stripe.
+            - NDJSON files (including compressed ones) are streamed batch_rows lines at a time, and column types are inferred for each batch separately.
+            - Arrow IPC files are memory mapped, so batches are only paged in from disk when they are used.
+            - For CSV files, column types are inferred from the first block. Use load_csv_as_string=True if types change further down the file.
+            - JSON and Excel files have no batched reader, so they are read at once and then split into batches.
+            - When loading multiple files, batches do not span across files, so the last batch of each file may be smaller.
+
+        Example
+        --------
+        >>> # Iterate over a large CSV file in batches of 500000 rows
+            for batch in DataLoader('large_dataset.csv').iter_batches(batch_rows=500_000):
+                print(batch.shape)
+
+        >>> # Iterate over 2 columns of a parquet file as polars DataFrames
+            for batch in DataLoader('large_dataset.parquet').iter_batches(columns=['date', 'amount'], return_type='polars'):
+                print(batch.height)
+        """
+
+        if not isinstance(batch_rows, (int, type(None))):
+            raise TypeError(f'batch_rows must be an integer or type None, got {type(batch_rows).__name__}')
+
+        if batch_rows is None:
+            batch_rows = config.chunk_rows
+
+        if batch_rows <= 0:
+            raise ValueError(f'batch_rows must be greater than 0, got {batch_rows}')
+
+        if not isinstance(columns, (list, type(None))):
+            raise TypeError(f'columns must be a list of strings or type None, got {type(columns).__name__}')
+
+        self._validate_return_type(return_type)
+
+        if not isinstance(load_csv_as_string, bool):
+            raise TypeError(f'load_as_string must be a boolean, got {type(load_csv_as_string).__name__}')
+
+        self.malformed_records = []
+
+        if self.file_type in ['csv', 'txt', 'parquet', 'arrow', 'feather', 'ipc', 'orc', *NDJSON_FILE_TYPES]:
+            # streaming files one by one, each file yields its own batches
+            arrow_batches = (
+                (file_path, arrow_table)
+                for file_path in self.file_paths
+                for arrow_table in self._iter_arrow_batches(file_path, batch_rows, columns, load_csv_as_string, **kwargs))
+        else:
+            arrow_batches = (
+                (self.file_path, arrow_table)
+                for arrow_table in self._iter_arrow_batches(self.file_path, batch_rows, columns, load_csv_as_string, **kwargs))
+
+        for file_path, arrow_table in arrow_batches:
+
+            polars_df = pl.from_arrow(arrow_table)
+
+            if self.root_path is not None and self.file_type not in ['json', 'xlsx', 'xls']:
+                polars_df = self._add_partitions(polars_df, file_path)
+
+            yield self._convert(polars_df, return_type)
+
+    def _iter_arrow_batches(
+            self,
+            file_path: Path,
+            batch_rows: int,
+            columns: list|None = None,
+            load_csv_as_string: bool = False,
+            **kwargs:dict) -> Iterator[pa.Table]:
+        """
+        This is an internal function that yields pyarrow Tables of exactly batch_rows rows (except the last one).
+        """
+
+        if self.file_type in ['csv', 'txt']:
+            import pyarrow.csv as pa_csv
+
+            # polars read_csv options (e.g: separator) are translated to pyarrow options
+            csv_options, has_header = arrow_csv_options(**kwargs)
+
+            read_options, convert_options = csv_options['read_options'], csv_options['convert_options']
+
+            if columns is not None:
+                convert_options.include_columns = columns
+
+            if not has_header or load_csv_as_string:
+                # reading only the first block, since pyarrow needs the number of columns for naming them and their names for typing them
+                header_read_options = copy.copy(read_options)
+                header_read_options.autogenerate_column_names = not has_header
+
+                with _open_source(file_path) as source, pa_csv.open_csv(source, read_options=header_read_options, parse_options=csv_options['parse_options']) as header_reader:
+                    column_names = header_reader.schema.names
+
+                if not has_header:
+                    # naming columns like polars, which also makes pyarrow read the first line as a row
+                    column_names = polars_column_names(len(column_names))
+                    read_options.column_names = column_names
+
+                if load_csv_as_string:
+                    logger.info('Streaming csv with string datatype.')
+                    convert_options.column_types = {column: pa.string() for column in column_names}
+
+            def read_csv_batches() -> Iterator[pa.RecordBatch]:
+                # compressed files are decompressed as a stream, block by block
+                with _open_source(file_path) as source:
+                    yield from pa_csv.open_csv(source, **csv_options)
+
+            record_batches = read_csv_batches()
+
+        elif self.file_type == 'parquet':
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(file_path)
+
+            # parquet files are read one row group at a time
+            record_batches = parquet_file.iter_batches(batch_size=batch_rows, columns=columns, **arrow_file_options([], **kwargs))
+
+        elif self.file_type in ['arrow', 'feather', 'ipc']:
+            # record batches of a memory mapped file are read without copying
+            arrow_table = self._read_arrow(file_path, columns=columns, **arrow_file_options([], **kwargs))
+
+            record_batches = arrow_table.to_batches()
+
+        elif self.file_type in NDJSON_FILE_TYPES:
+            # lines are parsed batch_rows at a time, and types may differ between batches, hence not re-slicing them
+            yield from self._iter_ndjson_batches(file_path, batch_rows, columns, **kwargs)
+            return
+
+        elif self.file_type == 'orc':
+            import pyarrow.orc as orc
+
+            # ORC stripes are read without options, so only polars options tuning polars are accepted
+            arrow_file_options([], **kwargs)
+
+            orc_file = orc.ORCFile(file_path)
+
+            # ORC files are read one stripe at a time
+            record_batches = (orc_file.read_stripe(stripe, columns=columns) for stripe in range(orc_file.nstripes))
+
+        else:
+            # JSON and Excel files do not have batched readers, hence reading them at once
+            logger.info(f'No batched reader available for {self.file_type} files. Reading the file at once.')
+
+            polars_df = self._read_polars(load_csv_as_string=load_csv_as_string, **kwargs)
+
+            if columns is not None:
+                polars_df = polars_df.select(columns)
+
+            record_batches = polars_df.to_arrow().to_batches(max_chunksize=batch_rows)
+
+        pending_batches = []
+        pending_rows = 0
+
+        # re-slicing reader batches so that every yielded table has exactly batch_rows rows
+        for record_batch in record_batches:
+
+            pending_batches.append(record_batch)
+            pending_rows += record_batch.num_rows
+
+            while pending_rows >= batch_rows:
+                pending_table = pa.Table.from_batches(pending_batches)
+
+                yield pending_table.slice(0, batch_rows)
+
+                remaining_table = pending_table.slice(batch_rows)
+
+                pending_batches = remaining_table.to_batches()
+                pending_rows = remaining_table.num_rows
+
+        if pending_rows > 0:
+            yield pa.Table.from_batches(pending_batches)
+
+    def _iter_ndjson_batches(self, file_path: Path, batch_rows: int, columns: list|None = None, **kwargs:dict) -> Iterator[pa.Table]:
+        """
+        This is an internal function that yields pyarrow Tables parsed from batch_rows lines of an NDJSON file at a time.
+        """
+        malformed_records = []
+        first_line = 1
+
+        with _open_text(file_path) as stream:
+
+            while lines := list(itertools.islice(stream, batch_rows)):
+
+                try:
+                    polars_df = pl.read_ndjson(io.BytesIO(''.join(lines).encode('utf-8')), **kwargs)
+
+                except pl.exceptions.ComputeError:
+                    polars_df = records_to_polars(iter_json_lines(lines, malformed_records, first_line=first_line))
+
+                first_line += len(lines)
+
+                if columns is not None:
+                    polars_df = polars_df.select(columns)
+
+                yield polars_df.to_arrow()
+
+        self._track_malformed_records(file_path, malformed_records)
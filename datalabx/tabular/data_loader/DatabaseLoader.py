@@ -0,0 +1,372 @@
+"""Loads pandas DataFrame from a SQL query, on a SQLite database or any DB-API connection"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from ..utils.BackendConverter import BackendConverter
+from ..utils.Config import config
+from ..utils.Logger import datalabx_logger
+
+logger = datalabx_logger(name = __name__.split('.')[-1])
+
+# Connection pools of SQLite databases, shared by every DatabaseLoader of the same database
+_CONNECTION_POOLS = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+
+class _ConnectionPool:
+    """
+    Internal pool of read-only SQLite connections, so repeated loads from the same database do not open a new connection every time.
+    """
+
+    def __init__(self, database_path: Path, max_connections: int):
+        self.database_path = database_path
+        self.max_connections = max_connections
+        self.idle_connections = queue.LifoQueue()
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections are handed between threads by the pool, but only used by one thread at a time
+        return sqlite3.connect(f'{self.database_path.as_uri()}?mode=ro', uri=True, check_same_thread=False)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrows an idle connection, or opens a new one if all of them are in use."""
+        try:
+            connection = self.idle_connections.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+
+        try:
+            yield connection
+
+        finally:
+            # keeping at most max_connections idle connections, and closing the rest
+            if self.idle_connections.qsize() < self.max_connections:
+                self.idle_connections.put(connection)
+            else:
+                connection.close()
+
+    def close(self) -> None:
+        """Closes every idle connection of the pool."""
+        while True:
+            try:
+                self.idle_connections.get_nowait().close()
+            except queue.Empty:
+                break
+
+def _connection_pool(database_path: Path, max_connections: int) -> _ConnectionPool:
+    """Returns the connection pool of a SQLite database, creating it on first use."""
+    with _CONNECTION_POOLS_LOCK:
+        pool = _CONNECTION_POOLS.get(database_path)
+
+        if pool is None:
+            pool = _CONNECTION_POOLS[database_path] = _ConnectionPool(database_path, max_connections)
+
+        return pool
+
+def _rows_to_record_batch(rows: list[tuple], column_names: list[str]) -> pa.RecordBatch:
+    """Converts rows fetched from a cursor to an Arrow record batch, column by column instead of row by row."""
+    arrays = []
+
+    for column_values in zip(*rows):
+        try:
+            arrays.append(pa.array(column_values))
+
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # SQLite columns can hold values of different types (e.g: 42 and 'unknown'), which are kept as strings
+            arrays.append(pa.array([None if value is None else str(value) for value in column_values], type=pa.string()))
+
+    return pa.RecordBatch.from_arrays(arrays, names=column_names)
+
+### ------- DATABASE LOADER --------- ###
+
+class DatabaseLoader:
+    """
+    Parameters
+    ------------
+
+    source: str, Path or DB-API connection
+        Path of a SQLite database file, or an open DB-API connection (e.g: psycopg, duckdb or an ADBC connection).
+
+        SQLite databases are opened read-only, and their connections are pooled and reused across DatabaseLoaders.
+        Connections passed by the user are used as they are, and never closed by the DatabaseLoader.
+
+    array_type: str, optional
+
+        Determines the array/backend type used in pandas operations, by default None (config.array_type, which is 'auto' unless changed).
+
+        Options are:
+
+        - 'numpy' -> usual NumPy backend (slower for very large datasets with object types)
+        - 'pyarrow' -> PyArrow backend for better performance on large datasets
+        - 'auto' -> automatically selects backend based on input and dataset size
+        - 'adaptive' -> selects backend for each column separately (strings and integers with nulls -> pyarrow, floats -> numpy)
+
+    conversion_threshold: int, optional
+
+        The number of rows at which the conversion from Polars to pandas switches to Arrow-backed pandas arrays for performance,
+        default is None (config.conversion_threshold, which is 100000 unless changed).
+
+    max_connections: int, optional
+
+        Maximum number of idle SQLite connections kept open for reuse, by default 4.
+    """
+    def __init__(
+        self,
+        source: str|Path|object,
+        array_type: str|None = None,
+        conversion_threshold: int|None = None,
+        max_connections: int = 4):
+
+        if not isinstance(array_type, (str, type(None))):
+            raise TypeError(f'array type must be a string or type None, got {type(array_type).__name__}')
+
+        # options that are not passed fall back to the global config
+        if array_type is None:
+            array_type = config.array_type
+
+        if array_type not in ['numpy', 'pyarrow', 'auto', 'adaptive']:
+            raise ValueError(f"array_type must either be 'numpy', 'pyarrow', 'auto' or 'adaptive', got '{array_type}'")
+
+        if not isinstance(conversion_threshold, (int, type(None))):
+            raise TypeError(f'conversion threshold must be an integer, got {type(conversion_threshold).__name__}')
+
+        if not isinstance(max_connections, int):
+            raise TypeError(f'max connections must be an integer, got {type(max_connections).__name__}')
+
+        if max_connections <= 0:
+            raise ValueError(f'max_connections must be greater than 0, got {max_connections}')
+
+        if isinstance(source, (str, Path)):
+            database_path = Path(source).resolve()
+
+            if not database_path.is_file():
+                raise FileNotFoundError(f"Database {database_path} does not exist.")
+
+            self.connection = None
+            self.pool = _connection_pool(database_path, max_connections)
+
+        elif callable(getattr(source, 'cursor', None)):
+            self.connection = source
+            self.pool = None
+
+        else:
+            raise TypeError(f'source must be a path of a SQLite database or a DB-API connection, got {type(source).__name__}')
+
+        self.array_type = array_type
+        self.conversion_threshold = conversion_threshold if conversion_threshold is not None else config.conversion_threshold
+
+    @contextmanager
+    def _connection(self) -> Iterator[object]:
+        """
+        This is an internal function that yields the user's connection, or a pooled SQLite connection.
+        """
+        if self.pool is None:
+            yield self.connection
+        else:
+            with self.pool.connection() as connection:
+                yield connection
+
+    def _iter_record_batches(self, query: str, params: tuple|list|dict|None, chunk_rows: int) -> Iterator[pa.RecordBatch]:
+        """
+        This is an internal function that runs a query, and yields its results as Arrow record batches of at most chunk_rows rows.
+        """
+        with self._connection() as connection:
+            cursor = connection.cursor()
+
+            try:
+                if params is None:
+                    cursor.execute(query)
+                else:
+                    cursor.execute(query, params)
+
+                # ADBC cursors return Arrow data natively, without building python objects
+                if callable(getattr(cursor, 'fetch_record_batch', None)):
+                    # drivers choose their own batch sizes, so larger batches are sliced (without copying) to chunk_rows
+                    for batch in cursor.fetch_record_batch():
+                        for offset in range(0, max(batch.num_rows, 1), chunk_rows):
+                            yield batch.slice(offset, chunk_rows)
+                    return
+
+                column_names = [description[0] for description in cursor.description or []]
+
+                fetched_rows = 0
+
+                while rows := cursor.fetchmany(chunk_rows):
+                    fetched_rows += len(rows)
+                    yield _rows_to_record_batch(rows, column_names)
+
+                # queries without results still return their column names
+                if fetched_rows == 0:
+                    yield pa.RecordBatch.from_arrays([pa.nulls(0) for _ in column_names], names=column_names)
+
+            finally:
+                cursor.close()
+
+    def _convert(self, polars_df: pl.DataFrame, return_type: str) -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        This is an internal function that converts a polars DataFrame to the return type chosen by the user.
+        """
+        if return_type == 'polars':
+            return polars_df
+
+        elif return_type == 'arrow':
+            return polars_df.to_arrow()
+
+        return BackendConverter(polars_df).polars_to_pandas(array_type=self.array_type, conversion_threshold=self.conversion_threshold)
+
+    def _validate_query(self, query: str, params: tuple|list|dict|None, chunk_rows: int, return_type: str) -> None:
+        """
+        This is an internal function that validates the arguments of a query.
+        """
+        if not isinstance(query, str):
+            raise TypeError(f'query must be a string, got {type(query).__name__}')
+
+        if not isinstance(params, (tuple, list, dict, type(None))):
+            raise TypeError(f'params must be a tuple, a list, a dictionary or type None, got {type(params).__name__}')
+
+        if not isinstance(chunk_rows, int):
+            raise TypeError(f'chunk_rows must be an integer or type None, got {type(chunk_rows).__name__}')
+
+        if chunk_rows <= 0:
+            raise ValueError(f'chunk_rows must be greater than 0, got {chunk_rows}')
+
+        if not isinstance(return_type, str):
+            raise TypeError(f'return type must be a string, got {type(return_type).__name__}')
+
+        if return_type not in ['pandas', 'polars', 'arrow']:
+            raise ValueError(f"return_type must either be 'pandas', 'polars' or 'arrow', got '{return_type}'")
+
+    def load_query(
+            self,
+            query: str,
+            params: tuple|list|dict|None = None,
+            chunk_rows: int|None = None,
+            return_type: str = 'pandas') -> pd.DataFrame|pl.DataFrame|pa.Table:
+        """
+        Use this function for loading the results of a SQL query as a pandas DataFrame.
+
+        Parameters
+        ------------
+        query: str
+
+            The SQL query to run.
+
+        params: tuple, list or dict, optional
+
+            Parameters of the query, passed to cursor.execute() (e.g: (2026,) for 'WHERE year = ?'), default is None.
+
+        chunk_rows: int, optional
+
+            Number of rows fetched from the database at a time, default is None (config.chunk_rows, which is 100000 unless changed).
+
+        return_type: str, optional
+
+            Type of DataFrame returned, 'pandas', 'polars' or 'arrow', default is 'pandas'.
+
+        Returns
+        ---------
+        pd.DataFrame | pl.DataFrame | pa.Table
+
+            The results of the query.
+
+        Usage Recommendation
+        ---------------------
+
+            - Use this function instead of pd.read_sql, which builds python objects row by row for the whole result.
+            - Rows are fetched chunk_rows at a time and converted to Arrow column by column, so python objects of one chunk at most are held at once.
+
+        Considerations
+        ---------------
+
+            - SQLite columns holding values of different types (e.g: 42 and 'unknown') are loaded as strings, so they can be cleaned afterwards.
+            - Column types are inferred for each chunk, and chunks are combined into their common type.
+
+        Example
+        --------
+        >>> # Load a table from a SQLite export
+            df = DatabaseLoader('exports.sqlite').load_query('SELECT * FROM customers')
+
+        >>> # Load a query with parameters as a polars DataFrame
+            df = DatabaseLoader('exports.sqlite').load_query('SELECT * FROM orders WHERE year = ?', params=(2026,), return_type='polars')
+
+        >>> # Load a query from an existing DB-API connection
+            df = DatabaseLoader(connection).load_query('SELECT id, amount FROM payments')
+        """
+
+        # chunk size that is not passed falls back to the global config
+        if chunk_rows is None:
+            chunk_rows = config.chunk_rows
+
+        self._validate_query(query, params, chunk_rows, return_type)
+
+        polars_dfs = [pl.from_arrow(record_batch) for record_batch in self._iter_record_batches(query, params, chunk_rows)]
+
+        # combining chunks only once, chunks with different types are combined into their common type
+        polars_df = pl.concat(polars_dfs, how='diagonal_relaxed')
+
+        logger.info(f'Loaded {polars_df.height} rows and {polars_df.width} columns from the database.')
+
+        return self._convert(polars_df, return_type)
+
+    def iter_query(
+            self,
+            query: str,
+            params: tuple|list|dict|None = None,
+            chunk_rows: int|None = None,
+            return_type: str = 'pandas') -> Iterator[pd.DataFrame|pl.DataFrame|pa.Table]:
+        """
+        Use this function for reading the results of a SQL query in chunks of N rows, without loading all of them in memory.
+
+        Parameters
+        ------------
+        query: str
+
+            The SQL query to run.
+
+        params: tuple, list or dict, optional
+
+            Parameters of the query, passed to cursor.execute(), default is None.
+
+        chunk_rows: int, optional
+
+            Number of rows in each chunk, default is None (config.chunk_rows, which is 100000 unless changed).
+
+        return_type: str, optional
+
+            Type of DataFrame yielded for each chunk, 'pandas', 'polars' or 'arrow', default is 'pandas'.
+
+        Returns
+        ---------
+        Iterator[pd.DataFrame | pl.DataFrame | pa.Table]
+
+            An iterator of DataFrames with at most chunk_rows rows each.
+
+        Considerations
+        ---------------
+
+            - The connection stays borrowed from the pool until the iterator is exhausted or closed.
+            - Column types are inferred for each chunk separately, so they may differ between chunks.
+
+        Example
+        --------
+        >>> # Diagnose a large table chunk by chunk
+            for chunk in DatabaseLoader('exports.sqlite').iter_query('SELECT * FROM events', chunk_rows=500_000):
+                print(chunk.shape)
+        """
+
+        # chunk size that is not passed falls back to the global config
+        if chunk_rows is None:
+            chunk_rows = config.chunk_rows
+
+        self._validate_query(query, params, chunk_rows, return_type)
+
+        for record_batch in self._iter_record_batches(query, params, chunk_rows):
+            yield self._convert(pl.from_arrow(record_batch), return_type)
@@ -0,0 +1,271 @@
+"""Reads JSON and newline delimited JSON leniently, record by record, so one malformed record does not fail the whole file."""
+
+import json
+import re
+from typing import Iterable, Iterator, TextIO
+
+import json5
+import polars as pl
+
+# Number of characters read from the file at a time
+CHUNK_CHARS = 1024 * 1024
+
+# Number of records converted to a polars DataFrame at a time
+RECORDS_PER_FRAME = 50_000
+
+# Maximum number of characters of a malformed record kept for reporting
+MALFORMED_TEXT_CHARS = 200
+
+# Characters that can change the nesting depth of a record, or start a string or a comment
+RECORD_TOKEN_PATTERN = re.compile(r'["\'{}\[\],]|//|/\*')
+
+def _skip_string(buffer: str, position: int, quote: str) -> int|None:
+    """Returns the position after the closing quote of a string starting at position, or None if the string is not complete."""
+    content_start = position
+
+    while True:
+        quote_position = buffer.find(quote, position)
+
+        if quote_position == -1:
+            return None
+
+        # counting backslashes before the quote, an odd number means the quote is escaped
+        backslashes = 0
+        while quote_position - backslashes - 1 >= content_start and buffer[quote_position - backslashes - 1] == '\\':
+            backslashes += 1
+
+        if backslashes % 2 == 0:
+            return quote_position + 1
+
+        position = quote_position + 1
+
+def _skip_comment(buffer: str, position: int) -> int|None:
+    """Returns the position after a // or /* comment starting at position, or None if the comment is not complete."""
+    if buffer.startswith('//', position):
+        newline = buffer.find('\n', position)
+        return None if newline == -1 else newline + 1
+
+    comment_end = buffer.find('*/', position + 2)
+    return None if comment_end == -1 else comment_end + 2
+
+def _find_record_end(buffer: str, position: int) -> int|None:
+    """
+    Returns the position after the record of a JSON array starting at position, or None if the record is not complete.
+
+    Strings (single or double quoted) and comments are skipped, so brackets inside them do not change the nesting depth.
+    """
+    depth = 0
+
+    while True:
+        match = RECORD_TOKEN_PATTERN.search(buffer, position)
+
+        if match is None:
+            return None
+
+        token = match.group()
+        position = match.end()
+
+        if token in ('"', "'"):
+            position = _skip_string(buffer, position, token)
+
+        elif token in ('//', '/*'):
+            position = _skip_comment(buffer, match.start())
+
+        elif token in '{[':
+            depth += 1
+
+        elif token in '}]':
+            depth -= 1
+
+            if depth == 0:
+                return position
+
+            # closing bracket of the array itself, after a record that is not an object or an array
+            if depth < 0:
+                return match.start()
+
+        elif depth == 0:
+            return match.start()
+
+        if position is None:
+            return None
+
+def _skip_separators(buffer: str, position: int) -> int|None:
+    """Returns the position of the next record after whitespace, commas and comments, or None if more data is needed."""
+    while position < len(buffer):
+        character = buffer[position]
+
+        if character.isspace() or character == ',' or character == '\ufeff':
+            position += 1
+
+        elif buffer.startswith('//', position) or buffer.startswith('/*', position):
+            position = _skip_comment(buffer, position)
+
+            if position is None:
+                return None
+
+        elif character == '/' and position == len(buffer) - 1:
+            # a comment may start at the end of the buffer
+            return None
+
+        else:
+            return position
+
+    return None
+
+def _parse_record(text: str) -> object:
+    """Parses a single record as strict JSON, and repairs it with json5 (trailing commas, single quotes, comments) if it fails."""
+    try:
+        return json.loads(text)
+
+    except json.JSONDecodeError:
+        return json5.loads(text)
+
+def is_json_array(stream: TextIO) -> bool:
+    """Checks whether a JSON file starts with an array, skipping whitespace and comments. The stream is read from its start."""
+    buffer = stream.read(CHUNK_CHARS)
+
+    while True:
+        position = _skip_separators(buffer, 0)
+
+        if position is not None:
+            return buffer[position] == '['
+
+        chunk = stream.read(CHUNK_CHARS)
+
+        if not chunk:
+            return False
+
+        buffer += chunk
+
+def iter_json_records(stream: TextIO, malformed_records: list) -> Iterator[object]:
+    """
+    Yields the records of a JSON array one by one, without parsing the whole file at once.
+
+    Valid records are parsed with the json module, records with trailing commas, single quotes or comments are repaired with json5,
+    and records that cannot be repaired are appended to malformed_records as {'record': number, 'text': text} and skipped.
+    """
+    decoder = json.JSONDecoder()
+
+    buffer = ''
+    position = 0
+    end_of_file = False
+
+    def read_more() -> bool:
+        nonlocal buffer, position, end_of_file
+
+        chunk = stream.read(CHUNK_CHARS)
+
+        if not chunk:
+            end_of_file = True
+            return False
+
+        # dropping consumed records, so the buffer stays close to the chunk size
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        return True
+
+    read_more()
+
+    # skipping everything before the opening bracket of the array
+    while (start := _skip_separators(buffer, position)) is None:
+        if not read_more():
+            return
+
+    position = start + 1
+
+    record_number = 0
+
+    while True:
+        start = _skip_separators(buffer, position)
+
+        if start is None:
+            if read_more():
+                continue
+            return
+
+        position = start
+
+        if buffer[position] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(buffer) and not end_of_file:
+                read_more()
+                continue
+
+        except json.JSONDecodeError:
+            end = _find_record_end(buffer, position)
+
+            if end is None:
+                if read_more():
+                    continue
+
+                # record is never closed, hence the rest of the file is the record
+                end = len(buffer)
+
+            text = buffer[position:end]
+
+            try:
+                record = json5.loads(text)
+
+            except ValueError:
+                malformed_records.append({'record': record_number, 'text': text.strip()[:MALFORMED_TEXT_CHARS]})
+
+                record_number += 1
+                position = end
+                continue
+
+        record_number += 1
+        position = end
+
+        yield record
+
+def iter_json_lines(lines: Iterable[str], malformed_records: list, first_line: int = 1) -> Iterator[object]:
+    """
+    Yields the records of a newline delimited JSON file line by line.
+
+    Lines that cannot be parsed even after being repaired with json5 are appended to malformed_records as
+    {'record': line number, 'text': text} and skipped. Empty lines and comment lines are ignored.
+    """
+    for line_number, line in enumerate(lines, start=first_line):
+
+        text = line.strip()
+
+        if not text or text.startswith('//'):
+            continue
+
+        try:
+            yield _parse_record(text)
+
+        except ValueError:
+            malformed_records.append({'record': line_number, 'text': text[:MALFORMED_TEXT_CHARS]})
+
+def records_to_polars(records: Iterator[object], records_per_frame: int = RECORDS_PER_FRAME) -> pl.DataFrame:
+    """
+    Converts records into a polars DataFrame a few at a time, so all of the records are never held as python objects at once.
+
+    Records that are not objects are placed in a 'column_0' column.
+    """
+    polars_dfs = []
+    pending_records = []
+
+    def flush() -> None:
+        # values of different types in the same column are converted to their common supertype
+        polars_dfs.append(pl.from_dicts(pending_records, infer_schema_length=None, strict=False))
+        pending_records.clear()
+
+    for record in records:
+        pending_records.append(record if isinstance(record, dict) else {'column_0': record})
+
+        if len(pending_records) >= records_per_frame:
+            flush()
+
+    if pending_records or not polars_dfs:
+        flush()
+
+    return pl.concat(polars_dfs, how='diagonal_relaxed')
@@ -0,0 +1,111 @@
+"""Measures where the time and memory of loading a file are spent."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# Seconds between two samples of the resident memory of the process
+MEMORY_SAMPLE_INTERVAL = 0.005
+
+def _resident_memory() -> int|None:
+    """Returns the resident memory of the process in bytes, or None if it cannot be read (e.g: outside of Linux)."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    except (OSError, ValueError, AttributeError):
+        return None
+
+class LoadProfiler:
+    """
+    Initializing the Load Profiler.
+
+    Parameters
+    -----------
+    track_memory: bool, optional
+        Whether the resident memory of the process is sampled on a background thread, to find the peak memory of the load, by default False.
+    """
+
+    def __init__(self, track_memory: bool = False):
+
+        if not isinstance(track_memory, bool):
+            raise TypeError(f'track_memory must be either True or False, got {type(track_memory).__name__}')
+
+        self.track_memory = track_memory
+
+        self.timings = {}
+        self.counters = {}
+
+        self.start_memory = None
+        self.peak_memory = None
+
+        self._lock = threading.Lock()
+        self._thread_stages = threading.local()
+
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Adds the time spent inside the block to the stage.
+
+        Time spent in stages nested inside the block (on the same thread) only counts towards the nested stage.
+        Stages running on multiple threads at once are summed, so they can add up to more than the wall time.
+        """
+        stages = self._thread_stages.__dict__.setdefault('stages', [])
+
+        # time spent in nested stages, which is removed from this stage
+        nested_seconds = [0.0]
+        stages.append(nested_seconds)
+
+        start = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            elapsed = time.perf_counter() - start
+
+            stages.pop()
+
+            if stages:
+                stages[-1][0] += elapsed
+
+            with self._lock:
+                self.timings[name] = self.timings.get(name, 0.0) + elapsed - nested_seconds[0]
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increments a counter, e.g: the number of fallback retries."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def start(self) -> None:
+        """Starts sampling the resident memory of the process, if track_memory is True."""
+        if not self.track_memory:
+            return
+
+        self.start_memory = self.peak_memory = _resident_memory()
+
+        if self.start_memory is None:
+            return
+
+        def sample_memory() -> None:
+            while not self._stop_sampling.wait(MEMORY_SAMPLE_INTERVAL):
+                self.peak_memory = max(self.peak_memory, _resident_memory() or 0)
+
+        self._sampler = threading.Thread(target=sample_memory, daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stops sampling the resident memory of the process."""
+        if self._sampler is None:
+            return
+
+        self._stop_sampling.set()
+        self._sampler.join()
+        self._sampler = None
+
+        self.peak_memory = max(self.peak_memory, _resident_memory() or 0)
@@ -0,0 +1,101 @@
+"""Shrinks polars DataFrames by downcasting numeric columns and dictionary encoding low cardinality string columns."""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+# Integer types from the smallest to the largest, for signed and unsigned columns, along with their numpy ranges
+SIGNED_INTEGER_TYPES = {pl.Int8: np.iinfo(np.int8), pl.Int16: np.iinfo(np.int16), pl.Int32: np.iinfo(np.int32), pl.Int64: np.iinfo(np.int64)}
+UNSIGNED_INTEGER_TYPES = {pl.UInt8: np.iinfo(np.uint8), pl.UInt16: np.iinfo(np.uint16), pl.UInt32: np.iinfo(np.uint32), pl.UInt64: np.iinfo(np.uint64)}
+
+# String columns with fewer unique values than this share of their non-null values are converted to categoricals
+CATEGORICAL_RATIO = 0.5
+
+def _smallest_integer_type(dtype: pl.DataType, minimum: int, maximum: int) -> pl.DataType:
+    """Returns the smallest integer type, with the same signedness as dtype, that holds every value between minimum and maximum."""
+    integer_types = UNSIGNED_INTEGER_TYPES if dtype in UNSIGNED_INTEGER_TYPES else SIGNED_INTEGER_TYPES
+
+    for integer_type, type_info in integer_types.items():
+
+        if type_info.min <= minimum and maximum <= type_info.max:
+            return integer_type
+
+    return dtype
+
+def optimize_dtypes(polars_df: pl.DataFrame, categorical_ratio: float = CATEGORICAL_RATIO) -> tuple[pl.DataFrame, dict]:
+    """
+    Downcasts integer and float columns to the smallest type that holds their values without loss,
+    and converts string columns with few unique values to categoricals.
+
+    Returns the optimized DataFrame, along with a report of the dtype and memory (in bytes) of each column before and after.
+    Floats are only downcast to Float32 if every value is unchanged by the round trip.
+    """
+    integer_columns = [column for column, dtype in polars_df.schema.items() if dtype.is_integer() and dtype not in (pl.Int8, pl.UInt8)]
+    float_columns = [column for column, dtype in polars_df.schema.items() if dtype == pl.Float64]
+    string_columns = [column for column, dtype in polars_df.schema.items() if dtype == pl.String]
+
+    if not (integer_columns or float_columns or string_columns):
+        return polars_df, memory_report(polars_df, polars_df)
+
+    # computing statistics of every column in a single pass over the DataFrame,
+    # aliased by statistic and position instead of column name, so aliases cannot clash (e.g: columns 'a' and 'a_min')
+    statistics = polars_df.select(
+        *[pl.col(column).min().alias(f'min_{position}') for position, column in enumerate(integer_columns)],
+        *[pl.col(column).max().alias(f'max_{position}') for position, column in enumerate(integer_columns)],
+        *[((pl.col(column).cast(pl.Float32).cast(pl.Float64) == pl.col(column)) | pl.col(column).is_null() | pl.col(column).is_nan())
+          .all().alias(f'fits_float32_{position}') for position, column in enumerate(float_columns)],
+        *[pl.col(column).n_unique().alias(f'unique_{position}') for position, column in enumerate(string_columns)],
+        *[pl.col(column).count().alias(f'count_{position}') for position, column in enumerate(string_columns)],
+    ).row(0, named=True)
+
+    casts = {}
+
+    for position, column in enumerate(integer_columns):
+        minimum, maximum = statistics[f'min_{position}'], statistics[f'max_{position}']
+
+        # columns with only nulls have no minimum or maximum
+        if minimum is None:
+            continue
+
+        smallest_type = _smallest_integer_type(polars_df.schema[column], minimum, maximum)
+
+        if smallest_type != polars_df.schema[column]:
+            casts[column] = smallest_type
+
+    for position, column in enumerate(float_columns):
+        if statistics[f'fits_float32_{position}']:
+            casts[column] = pl.Float32
+
+    for position, column in enumerate(string_columns):
+        non_null_count = statistics[f'count_{position}']
+
+        if non_null_count > 0 and statistics[f'unique_{position}'] <= categorical_ratio * non_null_count:
+            casts[column] = pl.Categorical
+
+    optimized_df = polars_df.cast(casts) if casts else polars_df
+
+    return optimized_df, memory_report(polars_df, optimized_df)
+
+def column_memory(df: pd.DataFrame|pl.DataFrame|pa.Table, column: str) -> tuple[str, int]:
+    """Returns the dtype and memory (in bytes) of a column of a pandas or polars DataFrame, or of a pyarrow Table."""
+    if isinstance(df, pd.DataFrame):
+        # deep, so strings stored as Python objects are measured too
+        return str(df[column].dtype), int(df[column].memory_usage(deep=True, index=False))
+
+    if isinstance(df, pa.Table):
+        return str(df.schema.field(column).type), df.column(column).nbytes
+
+    return str(df.schema[column]), df.get_column(column).estimated_size()
+
+def memory_report(before_df: pd.DataFrame|pl.DataFrame|pa.Table, after_df: pd.DataFrame|pl.DataFrame|pa.Table) -> dict:
+    """Returns the dtype and memory (in bytes) of each column, before and after optimization."""
+    report = {}
+
+    for column in after_df.columns:
+        before_dtype, before_bytes = column_memory(before_df, column)
+        after_dtype, after_bytes = column_memory(after_df, column)
+
+        report[column] = {'before_dtype': before_dtype, 'after_dtype': after_dtype, 'before_bytes': before_bytes, 'after_bytes': after_bytes}
+
+    return report
@@ -0,0 +1,91 @@
+"""Translates polars reader options into the options of pyarrow's batched readers, so every DataLoader method takes the same options."""
+
+import copy
+import io
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# polars read_csv options that batched CSV readers translate to pyarrow
+CSV_READER_OPTIONS = ['separator', 'quote_char', 'has_header', 'skip_rows', 'null_values', 'encoding', 'schema_overrides', 'decimal_comma']
+
+# pyarrow option objects, passed as they are to pyarrow.csv.open_csv (translated polars options are added to them)
+ARROW_CSV_OPTIONS = ['read_options', 'parse_options', 'convert_options']
+
+# polars options that only tune how polars reads a file (e.g: threads or memory), hence ignored by pyarrow readers
+TUNING_OPTIONS = ['parallel', 'n_threads', 'low_memory', 'rechunk', 'use_statistics', 'memory_map', 'cache', 'use_pyarrow']
+
+def _check_options(options: dict, supported_options: list) -> None:
+    """Raises a TypeError for options that batched readers cannot translate, listing the supported ones."""
+    unsupported_options = [option for option in options if option not in supported_options and option not in TUNING_OPTIONS]
+
+    if unsupported_options:
+        raise TypeError(f'Unsupported reader options for batched reading: {unsupported_options}, supported options are {supported_options}')
+
+def _arrow_type(dtype: pl.DataType) -> pa.DataType:
+    """Returns the pyarrow type that polars converts a polars dtype to."""
+    return pl.DataFrame(schema={'column': dtype}).to_arrow().schema.field('column').type
+
+def polars_column_names(column_count: int) -> list[str]:
+    """Returns the names polars gives to the columns of a CSV file without header, which depend on the polars version (column_1 or column_0 first)."""
+    return pl.read_csv(io.BytesIO(','.join(['0'] * column_count).encode('utf-8')), has_header=False).columns
+
+def arrow_csv_options(**kwargs: dict) -> tuple[dict, bool]:
+    """
+    Returns the read, parse and convert options of pyarrow.csv.open_csv for polars read_csv options, and whether the file has a header.
+
+    Files without a header need their number of columns for naming them like polars (see polars_column_names), which is left to the caller.
+    """
+    _check_options(kwargs, CSV_READER_OPTIONS + ARROW_CSV_OPTIONS)
+
+    # copying options passed by the user, so translated options do not change them
+    read_options = copy.copy(kwargs.get('read_options') or pa_csv.ReadOptions())
+    parse_options = copy.copy(kwargs.get('parse_options') or pa_csv.ParseOptions())
+    convert_options = copy.copy(kwargs.get('convert_options') or pa_csv.ConvertOptions())
+
+    if 'separator' in kwargs:
+        parse_options.delimiter = kwargs['separator']
+
+    if 'quote_char' in kwargs:
+        # polars disables quoting with None, pyarrow with False
+        parse_options.quote_char = kwargs['quote_char'] if kwargs['quote_char'] is not None else False
+
+    if 'skip_rows' in kwargs:
+        read_options.skip_rows = kwargs['skip_rows']
+
+    if 'encoding' in kwargs:
+        if kwargs['encoding'] == 'utf8-lossy':
+            raise ValueError("encoding='utf8-lossy' is not supported for batched reading, use encoding='utf8' instead")
+
+        read_options.encoding = kwargs['encoding']
+
+    if kwargs.get('null_values') is not None:
+        null_values = kwargs['null_values']
+
+        if isinstance(null_values, dict):
+            raise ValueError('null_values of each column are not supported for batched reading, pass a string or a list of strings instead')
+
+        convert_options.null_values = [''] + ([null_values] if isinstance(null_values, str) else list(null_values))
+        convert_options.strings_can_be_null = True
+
+    elif kwargs.get('convert_options') is None:
+        # same as polars, where only empty values are missing (pyarrow also treats e.g: 'NA' or 'null' as missing), in string columns too
+        convert_options.null_values = ['']
+        convert_options.strings_can_be_null = True
+
+    if kwargs.get('schema_overrides'):
+        convert_options.column_types = {
+            **convert_options.column_types,
+            **{column: _arrow_type(dtype) for column, dtype in kwargs['schema_overrides'].items()}}
+
+    if kwargs.get('decimal_comma'):
+        convert_options.decimal_point = ','
+
+    return {'read_options': read_options, 'parse_options': parse_options, 'convert_options': convert_options}, kwargs.get('has_header', True)
+
+def arrow_file_options(supported_options: list, **kwargs: dict) -> dict:
+    """Returns the options of pyarrow readers of Parquet, Arrow IPC and ORC files, without the polars options that only tune polars."""
+    _check_options(kwargs, supported_options)
+
+    return {option: value for option, value in kwargs.items() if option not in TUNING_OPTIONS}
@@ -0,0 +1,194 @@
+"""Samples rows from large files without parsing all of them, by seeking CSV byte offsets, picking parquet row groups or reservoir sampling batches."""
+
+import math
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import polars as pl
+
+# Number of lines read from the start of a CSV file for estimating the average line length
+ESTIMATE_LINES = 1_000
+
+# Minimum number of parquet row groups a sample is spread across, so it does not come from a single part of the file
+MIN_ROW_GROUPS = 10
+
+# Name of the temporary column holding the position of each sampled row, used for returning rows in file order
+ROW_INDEX_COLUMN = '__datalabx_row_index__'
+
+def systematic_positions(total: int, n_rows: int, rng: np.random.Generator) -> np.ndarray:
+    """Returns n_rows evenly spaced positions between 0 and total, starting at a random offset within the first step."""
+    step = total / n_rows
+
+    return (rng.uniform(0, step) + np.arange(n_rows) * step).astype(np.int64)
+
+def sample_csv_lines(file_path: Path, n_rows: int, method: str, rng: np.random.Generator) -> bytes|None:
+    """
+    Samples lines of an uncompressed CSV file by seeking to byte offsets, and returns them along with the header.
+
+    Each offset selects the first line starting after it, so lines that follow longer lines are slightly more likely to be picked.
+    Returns None if the file is not much larger than the sample, in which case reading the whole file is cheaper.
+    """
+    file_size = file_path.stat().st_size
+
+    with open(file_path, 'rb') as file:
+        header = file.readline()
+        data_start = file.tell()
+
+        # estimating the number of rows from the length of the first lines
+        first_lines = [file.readline() for _ in range(ESTIMATE_LINES)]
+        first_lines = [line for line in first_lines if line]
+
+        if not first_lines:
+            return None
+
+        average_line_length = sum(len(line) for line in first_lines) / len(first_lines)
+        estimated_rows = (file_size - data_start) / average_line_length
+
+        if estimated_rows <= 2 * n_rows:
+            return None
+
+        line_starts = set()
+        sampled_lines = []
+
+        # offsets landing on the same line pick it only once, hence drawing more offsets for a few rounds
+        for _ in range(3):
+            missing_rows = n_rows - len(sampled_lines)
+
+            if missing_rows <= 0:
+                break
+
+            if method == 'systematic':
+                offsets = data_start + systematic_positions(file_size - data_start, missing_rows, rng)
+            else:
+                offsets = np.sort(rng.integers(data_start, file_size, size=missing_rows))
+
+            for offset in offsets:
+                # skipping to the first line starting at or after the offset
+                file.seek(offset - 1)
+                file.readline()
+
+                line_start = file.tell()
+
+                if line_start in line_starts:
+                    continue
+
+                line = file.readline()
+
+                if not line.strip():
+                    continue
+
+                line_starts.add(line_start)
+                sampled_lines.append((line_start, line if line.endswith(b'\n') else line + b'\n'))
+
+            # systematic offsets are evenly spaced already, so drawing them again would not spread them any better
+            if method == 'systematic':
+                break
+
+    sampled_lines.sort(key=lambda sampled_line: sampled_line[0])
+
+    return header + b''.join(line for _, line in sampled_lines[:n_rows])
+
+def parquet_row_groups(file_paths: list[Path], n_rows: int, method: str, rng: np.random.Generator) -> list[tuple[Path, list[int]]]:
+    """
+    Picks row groups of parquet files that hold at least n_rows rows, at random or evenly spaced, using only the file metadata.
+    At least MIN_ROW_GROUPS row groups are picked (when the files have that many), so the sample is spread across the files.
+
+    Returns the picked row groups of each file, in file order.
+    """
+    import pyarrow.parquet as pq
+
+    row_groups = []
+
+    for file_path in file_paths:
+        metadata = pq.ParquetFile(file_path).metadata
+
+        row_groups.extend((file_path, row_group, metadata.row_group(row_group).num_rows) for row_group in range(metadata.num_row_groups))
+
+    average_rows = sum(rows for _, _, rows in row_groups) / max(len(row_groups), 1)
+    needed_groups = min(len(row_groups), max(math.ceil(n_rows / max(average_rows, 1)), MIN_ROW_GROUPS))
+
+    if method == 'systematic':
+        order = systematic_positions(len(row_groups), needed_groups, rng) if needed_groups else []
+    else:
+        order = rng.permutation(len(row_groups))[:needed_groups]
+
+    picked = {int(position) for position in order}
+    picked_rows = sum(row_groups[position][2] for position in picked)
+
+    # row groups of different sizes may hold fewer rows than needed
+    for position in rng.permutation(len(row_groups)):
+        if picked_rows >= n_rows:
+            break
+
+        if int(position) not in picked:
+            picked.add(int(position))
+            picked_rows += row_groups[position][2]
+
+    file_row_groups = {}
+
+    for position in sorted(picked):
+        file_path, row_group, _ = row_groups[position]
+        file_row_groups.setdefault(file_path, []).append(row_group)
+
+    return list(file_row_groups.items())
+
+def sample_rows(polars_df: pl.DataFrame, n_rows: int, method: str, rng: np.random.Generator) -> pl.DataFrame:
+    """Samples n_rows rows of a DataFrame at random or evenly spaced, keeping their original order."""
+    if polars_df.height <= n_rows:
+        return polars_df
+
+    if method == 'systematic':
+        positions = systematic_positions(polars_df.height, n_rows, rng)
+    else:
+        positions = np.sort(rng.choice(polars_df.height, size=n_rows, replace=False))
+
+    return polars_df[positions]
+
+def reservoir_sample(batches: Iterator[pl.DataFrame], n_rows: int, rng: np.random.Generator) -> pl.DataFrame:
+    """
+    Samples n_rows rows uniformly at random from batches streamed once, without knowing the number of rows in advance.
+
+    Every row replaces a random row of the sample with probability n_rows / (rows seen so far), computed for a whole batch at once.
+    """
+    reservoir = None
+    rows_seen = 0
+
+    for batch in batches:
+        batch = batch.with_columns(pl.int_range(rows_seen, rows_seen + batch.height, dtype=pl.Int64).alias(ROW_INDEX_COLUMN))
+
+        # filling the sample with the first n_rows rows
+        fill_rows = max(0, min(batch.height, n_rows - rows_seen))
+
+        if fill_rows:
+            head = batch.head(fill_rows)
+            reservoir = head if reservoir is None else pl.concat([reservoir, head], how='diagonal_relaxed')
+
+        if fill_rows < batch.height:
+            row_positions = np.arange(rows_seen + fill_rows, rows_seen + batch.height)
+
+            # each row picks a random slot, and is only kept if the slot is inside the sample
+            slots = np.floor(rng.random(len(row_positions)) * (row_positions + 1)).astype(np.int64)
+            accepted = slots < n_rows
+
+            accepted_rows = np.flatnonzero(accepted) + fill_rows
+            accepted_slots = slots[accepted]
+
+            # when several rows of a batch pick the same slot, the last of them is kept, like replacing them one by one
+            _, last_positions = np.unique(accepted_slots[::-1], return_index=True)
+            last_positions = len(accepted_slots) - 1 - last_positions
+
+            replaced_slots = accepted_slots[last_positions]
+            replacing_rows = accepted_rows[last_positions]
+
+            keep_mask = np.ones(reservoir.height, dtype=bool)
+            keep_mask[replaced_slots] = False
+
+            reservoir = pl.concat([reservoir.filter(pl.Series(keep_mask)), batch[replacing_rows]], how='diagonal_relaxed')
+
+        rows_seen += batch.height
+
+    if reservoir is None:
+        return pl.DataFrame()
+
+    return reservoir.sort(ROW_INDEX_COLUMN).drop(ROW_INDEX_COLUMN)
@@ -0,0 +1,85 @@
+"""Infers CSV schemas progressively, by sampling the file and widening only the columns that fail to parse."""
+
+import io
+import re
+from pathlib import Path
+
+import polars as pl
+
+# Number of bytes sampled from the head, middle and tail of a CSV file
+SAMPLE_BYTES = 1024 * 1024
+
+# Polars error message raised when a value does not match the inferred dtype of its column
+PARSE_ERROR_PATTERN = re.compile(r"could not parse `(?P<value>.*?)` as dtype `(?P<dtype>.*?)` at column '(?P<column>.*?)'", re.DOTALL)
+
+def sample_csv_schema(file_path: Path, sample_bytes: int = SAMPLE_BYTES, **kwargs) -> dict[str, pl.DataType]:
+    """
+    Infers column types from byte ranges at the head, middle and tail of a CSV file, instead of the whole file.
+
+    Returns an empty dictionary if the sample cannot be parsed (e.g: when quoted values span multiple lines).
+    """
+    file_size = file_path.stat().st_size
+
+    with open(file_path, 'rb') as file:
+        header = file.readline()
+        data_start = file.tell()
+
+        # file is small enough to be sampled completely
+        if file_size <= 3 * sample_bytes:
+            sample = header + file.read()
+
+        else:
+            sample_lines = [header]
+            offsets = [data_start, (file_size - sample_bytes) // 2, file_size - sample_bytes]
+
+            for offset in offsets:
+                file.seek(offset)
+
+                chunk = file.read(sample_bytes)
+
+                # dropping the partial line at the start of the chunk, except at the start of the data
+                if offset != data_start:
+                    chunk = chunk.partition(b'\n')[2]
+
+                # dropping the partial line at the end of the chunk
+                chunk = chunk[:chunk.rfind(b'\n') + 1]
+
+                sample_lines.append(chunk)
+
+            sample = b''.join(sample_lines)
+
+    try:
+        sample_df = pl.read_csv(io.BytesIO(sample), infer_schema_length=None, **kwargs)
+
+    except (pl.exceptions.ComputeError, pl.exceptions.NoDataError):
+        return {}
+
+    return dict(sample_df.schema)
+
+def parse_error_column(error: Exception) -> tuple[str, str, str]|None:
+    """Returns the column, value and dtype from a polars CSV parsing error, or None if they cannot be found."""
+
+    match = PARSE_ERROR_PATTERN.search(str(error))
+
+    if match is None:
+        return None
+
+    return match.group('column'), match.group('value'), match.group('dtype')
+
+def widen_dtype(value: str, dtype: str) -> pl.DataType:
+    """
+    Returns the smallest dtype that can hold a value that failed to parse.
+
+    Integers are widened to floats if the value is a decimal number, everything else is widened to strings.
+    """
+    is_integer_dtype = re.fullmatch(r'[iu]\d+', dtype) is not None
+
+    if is_integer_dtype:
+        try:
+            float(value)
+            return pl.Float64
+
+        except ValueError:
+            pass
+
+    return pl.String
@@ -1,3 +1,4 @@
 from .DataLoader import DataLoader
+from .DatabaseLoader import DatabaseLoader
 
-__all__ = ['DataLoader']
\ No newline at end of file
+__all__ = ['DataLoader', 'DatabaseLoader']
\ No newline at end of file
@@ -48,7 +48,12 @@ class Standardization(DataPreprocessor):
 
         from ..computations import Statistics
 
-        standardized_data = (self.df - self.df.median())/ Statistics(self.df).iqr()
+        statistics = Statistics(self.df)
+
+        # computing the quartiles in one pass per column, which median() and iqr() reuse
+        statistics.quantiles([0.25, 0.5, 0.75])
+
+        standardized_data = (self.df - statistics.median())/ statistics.iqr()
 
         logger.info('Standardized data using iqr method.')
 
@@ -59,7 +64,9 @@ class Standardization(DataPreprocessor):
 
         from ..computations import Statistics
 
-        robust_standardized_data = (self.df - self.df.median())/Statistics(self.df).scaled_median_absolute_deviation()
+        statistics = Statistics(self.df)
+
+        robust_standardized_data = (self.df - statistics.median())/statistics.scaled_median_absolute_deviation()
 
         logger.info('Standardized data using median absolute deviation.')
 
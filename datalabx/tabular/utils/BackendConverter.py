@@ -1,7 +1,85 @@
-"""Allows conversion from Pandas DataFrame <-> Polars DataFrame."""
+"""Allows conversion from Pandas DataFrame <-> Polars DataFrame <-> PyArrow Table."""
 
+import weakref
+
+import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+
+from .Config import config
+from .ConversionCache import conversion_cache, copy_on_write_enabled
+from .Logger import datalabx_logger
+
+logger = datalabx_logger(name = __name__.split('.')[-1])
+
+def _adaptive_backend(series: pl.Series) -> str:
+    """
+    Chooses the pandas backend of a single column for array_type='adaptive'.
+
+    Floats, and integers, booleans and dates without nulls, are stored as numpy arrays.
+    Strings, nested types and integers or booleans with nulls (which numpy would turn into floats or objects) are stored as Arrow arrays.
+    """
+    dtype = series.dtype
+
+    if dtype.is_float():
+        return 'numpy'
+
+    if (dtype.is_integer() or dtype == pl.Boolean or dtype.is_temporal()) and series.null_count() == 0:
+        return 'numpy'
+
+    if dtype == pl.Null:
+        return 'numpy'
+
+    return 'pyarrow'
+
+def _shares_arrow_buffers(arrow_type: pa.DataType) -> bool:
+    """Checks whether polars reuses the buffers of an Arrow column of this type, instead of copying them into its own layout (e.g: strings)."""
+    return (pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_boolean(arrow_type)
+            or pa.types.is_temporal(arrow_type)) and not pa.types.is_float16(arrow_type)
+
+def _column_to_arrow(series: pd.Series, share_buffers: bool) -> tuple[pa.Array|pa.ChunkedArray|None, bool]:
+    """
+    Converts a pandas column to an Arrow array, reusing its buffers when share_buffers is True and copying them otherwise.
+
+    Returns the array along with whether its values were copied, or (None, True) for columns that are left to polars (e.g: objects or categoricals).
+    """
+    values = series.array
+
+    # Arrow backed columns already hold Arrow arrays, which pandas replaces instead of modifying in place, so they are always shared
+    if isinstance(series.dtype, pd.ArrowDtype):
+        arrow_array = values.__arrow_array__()
+
+        return arrow_array, not _shares_arrow_buffers(arrow_array.type)
+
+    # nullable integers, floats and booleans hold their values and their mask separately, only the mask is converted to a bitmap
+    if isinstance(values, (pd.arrays.IntegerArray, pd.arrays.FloatingArray)):
+        return (pa.array(values), False) if share_buffers else (pa.array(values.copy()), True)
+
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iufmM' and series.dtype.itemsize > 2:
+        numpy_values = series.to_numpy() if share_buffers else series.to_numpy(copy=True)
+
+        # NaN and NaT are converted to nulls, which only adds a bitmap next to the values
+        arrow_array = pa.array(numpy_values, from_pandas=True)
+
+        copied = not (share_buffers and numpy_values.flags.c_contiguous and arrow_array.buffers()[1].address == numpy_values.ctypes.data)
+
+        return arrow_array, copied
+
+    return None, True
+
+def _release(pandas_reference: pd.DataFrame) -> None:
+    """Drops the pandas reference kept alive by _keep_reference(), once its polars DataFrame is garbage collected."""
+
+def _keep_reference(polars_df: pl.DataFrame, pandas_reference: pd.DataFrame|None) -> pl.DataFrame:
+    """
+    Keeps a shallow copy of the source pandas DataFrame alive for as long as a polars DataFrame sharing its buffers,
+    so with copy on write, pandas copies a shared column before modifying it in place instead of changing the polars DataFrame.
+    """
+    if pandas_reference is not None:
+        weakref.finalize(polars_df, _release, pandas_reference)
+
+    return polars_df
 
 class BackendConverter:
     """
@@ -9,25 +87,45 @@ class BackendConverter:
 
     Parameters
     -----------
-    df: pd.DataFrame or pl.DataFrame
-        A pandas DataFrame or a polars DataFrame.
+    df: pd.DataFrame, pl.DataFrame or pa.Table
+        A pandas DataFrame, a polars DataFrame or a pyarrow Table.
+
+        pyarrow Tables are wrapped as polars DataFrames without copying their buffers.
+        DataFrames are not copied when the converter is initialized; pandas_to_polars() explains when converted columns share memory.
 
     columns: list, optional
         A list of columns you wish to convert, default is None.
 
+    cache_conversions: bool, optional
+        Whether conversions of this DataFrame are cached, default is None (config.cache_conversions, which is True unless changed).
+
+        Pass False for DataFrames that are converted once and thrown away (e.g: filtered rows), so they are neither fingerprinted nor stored.
+
     """
 
-    def __init__(self, df:pd.DataFrame|pl.DataFrame, columns:list=None):
+    def __init__(self, df:pd.DataFrame|pl.DataFrame|pa.Table, columns:list=None, cache_conversions:bool|None=None):
 
-        if not isinstance(df, (pd.DataFrame, pl.DataFrame)):
-            raise TypeError(f'Backend Converter expects a pandas DataFrame or a polars DataFrame, got {type(df).__name__}')
+        if not isinstance(df, (pd.DataFrame, pl.DataFrame, pa.Table)):
+            raise TypeError(f'Backend Converter expects a pandas DataFrame, a polars DataFrame or a pyarrow Table, got {type(df).__name__}')
+
+        if isinstance(df, pa.Table):
+            # polars reuses arrow buffers, hence no data is copied here
+            df = pl.from_arrow(df, rechunk=False)
 
         if not isinstance(columns, (list, type(None))):
             raise TypeError(f'columns must be a list or type None, got {type(df).__name__}')
 
+        if not isinstance(cache_conversions, (bool, type(None))):
+            raise TypeError(f'cache_conversions must be either True, False or type None, got {type(cache_conversions).__name__}')
+
+        self.cache_conversions = cache_conversions
+
         if isinstance(df, pd.DataFrame):
 
-            self.df = df.copy()
+            self.df = df
+
+            # the index is kept aside as row ids, instead of being converted into a column
+            self.row_ids = df.index
 
             if columns is None:
                 self.columns = self.df.columns.to_list()
@@ -36,7 +134,9 @@ class BackendConverter:
 
         elif isinstance (df, pl.DataFrame):
             
-            self.df = df.clone()
+            self.df = df
+
+            self.row_ids = None
 
             if columns is None:
                 self.columns = self.df.columns
@@ -44,7 +144,13 @@ class BackendConverter:
             else:
                 self.columns = [column for column in columns if column in self.df.columns]
 
-    def polars_to_pandas(self, array_type: str='auto', conversion_threshold: int=None)-> pd.DataFrame:
+        # backend and memory of each column chosen during the last conversion with array_type='adaptive'
+        self.backend_report = None
+
+        # columns whose values were copied during the last pandas -> polars conversion, instead of sharing their buffers
+        self.copied_columns = None
+
+    def polars_to_pandas(self, array_type: str|None=None, conversion_threshold: int|None=None)-> pd.DataFrame:
         """
         Converts a polars DataFrame to a pandas DataFrame
 
@@ -52,16 +158,18 @@ class BackendConverter:
         -----------
         array_type: str
     
-            Determines the array/backend type used in pandas operations, by default 'auto'.
+            Determines the array/backend type used in pandas operations, by default None (config.array_type, which is 'auto' unless changed).
 
             Options are:
 
             - 'numpy' -> usual NumPy backend (slower for very large datasets with object types)
             - 'pyarrow' -> PyArrow backend for better performance on large datasets
             - 'auto' -> automatically selects backend based on input and dataset size 
+            - 'adaptive' -> selects backend for each column separately, depending on its datatype and nulls
 
         conversion_threshold: int
-            The number of rows at which the conversion from Polars to pandas switches to Arrow-backed pandas arrays for performance, default is 100000.
+            The number of rows at which the conversion from Polars to pandas switches to Arrow-backed pandas arrays for performance,
+            default is None (config.conversion_threshold, which is 100000 unless changed).
             Users can increase or decrease this threshold depending on their dataset size and memory availability.
         
         Returns
@@ -77,39 +185,107 @@ class BackendConverter:
         Considerations
         ---------------
             Adjust array_type and conversion_threshold for very large datasets to optimize performance and memory usage.
+
+            With array_type='adaptive', strings and integers with nulls are Arrow backed, while floats and integers without nulls stay in numpy,
+            regardless of the number of rows. The chosen backend, dtype and memory of each column are stored in BackendConverter.backend_report.
+
+            Conversions of polars DataFrames are not cached, since polars can change values in place without any cheap way of detecting it.
         """
 
         if not isinstance(self.df, pl.DataFrame):
             raise TypeError(f'Expected a polars DataFrame, got {type(self.df).__name__}')
 
-        if not isinstance(array_type, str):
-            raise TypeError(f'array type must be a string, got {type(array_type).__name__}')
+        if not isinstance(array_type, (str, type(None))):
+            raise TypeError(f'array type must be a string or type None, got {type(array_type).__name__}')
         
         if not isinstance(conversion_threshold, (int, type(None))):
             raise TypeError(f'conversion threshold must be an integer or type None, got {type(conversion_threshold).__name__}')
 
+        # options that are not passed fall back to the global config
+        if array_type is None:
+            array_type = config.array_type
+
+        if array_type not in ['numpy', 'pyarrow', 'auto', 'adaptive']:
+            raise ValueError(f"array_type must either be 'numpy', 'pyarrow', 'auto' or 'adaptive', got '{array_type}'")
+
         if conversion_threshold is None:
-            conversion_threshold = 100_000
+            conversion_threshold = config.conversion_threshold
 
         df_size = self.df.height
 
         if array_type == 'auto':
             # if rows more than or equal to conversion threshold
-            if df_size >= conversion_threshold:
-                return self.df.to_pandas(use_pyarrow_extension_array=True)
-            else:
-                return self.df.to_pandas()
+            use_pyarrow = df_size >= conversion_threshold
+        else:
+            use_pyarrow = array_type == 'pyarrow'
 
-        if array_type == 'numpy':
-            
-            pandas_df = self.df.to_pandas()
-            return pandas_df
+        if array_type == 'adaptive':
+            return self._adaptive_to_pandas()
+
+        elif use_pyarrow:
+            return self.df.to_pandas(use_pyarrow_extension_array=True)
+
+        return self.df.to_pandas()
+
+    def _get_cached(self, cache_key: tuple) -> object|None:
+        """
+        This is an internal function that returns a cached conversion of the DataFrame, if conversions are cached.
+        """
+        if not self._caches_conversions():
+            return None
+
+        return conversion_cache.get(self.df, cache_key)
 
-        elif array_type == 'pyarrow':
+    def _set_cached(self, cache_key: tuple, conversion: object) -> None:
+        """
+        This is an internal function that caches a conversion of the DataFrame, if conversions are cached.
+        """
+        if self._caches_conversions():
+            conversion_cache.set(self.df, cache_key, conversion)
+
+    def _caches_conversions(self) -> bool:
+        """
+        This is an internal function that checks whether conversions of the DataFrame are cached, falling back to the global config.
+        """
+        return self.cache_conversions if self.cache_conversions is not None else config.cache_conversions
+
+    def _adaptive_to_pandas(self) -> pd.DataFrame:
+        """
+        This is an internal function that converts each column of a polars DataFrame to the pandas backend that suits its datatype.
+        """
+        column_backends = {column: _adaptive_backend(self.df.get_column(column)) for column in self.df.columns}
+
+        numpy_columns = [column for column, backend in column_backends.items() if backend == 'numpy']
+        arrow_columns = [column for column, backend in column_backends.items() if backend == 'pyarrow']
 
-            pandas_df = self.df.to_pandas(use_pyarrow_extension_array=True)
+        # converting each group of columns at once, instead of column by column
+        pandas_dfs = []
 
-            return pandas_df 
+        if numpy_columns:
+            pandas_dfs.append(self.df.select(numpy_columns).to_pandas())
+
+        if arrow_columns:
+            pandas_dfs.append(self.df.select(arrow_columns).to_pandas(use_pyarrow_extension_array=True))
+
+        if not pandas_dfs:
+            return self.df.to_pandas()
+
+        pandas_df = pd.concat(pandas_dfs, axis=1)[self.df.columns]
+
+        memory_usage = pandas_df.memory_usage(deep=True, index=False)
+
+        self.backend_report = {
+            column: {
+                'backend': backend,
+                'dtype': str(pandas_df[column].dtype),
+                'memory_bytes': int(memory_usage[column])}
+            for column, backend in column_backends.items()}
+
+        logger.info(
+            f'Converted {len(numpy_columns)} columns to numpy and {len(arrow_columns)} columns to pyarrow, '
+            f'using {memory_usage.sum() / 1024 / 1024:.2f} MB.')
+
+        return pandas_df
 
     def pandas_to_polars(self, include_index:bool=False)-> pl.DataFrame:
         """
@@ -128,12 +304,163 @@ class BackendConverter:
         Considerations
         ---------------
             Polars do not have the concept of index like pandas does, hence, you can adjust include_index depending on your requirement.
+            If the Backend Converter was initialized with a polars DataFrame or a pyarrow Table, it is returned without any conversion.
+
+            Numeric, boolean and datetime columns backed by pyarrow, nullable (e.g: Int64) and numeric NumPy columns share their buffers with polars
+            when pandas copies on write (pandas >= 3) and conversions are cached. The returned DataFrame keeps a shallow copy of the pandas DataFrame alive,
+            so changing the pandas DataFrame in place afterwards makes pandas copy the column first, and never changes the polars DataFrame.
+            Otherwise, NumPy and nullable columns are copied. Copied columns (always including strings, objects and categoricals) are listed in
+            BackendConverter.copied_columns.
+
+            Conversions are cached while the pandas DataFrame is alive and unmodified (see config.cache_conversions),
+            so converting the same DataFrame again (e.g: from DirtyDataDiagnosis and then TextDiagnosis) is free.
         """
         
         if not isinstance(include_index, bool):
             raise TypeError(f'include_index must be either True or False, got {type(include_index).__name__}')
 
-        polars_df = pl.from_pandas(self.df, include_index = include_index)
+        # data loaded with DataLoader(return_type='polars' or 'arrow') is already a polars DataFrame
+        if isinstance(self.df, pl.DataFrame):
+            return self.df
+
+        cache_key = ('polars', include_index)
+
+        cached_conversion = self._get_cached(cache_key)
+
+        if cached_conversion is not None:
+            polars_df, self.copied_columns, pandas_reference = cached_conversion
+
+            # a clone shares the same buffers, but in place changes to it (e.g: insert_column) do not reach the cached DataFrame
+            return _keep_reference(polars_df.clone(), pandas_reference)
+
+        # buffers are only shared when a reference to them can make pandas copy them before modifying them in place
+        share_buffers = copy_on_write_enabled() and self._caches_conversions()
+
+        pandas_reference = self.df.copy(deep=False) if share_buffers else None
+
+        # resetting the index is lazy with copy on write, hence its values are not copied either
+        pandas_df = self.df.reset_index() if include_index else self.df
+
+        # duplicated or non-string column names cannot be converted column by column
+        if pandas_df.columns.empty or not pandas_df.columns.is_unique or not all(isinstance(column, str) for column in pandas_df.columns):
+            self.copied_columns = pandas_df.columns.to_list()
+
+            # polars reuses the buffers of some numpy columns (e.g: int8), hence they are copied first
+            polars_df = pl.from_pandas(pandas_df if share_buffers else pandas_df.copy(deep=True))
+
+            self._set_cached(cache_key, (polars_df, self.copied_columns, pandas_reference))
+
+            return _keep_reference(polars_df.clone(), pandas_reference)
+
+        arrow_columns = {}
+        copied_columns = []
+
+        for column in pandas_df.columns:
+            arrow_array, copied = _column_to_arrow(pandas_df[column], share_buffers)
+
+            if arrow_array is not None:
+                arrow_columns[column] = arrow_array
+
+            if copied:
+                copied_columns.append(column)
+
+        # columns that cannot be converted to Arrow without copying are converted by polars at once
+        other_columns = [column for column in pandas_df.columns if column not in arrow_columns]
+
+        polars_dfs = []
+
+        if arrow_columns:
+            polars_dfs.append(pl.from_arrow(pa.table(arrow_columns), rechunk=False))
+
+        if other_columns:
+            other_df = pandas_df[other_columns]
+
+            # polars reuses the buffers of some numpy columns (e.g: int8), hence they are copied first
+            polars_dfs.append(pl.from_pandas(other_df if share_buffers else other_df.copy(deep=True)))
+
+        polars_df = pl.concat(polars_dfs, how='horizontal').select(pandas_df.columns.to_list()) if len(polars_dfs) > 1 else polars_dfs[0]
+
+        self.copied_columns = copied_columns
+
+        self._set_cached(cache_key, (polars_df, copied_columns, pandas_reference))
+
+        return _keep_reference(polars_df.clone(), pandas_reference)
+
+    def attach_row_ids(self, pandas_df: pd.DataFrame, row_positions: pl.Series|np.ndarray) -> pd.DataFrame:
+        """
+        Sets the index of a DataFrame derived from the converted polars DataFrame (e.g: filtered rows) to the row ids of the original pandas DataFrame
+
+        Parameters
+        -----------
+        pandas_df: pd.DataFrame
+            A pandas DataFrame whose rows come from the converted polars DataFrame, e.g: BackendConverter(polars_df.filter(mask)).polars_to_pandas()
+
+        row_positions: pl.Series or np.ndarray
+            Positions of those rows in the converted polars DataFrame, e.g: mask.arg_true()
+
+        Returns
+        -------
+        pd.DataFrame
+            The same pandas DataFrame, indexed by the original row ids
+
+        Usage Recommendation
+        ---------------------
+            Use this function instead of resetting the index into a column before converting to polars, and setting it back afterwards.
+            The original DataFrame is neither modified nor copied, and only the row ids of the returned rows are gathered.
+
+        Example
+        --------
+        >>> converter = BackendConverter(df)
+            polars_df = converter.pandas_to_polars()
+
+            mask = polars_df['price'].str.contains('$', literal=True)
+            result_df = converter.attach_row_ids(BackendConverter(polars_df.filter(mask)).polars_to_pandas(), mask.arg_true())
+        """
+
+        if self.row_ids is None:
+            raise TypeError('Row ids are only available when the Backend Converter is initialized with a pandas DataFrame')
+
+        if not isinstance(pandas_df, pd.DataFrame):
+            raise TypeError(f'pandas_df must be a pandas DataFrame, got {type(pandas_df).__name__}')
+
+        if isinstance(row_positions, pl.Series):
+            row_positions = row_positions.to_numpy()
+
+        if len(row_positions) != len(pandas_df):
+            raise ValueError(f'row_positions must have one position per row, got {len(row_positions)} positions for {len(pandas_df)} rows')
+
+        pandas_df.index = self.row_ids.take(row_positions)
+
+        return pandas_df
+
+    def to_arrow(self, include_index:bool=False)-> pa.Table:
+        """
+        Converts a pandas DataFrame or a polars DataFrame to a pyarrow Table
+
+        Parameters
+        -----------
+        include_index: bool, optional
+            Whether you would like to include index during conversion from pandas to pyarrow, by default False
+
+        Returns
+        -------
+        pa.Table
+            A pyarrow Table
+
+        Usage Recommendation
+        ---------------------
+            Use this function to hand data to Arrow based tools (e.g: pyarrow compute, DuckDB or Arrow Flight) without going through pandas.
+
+        Considerations
+        ---------------
+            Polars DataFrames are converted without copying numeric buffers. pandas DataFrames backed by NumPy object columns are copied into Arrow arrays.
+        """
+
+        if not isinstance(include_index, bool):
+            raise TypeError(f'include_index must be either True or False, got {type(include_index).__name__}')
+
+        if isinstance(self.df, pl.DataFrame):
+            return self.df.to_arrow()
 
-        return polars_df
+        return pa.Table.from_pandas(self.df, preserve_index = include_index)
 
@@ -0,0 +1,170 @@
+"""Execution options shared by every datalabx class, which can be changed globally or for a block of code"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator
+
+# Options used when neither the user nor config.set() changed them
+DEFAULT_OPTIONS = {
+    'array_type': 'auto',
+    'conversion_threshold': 100_000,
+    'chunk_rows': 100_000,
+    'max_workers': None,
+    'cache_conversions': True,
+    'quantile_error': 0.01,
+}
+
+# Options changed inside config.options() blocks, which only apply to the current thread or asyncio task
+_OPTION_OVERRIDES = contextvars.ContextVar('datalabx_option_overrides', default={})
+
+def _validate_options(options: dict) -> None:
+    """Checks the names, types and values of options."""
+    for name, value in options.items():
+
+        if name not in DEFAULT_OPTIONS:
+            raise ValueError(f"Unknown option '{name}'. Options are: {', '.join(DEFAULT_OPTIONS)}")
+
+        if name == 'array_type':
+            if not isinstance(value, str):
+                raise TypeError(f'array type must be a string, got {type(value).__name__}')
+
+            if value not in ['numpy', 'pyarrow', 'auto', 'adaptive']:
+                raise ValueError(f"array_type must either be 'numpy', 'pyarrow', 'auto' or 'adaptive', got '{value}'")
+
+        elif name == 'conversion_threshold':
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f'conversion threshold must be an integer, got {type(value).__name__}')
+
+            if value < 0:
+                raise ValueError(f'conversion_threshold must be greater than or equal to 0, got {value}')
+
+        elif name == 'chunk_rows':
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f'chunk_rows must be an integer, got {type(value).__name__}')
+
+            if value <= 0:
+                raise ValueError(f'chunk_rows must be greater than 0, got {value}')
+
+        elif name == 'max_workers':
+            if not isinstance(value, (int, type(None))) or isinstance(value, bool):
+                raise TypeError(f'max workers must be an integer or type None, got {type(value).__name__}')
+
+            if value is not None and value <= 0:
+                raise ValueError(f'max_workers must be greater than 0, got {value}')
+
+        elif name == 'cache_conversions':
+            if not isinstance(value, bool):
+                raise TypeError(f'cache_conversions must be either True or False, got {type(value).__name__}')
+
+        elif name == 'quantile_error':
+            if not isinstance(value, float):
+                raise TypeError(f'quantile_error must be a float, got {type(value).__name__}')
+
+            if not 0 < value < 1:
+                raise ValueError(f'quantile_error must be between 0 and 1, got {value}')
+
+class Config:
+    """
+    Execution options used by every datalabx class when the matching argument is not passed (or is None).
+
+    Options
+    ------------
+    array_type: str
+
+        Default pandas backend of DataLoader, DatabaseLoader, BackendConverter, NumericalCleaner and DirtyDataDiagnosis, by default 'auto'.
+
+    conversion_threshold: int
+
+        Number of rows at which array_type='auto' switches to Arrow-backed pandas arrays, by default 100000.
+
+    chunk_rows: int
+
+        Number of rows in each batch of DataLoader.iter_batches and each chunk of DatabaseLoader queries, by default 100000.
+
+    max_workers: int
+
+        Number of threads used for reading multiple files or sheets in parallel, by default None (chosen by Python's ThreadPoolExecutor).
+
+    cache_conversions: bool
+
+        Whether BackendConverter caches pandas -> polars conversions of each pandas DataFrame until it is modified or garbage collected, by default True.
+
+    quantile_error: float
+
+        Rank error of the quantile sketches used by approx=True in Statistics and Outliers, as a fraction of the number of values, by default 0.01.
+
+    Usage Recommendation
+    ---------------------
+
+        - Use config.set() once at startup for process wide defaults, and config.options() for a block of code (e.g: one tenant's request).
+        - Options passed to a class directly always take priority over the config.
+
+    Considerations
+    ---------------
+
+        - config.options() only applies to the current thread or asyncio task, so concurrent requests can use different options.
+          Files loaded on threads by DataLoader.aload_many use the options of the code that started them.
+        - The size of the polars thread pool is fixed when polars is imported, and can only be capped with the POLARS_MAX_THREADS
+          environment variable set before importing datalabx. max_workers caps the threads started by datalabx itself.
+
+    Example
+    --------
+    >>> # Use the pyarrow backend everywhere
+        datalabx.config.set(array_type='pyarrow')
+
+    >>> # Read files two at a time, in smaller batches, for one block of code only
+        with datalabx.config.options(max_workers=2, chunk_rows=20_000):
+            df = DataLoader('data/*.parquet').load_tabular()
+    """
+
+    def __init__(self):
+        # setting through __dict__, since setting attributes changes options
+        self.__dict__['_global_options'] = dict(DEFAULT_OPTIONS)
+
+    def __getattr__(self, name: str) -> object:
+        overrides = _OPTION_OVERRIDES.get()
+
+        if name in overrides:
+            return overrides[name]
+
+        if name in self._global_options:
+            return self._global_options[name]
+
+        raise AttributeError(f"Unknown option '{name}'. Options are: {', '.join(DEFAULT_OPTIONS)}")
+
+    def __setattr__(self, name: str, value: object) -> None:
+        self.set(**{name: value})
+
+    def __repr__(self) -> str:
+        return f'Config({", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())})'
+
+    def set(self, **options: dict) -> None:
+        """Changes options for the whole process. E.g: config.set(array_type='pyarrow')"""
+        _validate_options(options)
+
+        self._global_options.update(options)
+
+    def reset(self) -> None:
+        """Restores the default value of every option for the whole process."""
+        self._global_options.clear()
+        self._global_options.update(DEFAULT_OPTIONS)
+
+    @contextmanager
+    def options(self, **options: dict) -> Iterator['Config']:
+        """Changes options inside the block only, for the current thread or asyncio task. E.g: with config.options(max_workers=2): ..."""
+        _validate_options(options)
+
+        token = _OPTION_OVERRIDES.set({**_OPTION_OVERRIDES.get(), **options})
+
+        try:
+            yield self
+
+        finally:
+            _OPTION_OVERRIDES.reset(token)
+
+    def to_dict(self) -> dict:
+        """Returns the current value of every option."""
+        return {name: getattr(self, name) for name in DEFAULT_OPTIONS}
+
+# Options shared by every datalabx class
+config = Config()
@@ -0,0 +1,119 @@
+"""Caches conversions of pandas DataFrames to polars, so converting the same DataFrame again is free until it is modified"""
+
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# Number of evenly spaced rows compared for detecting values changed in place
+SAMPLE_ROWS = 32
+
+def copy_on_write_enabled() -> bool:
+    """Checks whether pandas copies columns before modifying them in place when they are shared (always on since pandas 3)."""
+    return int(pd.__version__.split('.')[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+def _buffer_address(series: pd.Series) -> int:
+    """Returns the memory address of the values of a pandas column (or the identity of its extension array), which changes when the column is copied or replaced."""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy(copy=False).__array_interface__['data'][0]
+
+    return id(series.array)
+
+def _fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Returns a cheap summary of a DataFrame, which changes when it is modified.
+
+    The summary holds the shape, the column names and dtypes, the memory address of each column and the values of a few evenly spaced rows.
+    """
+    positions = np.unique(np.linspace(0, max(len(df) - 1, 0), min(len(df), SAMPLE_ROWS)).astype(np.int64))
+
+    addresses = tuple(_buffer_address(df.iloc[:, position]) for position in range(df.shape[1]))
+
+    return (df.shape, tuple(df.columns), tuple(map(str, df.dtypes)), id(df.index), addresses), df.iloc[positions].copy()
+
+def _same_sample(sample: pd.DataFrame, cached_sample: pd.DataFrame) -> bool:
+    """Checks whether sampled rows are unchanged, treating missing values as equal."""
+    try:
+        return sample.equals(cached_sample)
+
+    # objects that cannot be compared (e.g: arrays inside cells) are treated as changed
+    except (TypeError, ValueError):
+        return False
+
+class ConversionCache:
+    """
+    Keeps the conversions of each DataFrame while the DataFrame is alive, shared by every datalabx class.
+
+    Entries are keyed by the identity of the source DataFrame, removed when it is garbage collected,
+    and discarded when its fingerprint (shape, columns, dtypes, buffers and sampled values) changes.
+
+    Only pandas DataFrames are cached, and only with copy on write: each entry holds a shallow copy of its DataFrame, so modifying
+    a column in place makes pandas copy the column first, which changes its address. Without copy on write (pandas < 3 by default),
+    and for polars DataFrames, values changed in place outside of the sampled rows cannot be detected, hence they are not cached at all.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame, key: tuple) -> object|None:
+        """Returns the cached conversion of df for key, or None if df was never converted that way or was modified since."""
+        with self._lock:
+            entry = self._entries.get(id(df))
+
+        if entry is None or entry['source']() is not df:
+            return None
+
+        fingerprint, sample = _fingerprint(df)
+
+        if fingerprint != entry['fingerprint'] or not _same_sample(sample, entry['sample']):
+            # every conversion of a modified DataFrame is stale
+            with self._lock:
+                if self._entries.get(id(df)) is entry:
+                    del self._entries[id(df)]
+
+            return None
+
+        return entry['conversions'].get(key)
+
+    def set(self, df: pd.DataFrame, key: tuple, conversion: object) -> None:
+        """Stores a conversion of df, which is kept until df is garbage collected or modified."""
+        # polars DataFrames, and pandas DataFrames without copy on write, can change in place without changing their fingerprint
+        if not isinstance(df, pd.DataFrame) or not copy_on_write_enabled():
+            return
+
+        df_id = id(df)
+
+        with self._lock:
+            entry = self._entries.get(df_id)
+
+        if entry is None or entry['source']() is not df:
+            fingerprint, sample = _fingerprint(df)
+
+            # removing the entry once the source DataFrame is garbage collected, before its id can be reused
+            def remove(_reference: weakref.ref, df_id: int = df_id) -> None:
+                with self._lock:
+                    if self._entries.get(df_id, {}).get('source') is _reference:
+                        del self._entries[df_id]
+
+            entry = {'source': weakref.ref(df, remove), 'fingerprint': fingerprint, 'sample': sample, 'conversions': {}}
+
+            # sharing the columns of the DataFrame, so pandas copies them before any change in place
+            entry['reference'] = df.copy(deep=False)
+
+            with self._lock:
+                self._entries[df_id] = entry
+
+        entry['conversions'][key] = conversion
+
+    def clear(self) -> None:
+        """Removes every cached conversion."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Conversions shared by every BackendConverter
+conversion_cache = ConversionCache()
@@ -1,3 +1,4 @@
 from .BackendConverter import BackendConverter
+from .Config import config
 
-__all__ = ['BackendConverter']
\ No newline at end of file
+__all__ = ['BackendConverter', 'config']
\ No newline at end of file
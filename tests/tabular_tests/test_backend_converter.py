@@ -0,0 +1,134 @@
+"""A test ensuring that pandas_to_polars shares the buffers of numeric and Arrow backed columns, and reports the columns it copied."""
+
+def test_zero_copy_pandas_to_polars():
+    from datalabx import BackendConverter
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    pandas_df = pd.DataFrame({
+        "integers": np.arange(5),
+        "floats": [1.5, np.nan, 3.5, 4.5, 5.5],
+        "nullable": pd.array([1, None, 3, 4, 5], dtype="Int64"),
+        "arrow_integers": pd.array([1, 2, None, 4, 5], dtype="int64[pyarrow]"),
+        "names": ["a", "b", "c", "d", "e"],
+        "categories": pd.Categorical(["x", "x", "y", "y", "z"])})
+
+    converter = BackendConverter(pandas_df)
+
+    # the DataFrame is not copied when the converter is initialized
+    assert converter.df is pandas_df
+
+    polars_df = converter.pandas_to_polars()
+
+    assert polars_df.equals(pl.from_pandas(pandas_df))
+    assert polars_df["floats"].null_count() == 1
+
+    assert converter.copied_columns == ["names", "categories"]
+    assert np.shares_memory(polars_df["integers"].to_numpy(), pandas_df["integers"].to_numpy())
+
+    # columns that are not contiguous in memory are copied
+    strided_converter = BackendConverter(pandas_df[["integers"]].iloc[::2])
+
+    assert strided_converter.pandas_to_polars()["integers"].to_list() == [0, 2, 4]
+    assert strided_converter.copied_columns == ["integers"]
+
+    indexed_df = BackendConverter(pandas_df.set_index("names")).pandas_to_polars(include_index=True)
+
+    assert indexed_df.columns[0] == "names"
+
+    from datalabx import config
+
+    # changing the pandas DataFrame in place never changes a polars DataFrame already returned, with or without the cache
+    for cache_conversions in [True, False]:
+        with config.options(cache_conversions=cache_conversions):
+            edited_df = pd.DataFrame({"integers": np.arange(5), "floats": np.arange(5.0), "small": np.arange(5, dtype="int8")})
+
+            edited_polars_df = BackendConverter(edited_df).pandas_to_polars()
+
+            # a new column invalidates the cached conversion, which must not release the shared buffers
+            edited_df["extra"] = 1
+            BackendConverter(edited_df).pandas_to_polars()
+
+            edited_df.loc[0, "integers"] = 99
+            edited_df.iloc[1, 1] = -1.0
+            edited_df.loc[2, "small"] = 9
+
+            assert edited_polars_df.row(0) == (0, 0.0, 0)
+            assert edited_polars_df.row(1) == (1, 1.0, 1)
+            assert edited_polars_df.row(2) == (2, 2.0, 2)
+
+"""A test ensuring that conversions are cached per DataFrame, and recomputed once the DataFrame is modified or garbage collected."""
+
+def test_conversion_cache():
+    from datalabx import BackendConverter, config
+    from datalabx.tabular.utils.ConversionCache import conversion_cache, copy_on_write_enabled
+    import gc
+    import pandas as pd
+    import polars as pl
+
+    conversion_cache.clear()
+
+    pandas_df = pd.DataFrame({"names": [f"name_{number}" for number in range(1_000)], "numbers": range(1_000)})
+
+    first_df = BackendConverter(pandas_df).pandas_to_polars()
+    second_df = BackendConverter(pandas_df).pandas_to_polars()
+
+    assert second_df.equals(first_df)
+
+    # without copy on write, pandas DataFrames can change in place undetected, hence they are not cached
+    assert len(conversion_cache) == (1 if copy_on_write_enabled() else 0)
+
+    # a value changed in place outside of the sampled rows is detected too
+    pandas_df.loc[777, "names"] = "changed"
+
+    assert BackendConverter(pandas_df).pandas_to_polars()["names"][777] == "changed"
+
+    pandas_df["extra"] = 1.5
+
+    assert BackendConverter(pandas_df).pandas_to_polars().columns == ["names", "numbers", "extra"]
+
+    # polars DataFrames can change in place undetected, hence they are not cached
+    polars_df = pl.DataFrame({"numbers": range(1_000)})
+
+    BackendConverter(polars_df).polars_to_pandas()
+    polars_df[500, "numbers"] = -1
+
+    assert BackendConverter(polars_df).polars_to_pandas()["numbers"][500] == -1
+    assert len(conversion_cache) == (1 if copy_on_write_enabled() else 0)
+
+    # cleaners convert the whole DataFrame once, so their conversion is cached for the next method or class
+    from datalabx import NumericalCleaner, TextCleaner
+
+    cleaner_df = pd.DataFrame({"price": [1.234, 2.345], "name": ["A", "B"]})
+
+    NumericalCleaner(cleaner_df, columns=["price"]).round_off(1)
+
+    if copy_on_write_enabled():
+        assert conversion_cache.get(cleaner_df, ("polars", False)) is not None
+
+    assert TextCleaner(cleaner_df, columns=["name"]).to_lowercase()["name"].tolist() == ["a", "b"]
+
+    del cleaner_df
+
+    del pandas_df, polars_df
+    gc.collect()
+
+    assert len(conversion_cache) == 0
+
+    with config.options(cache_conversions=False):
+        BackendConverter(pd.DataFrame({"numbers": [1]})).pandas_to_polars()
+
+    assert len(conversion_cache) == 0
+
+    # filtered rows built by the diagnosis classes are converted once, and never cached
+    from datalabx import TextDiagnosis
+
+    text_df = pd.DataFrame({"names": ["a,b", "", "c"]})
+    text_diagnosis = TextDiagnosis(text_df)
+    text_diagnosis.detect_splitters()
+    text_diagnosis.detect_empty_string()
+
+    # only the DataFrame being diagnosed is cached
+
+    assert len(conversion_cache) == (1 if copy_on_write_enabled() else 0)
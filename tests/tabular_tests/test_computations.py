@@ -0,0 +1,206 @@
+"""A test ensuring that the moments engine matches pandas, stays accurate for large offsets and split columns, and is shared by Statistics, Distribution and NumericalDiagnosis."""
+
+def test_moments():
+    from datalabx import Moments, Statistics, Distribution, NumericalDiagnosis
+    from datalabx.tabular.computations.Moments import column_moments
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+
+    df = pd.DataFrame({
+        "offset": rng.gamma(2, size=1_001) + 1e9,
+        "normal": rng.normal(size=1_001),
+        "nullable": pd.array(np.r_[rng.integers(0, 10, 1_000), [None]], dtype="Int64"),
+        "constant": np.full(1_001, 0.1)})
+
+    # mean and range alone use single pandas reductions, without the pass computing every moment
+    reduced = Moments(df)
+
+    assert np.allclose(reduced.mean(), df.mean())
+    assert np.allclose(reduced.range(), df.max() - df.min())
+    assert reduced._moments is None
+
+    moments = Moments(df)
+
+    assert np.allclose(moments.mean(), df.mean())
+    assert np.allclose(moments.variance(), df.var(), rtol=1e-6)
+    assert np.allclose(moments.variance(ddof=0), df.var(ddof=0), rtol=1e-6)
+    assert np.allclose(moments.skewness(), df.skew(), rtol=1e-6, atol=1e-9)
+    assert np.allclose(moments.range(), df.max() - df.min())
+    assert moments.mean().equals(moments.compute()["mean"].rename(None))
+    assert moments.variance()["constant"] == 0 and moments.skewness()["constant"] == 0
+
+    # merging the moments of small blocks gives the moments of the whole column
+    assert np.allclose(pd.Series(column_moments(df["normal"], block_rows=7)), pd.Series(column_moments(df["normal"])))
+
+    # raw kurtosis keeps its formula: average of (x - mean)^4 / sample variance^2
+    normal = df["normal"]
+    expected_kurtosis = ((normal - normal.mean()) ** 4).mean() / normal.var() ** 2
+
+    assert np.isclose(Distribution(df).raw_kurtosis()["normal"].iloc[0], expected_kurtosis)
+    assert np.isclose(Distribution(df).excess_kurtosis()["normal"].iloc[0], expected_kurtosis - 3)
+
+    statistics = Statistics(df, ["normal"])
+
+    assert statistics.standard_deviation().index.tolist() == ["normal"]
+    assert np.isclose(statistics.mean()["normal"], normal.mean())
+
+    assert NumericalDiagnosis(df).check_variance()["constant"] == 0
+
+"""A test ensuring that partial statistics of chunks, merged across workers and serialized, match statistics of the whole DataFrame."""
+
+def test_partial_statistics():
+    from datalabx import PartialStatistics, Moments, Distribution
+    import functools
+    import json
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    rng = np.random.default_rng(1)
+
+    df = pd.DataFrame({"price": rng.lognormal(3, 1, 10_000), "quantity": rng.integers(0, 50, 10_000).astype("float64")})
+    df.loc[::97, "quantity"] = np.nan
+
+    edges = np.linspace(0, 200, 41)
+
+    # each worker sees its own chunks, some as polars DataFrames, and sends its statistics as JSON
+    workers = []
+
+    for worker_chunks in np.array_split(np.arange(len(df)), 3):
+        partial = PartialStatistics(histogram_edges={"price": edges})
+
+        for chunk in np.array_split(worker_chunks, 4):
+            batch = df.iloc[chunk]
+            partial.update(pl.from_pandas(batch) if chunk[0] % 2 else batch)
+
+        workers.append(PartialStatistics.from_dict(json.loads(json.dumps(partial.to_dict()))))
+
+    worker_columns = [list(worker.columns) for worker in workers]
+
+    merged = functools.reduce(PartialStatistics.merge, workers, PartialStatistics())
+
+    # merging never changes the columns of the merged workers
+    assert [worker.columns for worker in workers] == worker_columns
+    assert merged.columns is not workers[0].columns
+
+    extra = PartialStatistics().update(pd.DataFrame({"extra": [1.0, 2.0]}))
+    first_worker_columns = list(workers[0].columns)
+
+    PartialStatistics().merge(workers[0]).merge(extra)
+
+    assert workers[0].columns == first_worker_columns
+
+    expected = Moments(df)
+
+    assert merged.moments()["count"].tolist() == df.count().tolist()
+    assert np.allclose(merged.to_moments().variance(), expected.variance())
+    assert np.allclose(merged.to_moments().skewness(), expected.skewness())
+    assert np.allclose(merged.to_moments().raw_kurtosis(), expected.raw_kurtosis())
+    assert np.allclose(merged.to_moments().range(), expected.range())
+
+    histogram = merged.histogram()
+
+    assert histogram["counts"]["price"].dropna().tolist() == np.histogram(df["price"], bins=edges)[0].tolist()
+    assert histogram["counts"]["price"].sum() + merged.to_dict()["histograms"]["price"]["above"] == len(df)
+    assert histogram.columns.equals(Distribution(df[["price"]]).compute_histogram().columns)
+
+"""A test ensuring that quantile sketches stay within their rank error, also when merged across chunks and serialized, and back approx=True in Statistics and Outliers."""
+
+def test_quantile_sketch():
+    from datalabx import QuantileSketch, Statistics, Outliers, config
+    import functools
+    import json
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    rng = np.random.default_rng(2)
+
+    values = rng.lognormal(size=200_000)
+    df = pd.DataFrame({"values": values, "normal": rng.normal(size=200_000)})
+
+    def rank(value):
+        return (values <= value).mean()
+
+    chunks = np.array_split(values, 7)
+    sketches = [QuantileSketch(seed=number).update(pl.Series(chunk) if number % 2 else chunk) for number, chunk in enumerate(chunks)]
+    sketches = [QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict()))) for sketch in sketches]
+
+    merged = functools.reduce(QuantileSketch.merge, sketches)
+
+    assert merged.count == len(values) and merged.min == values.min() and merged.max == values.max()
+
+    # memory does not grow with the number of values
+    assert sum(len(level) for level in merged.to_dict()["levels"]) < 4 * merged.k
+
+    for quantile, approximate in zip([0.1, 0.25, 0.5, 0.75, 0.99], merged.quantiles([0.1, 0.25, 0.5, 0.75, 0.99])):
+        assert abs(rank(approximate) - quantile) < 2 * merged.error
+
+    statistics = Statistics(df)
+
+    assert abs(rank(statistics.median(approx=True)["values"]) - 0.5) < 2 * merged.error
+    assert np.allclose(statistics.iqr(approx=True), statistics.iqr(), rtol=0.05)
+    assert np.allclose(statistics.median_absolute_deviation(approx=True), statistics.median_absolute_deviation(), rtol=0.05)
+
+    outliers = Outliers(df).quantile_outliers(0.01, 0.99, approx=True)["values"].count()
+
+    assert abs(outliers - 0.02 * len(df)) < 4 * merged.error * len(df)
+
+    with config.options(quantile_error=0.001):
+        assert QuantileSketch().k > merged.k
+
+"""A test ensuring that quantiles([...]) matches pandas, and that iqr(), median() and outlier fences reuse the quantiles cached on the instance."""
+
+def test_batched_quantiles(monkeypatch):
+    from datalabx import Statistics, Outliers, Distribution
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(3)
+
+    df = pd.DataFrame({"values": rng.lognormal(size=1_001), "counts": rng.integers(0, 100, 1_001)})
+    df.loc[::50, "values"] = np.nan
+
+    computed_quantiles = []
+    compute_quantiles = Statistics._compute_quantiles
+
+    def counting_compute_quantiles(self, quantiles, approx):
+        computed_quantiles.append(quantiles)
+        return compute_quantiles(self, quantiles, approx)
+
+    monkeypatch.setattr(Statistics, "_compute_quantiles", counting_compute_quantiles)
+
+    statistics = Statistics(df)
+
+    assert statistics.quantiles([0.25, 0.5, 0.75]).equals(df.quantile([0.25, 0.5, 0.75]))
+    assert statistics.quantiles(0.5).equals(df.quantile(0.5))
+    assert statistics.median().equals(df.median())
+    assert statistics.iqr().equals(df.quantile(0.75) - df.quantile(0.25))
+
+    # every quantile above came from a single selection per column
+    assert computed_quantiles == [[0.25, 0.5, 0.75]]
+
+    outliers = Outliers(df)
+
+    assert outliers.iqr_outliers().equals(df[(df < df.quantile(0.25) - 1.5 * (df.quantile(0.75) - df.quantile(0.25))) | (df > df.quantile(0.75) + 1.5 * (df.quantile(0.75) - df.quantile(0.25)))])
+    assert outliers.quantile_outliers().equals(df[(df < df.quantile(0.01)) | (df > df.quantile(0.99))])
+    assert computed_quantiles[1:] == [[0.25, 0.75], [0.01, 0.99]]
+
+    # equal lower and upper quantiles flag every value apart from the median
+    median_outliers = Outliers(df).quantile_outliers(0.5, 0.5)
+
+    assert isinstance(median_outliers, pd.DataFrame)
+    assert median_outliers.equals(df[(df < df.quantile(0.5)) | (df > df.quantile(0.5))])
+
+    # outliers of a subset of columns are compared against the boundaries of those columns only
+    subset_outliers = Outliers(df, columns=["values"])
+
+    assert subset_outliers.iqr_outliers().equals(outliers.iqr_outliers()[["values"]])
+    assert subset_outliers.quantile_outliers(0.05, 0.95).equals(Outliers(df).quantile_outliers(0.05, 0.95)[["values"]])
+
+    # distribution measures share the moments of their statistics
+    distribution = Distribution(df)
+
+    assert distribution.moments is distribution.statistics.moments
@@ -0,0 +1,54 @@
+"""A test ensuring that config options are used as defaults by every class, and that config.options() only applies inside its block."""
+
+def test_config_options():
+    import datalabx
+    from datalabx import config, DataLoader, BackendConverter, NumericalCleaner
+    import tempfile
+    import threading
+    import pytest
+    from pathlib import Path
+    import pandas as pd
+    import polars as pl
+
+    assert datalabx.config is config
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        csv_path = Path(tempdir) / "numbers.csv"
+        pl.DataFrame({"number": range(10)}).write_csv(csv_path)
+
+        with config.options(array_type="pyarrow", chunk_rows=4, max_workers=2):
+            loader = DataLoader(str(csv_path))
+
+            assert loader.array_type == "pyarrow" and loader.max_workers == 2
+            assert [batch.height for batch in loader.iter_batches(return_type="polars")] == [4, 4, 2]
+            assert str(loader.load_tabular()["number"].dtype) == "int64[pyarrow]"
+
+            # options of a block do not leak into other threads
+            thread_array_types = []
+            thread = threading.Thread(target=lambda: thread_array_types.append(config.array_type))
+            thread.start()
+            thread.join()
+
+            assert thread_array_types == ["auto"]
+
+            # arguments passed directly take priority over the config
+            assert DataLoader(str(csv_path), array_type="numpy").array_type == "numpy"
+
+        assert config.array_type == "auto" and DataLoader(str(csv_path)).max_workers is None
+
+    try:
+        config.set(conversion_threshold=5)
+
+        assert str(BackendConverter(pl.DataFrame({"number": range(10)})).polars_to_pandas()["number"].dtype) == "int64[pyarrow]"
+        assert NumericalCleaner(pd.DataFrame({"number": [1.5]})).conversion_threshold == 5
+
+    finally:
+        config.reset()
+
+    assert config.conversion_threshold == 100_000
+
+    with pytest.raises(ValueError):
+        config.set(unknown_option=1)
+
+    with pytest.raises(TypeError):
+        config.set(chunk_rows="large")
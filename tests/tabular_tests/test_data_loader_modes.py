@@ -0,0 +1,795 @@
+"""TESTING DATA LOADER READING MODES."""
+
+"""A test ensuring that scan_tabular returns a lazy plan with pushed down columns and filters."""
+
+def test_scan_tabular():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        df = pl.DataFrame({
+            "month": ["2026-09", "2026-10", "2026-10", "2026-11"],
+            "amount": [10.5, 20.0, 30.25, 40.0],
+            "store": ["A", "B", "C", "D"]
+        })
+
+        parquet_path = path / "sales.parquet"
+        df.write_parquet(parquet_path)
+
+        csv_path = path / "sales.csv"
+        df.write_csv(csv_path)
+
+        for file_path in [parquet_path, csv_path]:
+
+            lazy_df = DataLoader(str(file_path)).scan_tabular(
+                columns=["amount"],
+                filters=pl.col("month") == "2026-10")
+
+            assert isinstance(lazy_df, pl.LazyFrame)
+
+            result = lazy_df.collect()
+
+            assert result.columns == ["amount"]
+            assert result["amount"].to_list() == [20.0, 30.25]
+
+"""A test ensuring that iter_batches yields bounded batches that add up to the whole file."""
+
+def test_iter_batches():
+
+    from datalabx import DataLoader
+    import pytest
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        df = pl.DataFrame({
+            "id": list(range(1_000)),
+            "value": [float(number) * 1.5 for number in range(1_000)],
+            "name": [f"row_{number}" for number in range(1_000)]
+        })
+
+        csv_path = path / "rows.csv"
+        df.write_csv(csv_path)
+
+        parquet_path = path / "rows.parquet"
+        df.write_parquet(parquet_path, row_group_size=300)
+
+        for file_path in [csv_path, parquet_path]:
+
+            pandas_batches = list(DataLoader(str(file_path)).iter_batches(batch_rows=256))
+
+            assert all(isinstance(batch, pd.DataFrame) for batch in pandas_batches)
+            assert [len(batch) for batch in pandas_batches] == [256, 256, 256, 232]
+
+            polars_batches = list(DataLoader(str(file_path)).iter_batches(batch_rows=400, columns=["id"], return_type="polars"))
+
+            assert all(isinstance(batch, pl.DataFrame) for batch in polars_batches)
+            assert pl.concat(polars_batches)["id"].to_list() == list(range(1_000))
+
+        # polars reader options are translated for pyarrow's batched CSV reader, with the same results as polars
+        semicolon_path = path / "semicolon.csv"
+        semicolon_path.write_text("id;code;note\n1;NA;x\n2;7;\n3;-;z\n")
+
+        semicolon_batches = DataLoader(str(semicolon_path)).iter_batches(separator=";", null_values="-", return_type="polars")
+
+        assert pl.concat(list(semicolon_batches)).equals(pl.read_csv(semicolon_path, separator=";", null_values="-"))
+
+        headerless_path = path / "headerless.csv"
+        headerless_path.write_text("1,a\n2,b\n")
+
+        headerless_batches = DataLoader(str(headerless_path)).iter_batches(has_header=False, return_type="polars")
+
+        assert pl.concat(list(headerless_batches)).equals(pl.read_csv(headerless_path, has_header=False))
+
+        with pytest.raises(TypeError, match="comment_prefix"):
+            list(DataLoader(str(csv_path)).iter_batches(comment_prefix="#"))
+
+"""A test ensuring that DataLoader reads directories and glob patterns with hive partitions."""
+
+def test_multi_file_loading():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        for day in ["2026-10-01", "2026-10-02", "2026-10-03"]:
+            partition = path / f"date={day}"
+            partition.mkdir()
+
+            pl.DataFrame({"store": ["A", "B"], "amount": [1.0, 2.0]}).write_parquet(partition / "part-0.parquet")
+
+        # a file with an extra column, to make sure schemas are combined
+        pl.DataFrame({"store": ["C"], "amount": [3.0], "discount": [0.5]}).write_parquet(path / "date=2026-10-03" / "part-1.parquet")
+
+        (path / "_SUCCESS").write_text("")
+
+        directory_df = DataLoader(str(path), max_workers=2).load_tabular()
+
+        assert isinstance(directory_df, pd.DataFrame)
+        assert len(directory_df) == 7
+        assert set(directory_df.columns) == {"store", "amount", "discount", "date"}
+        assert sorted(directory_df["date"].unique()) == ["2026-10-01", "2026-10-02", "2026-10-03"]
+
+        glob_df = DataLoader(str(path / "date=2026-10-0[12]" / "*.parquet")).scan_tabular(
+            filters=pl.col("date") == "2026-10-02").collect()
+
+        assert glob_df.height == 2
+        assert glob_df["date"].unique().to_list() == ["2026-10-02"]
+
+"""A test ensuring that compressed CSV and JSON files are detected and decompressed while reading."""
+
+def test_compressed_files():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import gzip
+    import bz2
+    import lzma
+    import pandas as pd
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        csv_data = b"id,value\n1,10.5\n2,20.5\n3,30.5\n"
+
+        (path / "events.csv.gz").write_bytes(gzip.compress(csv_data))
+        (path / "events.csv.bz2").write_bytes(bz2.compress(csv_data))
+        (path / "events.csv.xz").write_bytes(lzma.compress(csv_data))
+        (path / "events.json.gz").write_bytes(gzip.compress(b'[{"id": 1, "value": 10.5}, {"id": 2, "value": 20.5}]'))
+
+        for file_name in ["events.csv.gz", "events.csv.bz2", "events.csv.xz"]:
+            loader = DataLoader(str(path / file_name))
+
+            assert loader.file_type == "csv"
+
+            df = loader.load_tabular()
+
+            assert isinstance(df, pd.DataFrame)
+            assert df["value"].tolist() == [10.5, 20.5, 30.5]
+            assert [len(batch) for batch in loader.iter_batches(batch_rows=2)] == [2, 1]
+
+        json_df = DataLoader(str(path / "events.json.gz")).load_tabular()
+
+        assert json_df["id"].tolist() == [1, 2]
+
+"""A test ensuring that Arrow IPC (Feather) and ORC files are loaded as pandas DataFrames."""
+
+def test_arrow_and_orc_files():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.orc as orc
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        arrow_table = pa.table({"id": [1, 2, 3], "name": ["Alice", "Bob", None]})
+
+        feather.write_feather(arrow_table, path / "cache.feather")
+        orc.write_table(arrow_table, path / "cache.orc")
+
+        for file_name in ["cache.feather", "cache.orc"]:
+
+            df = DataLoader(str(path / file_name), array_type="pyarrow").load_tabular()
+
+            assert isinstance(df, pd.DataFrame)
+            assert df["id"].tolist() == [1, 2, 3]
+            assert isinstance(df["id"].dtype, pd.ArrowDtype)
+
+            projected_df = DataLoader(str(path / file_name)).load_tabular(columns=["name"])
+
+            assert projected_df.columns.tolist() == ["name"]
+
+"""A test ensuring that parsed DataFrames are cached on disk and invalidated when the file changes."""
+
+def test_data_loader_cache():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+        cache_dir = path / "cache"
+
+        csv_path = path / "data.csv"
+        csv_path.write_text("id,value\n1,10\n2,20\n")
+
+        first_df = DataLoader(str(csv_path), cache_dir=str(cache_dir)).load_tabular()
+        assert len(list(cache_dir.glob("*.arrow"))) == 1
+
+        cached_df = DataLoader(str(csv_path), cache_dir=str(cache_dir)).load_tabular()
+        assert cached_df.equals(first_df)
+        assert len(list(cache_dir.glob("*.arrow"))) == 1
+
+        # different reader options are cached separately
+        DataLoader(str(csv_path), cache_dir=str(cache_dir)).load_tabular(load_csv_as_string=True)
+        assert len(list(cache_dir.glob("*.arrow"))) == 2
+
+        # changing the file invalidates the cached DataFrame
+        csv_path.write_text("id,value\n1,10\n2,20\n3,30\n")
+
+        changed_df = DataLoader(str(csv_path), cache_dir=str(cache_dir)).load_tabular()
+        assert len(changed_df) == 3
+
+        # a tiny cache evicts least recently used files when a new file is cached
+        DataLoader(str(csv_path), cache_dir=str(cache_dir), cache_max_bytes=1).load_tabular(load_csv_as_string=True)
+        assert len(list(cache_dir.glob("*.arrow"))) <= 1
+
+        # threads writing the same key at once never share a temporary file
+        from concurrent.futures import ThreadPoolExecutor
+        from datalabx.tabular.data_loader.DataCache import DataCache
+        import polars as pl
+
+        thread_cache = DataCache(path / "thread_cache")
+        thread_df = pl.DataFrame({"numbers": range(200_000)})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: thread_cache.put("same_key", thread_df), range(16)))
+
+        assert thread_cache.get("same_key").equals(thread_df)
+        assert not list((path / "thread_cache").glob("*.tmp"))
+
+"""A test ensuring that CSV columns failing schema inference are widened, and the resolved schema can be reused."""
+
+def test_progressive_schema_inference():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import gzip
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        rows = ["id,value,flag"] + [f"{number},{number},true" for number in range(500)] + ["500,1.5,true", "501,7,unknown"]
+        csv_data = "\n".join(rows) + "\n"
+
+        csv_path = path / "values.csv"
+        csv_path.write_text(csv_data)
+
+        # compressed files cannot be sampled, so columns are widened one by one
+        compressed_path = path / "values.csv.gz"
+        compressed_path.write_bytes(gzip.compress(csv_data.encode()))
+
+        for file_path in [csv_path, compressed_path]:
+            loader = DataLoader(str(file_path))
+            df = loader.load_tabular()
+
+            assert len(df) == 502
+            assert loader.schema == {"id": pl.Int64, "value": pl.Float64, "flag": pl.String}
+
+            reused_df = DataLoader(str(file_path)).load_tabular(schema=loader.schema)
+
+            assert reused_df.dtypes.equals(df.dtypes)
+
+"""A test ensuring that NDJSON files are loaded, and malformed JSON records are repaired or skipped one by one."""
+
+def test_ndjson_and_lenient_json():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import gzip
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        ndjson_data = "".join(f'{{"id": {number}, "value": {number * 1.5}}}\n' for number in range(10))
+
+        (path / "events.jsonl").write_text(ndjson_data)
+        (path / "events.ndjson.gz").write_bytes(gzip.compress(ndjson_data.encode()))
+
+        for file_name in ["events.jsonl", "events.ndjson.gz"]:
+            loader = DataLoader(str(path / file_name))
+
+            assert loader.load_tabular()["id"].tolist() == list(range(10))
+            assert [len(batch) for batch in loader.iter_batches(batch_rows=4)] == [4, 4, 2]
+
+        scanned_df = DataLoader(str(path / "events.jsonl")).scan_tabular(columns=["id"], filters=pl.col("id") >= 8).collect()
+
+        assert scanned_df["id"].to_list() == [8, 9]
+
+        (path / "broken.json").write_text("""// exported records
+        [
+            {"id": 1, "name": "Alice", "tags": ["a", "]"]},
+            {"id": 2, 'name': 'Bob',},
+            {"id": 3, "name": "Carol" "Dan"},
+            {"id": 4, "name": "Eve"} /* trailing comment */
+        ]""")
+
+        loader = DataLoader(str(path / "broken.json"))
+        json_df = loader.load_tabular()
+
+        assert json_df["id"].tolist() == [1, 2, 4]
+        assert json_df["name"].tolist() == ["Alice", "Bob", "Eve"]
+        assert [record["record"] for record in loader.malformed_records] == [2]
+
+        (path / "broken.ndjson").write_text('{"id": 1}\n{"id": 2,}\nnot a record\n{"id": 4}\n')
+
+        loader = DataLoader(str(path / "broken.ndjson"))
+
+        assert loader.load_tabular()["id"].tolist() == [1, 2, 4]
+        assert loader.malformed_records[0]["record"] == 3
+
+"""A test ensuring that multiple excel sheets are loaded as a dictionary, or combined with a sheet column."""
+
+def test_load_sheets():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    import openpyxl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir) / "finance.xlsx"
+
+        workbook = openpyxl.Workbook()
+        workbook.remove(workbook.active)
+
+        for month in ["January", "February", "March"]:
+            sheet = workbook.create_sheet(month)
+            sheet.append(["account", "amount"])
+
+            for number in range(5):
+                sheet.append([f"account_{number}", number * 10.0])
+
+        workbook["March"]["C1"] = "note"
+        workbook.save(path)
+
+        sheets = DataLoader(str(path), max_workers=2).load_sheets()
+
+        assert list(sheets) == ["January", "February", "March"]
+        assert all(isinstance(df, pd.DataFrame) and len(df) == 5 for df in sheets.values())
+
+        combined_df = DataLoader(str(path)).load_sheets(sheets=["January", 2], sheet_column="sheet", n_rows=2)
+
+        assert combined_df.columns.tolist() == ["sheet", "account", "amount", "note"]
+        assert combined_df["sheet"].tolist() == ["January", "January", "March", "March"]
+
+"""A test ensuring that load_tabular returns polars DataFrames and pyarrow Tables without converting them to pandas."""
+
+def test_load_tabular_return_types():
+
+    from datalabx import DataLoader, BackendConverter
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        polars_source = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None]})
+
+        polars_source.write_parquet(path / "data.parquet")
+        polars_source.write_ipc(path / "data.feather")
+
+        for file_name in ["data.parquet", "data.feather"]:
+            loader = DataLoader(str(path / file_name))
+
+            polars_df = loader.load_tabular(return_type="polars")
+            arrow_table = loader.load_tabular(return_type="arrow")
+
+            assert isinstance(polars_df, pl.DataFrame) and polars_df.equals(polars_source)
+            assert isinstance(arrow_table, pa.Table) and arrow_table.column("id").to_pylist() == [1, 2, 3]
+
+        batches = list(DataLoader(str(path / "data.parquet")).iter_batches(batch_rows=2, return_type="arrow"))
+
+        assert all(isinstance(batch, pa.Table) for batch in batches)
+
+        converter = BackendConverter(arrow_table)
+
+        assert converter.pandas_to_polars().equals(polars_source)
+        assert isinstance(converter.polars_to_pandas(), pd.DataFrame)
+        assert BackendConverter(polars_source.to_pandas()).to_arrow().column_names == ["id", "name"]
+
+"""A test ensuring that aload_many loads files concurrently from asyncio code and reports files that fail."""
+
+def test_aload_many():
+
+    from datalabx import DataLoader
+    import asyncio
+    import tempfile
+    from pathlib import Path
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir)
+
+        file_paths = []
+
+        for number in range(6):
+            file_path = path / f"extract_{number}.csv"
+            file_path.write_text(f"id,value\n{number},{number * 10}\n")
+            file_paths.append(str(file_path))
+
+        missing_path = str(path / "missing.csv")
+
+        async def load_all():
+            results = {}
+
+            async for file_path, result in DataLoader.aload_many(
+                    file_paths + [missing_path], max_workers=3, return_exceptions=True, return_type="polars"):
+                results[file_path] = result
+
+            single_df = await DataLoader(file_paths[0]).aload_tabular()
+
+            return results, single_df
+
+        results, single_df = asyncio.run(load_all())
+
+        assert set(results) == set(file_paths + [missing_path])
+        assert isinstance(results[missing_path], FileNotFoundError)
+        assert all(isinstance(results[file_path], pl.DataFrame) for file_path in file_paths)
+        assert results[file_paths[5]]["value"].to_list() == [50]
+        assert single_df["id"].tolist() == [0]
+
+"""A test ensuring that array_type='adaptive' chooses the pandas backend of each column and reports its memory."""
+
+def test_adaptive_array_type():
+
+    from datalabx import DataLoader, BackendConverter
+    import tempfile
+    from pathlib import Path
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    polars_df = pl.DataFrame({
+        "price": [1.5, None, 3.25],
+        "quantity": [1, 2, 3],
+        "discount": [10, None, 30],
+        "name": ["a", "b", None]
+    })
+
+    converter = BackendConverter(polars_df)
+    pandas_df = converter.polars_to_pandas(array_type="adaptive")
+
+    assert pandas_df.columns.tolist() == ["price", "quantity", "discount", "name"]
+    assert pandas_df["price"].dtype == np.float64
+    assert pandas_df["quantity"].dtype == np.int64
+    assert isinstance(pandas_df["discount"].dtype, pd.ArrowDtype)
+    assert isinstance(pandas_df["name"].dtype, pd.ArrowDtype)
+
+    assert {column: report["backend"] for column, report in converter.backend_report.items()} == {
+        "price": "numpy", "quantity": "numpy", "discount": "pyarrow", "name": "pyarrow"}
+    assert all(report["memory_bytes"] > 0 for report in converter.backend_report.values())
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        parquet_path = Path(tempdir) / "data.parquet"
+        polars_df.write_parquet(parquet_path)
+
+        loader = DataLoader(str(parquet_path), array_type="adaptive")
+        loaded_df = loader.load_tabular()
+
+        assert loaded_df.dtypes.equals(pandas_df.dtypes)
+        assert loader.backend_report["name"]["backend"] == "pyarrow"
+
+        # a later load that is not converted to pandas does not keep the previous report
+        loader.load_tabular(return_type="polars")
+
+        assert loader.backend_report is None
+
+"""A test ensuring that optimize_memory downcasts numbers and encodes repeated strings, without changing their values."""
+
+def test_optimize_memory():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        parquet_path = Path(tempdir) / "data.parquet"
+
+        pl.DataFrame({
+            "small": list(range(100)) * 10,
+            "large": [number * 1_000_000 for number in range(1_000)],
+            "half": [0.5, 1.25] * 500,
+            "precise": [number / 3 for number in range(1_000)],
+            "city": ["Paris", "Tokyo", None, "Lima"] * 250,
+            "id": [f"id_{number}" for number in range(1_000)],
+            "missing": [1, None] * 500
+        }).write_parquet(parquet_path)
+
+        loader = DataLoader(str(parquet_path), array_type="numpy")
+
+        original_df = loader.load_tabular()
+        optimized_df = loader.load_tabular(optimize_memory=True)
+
+        # the report describes the returned pandas DataFrame, with and without optimize_memory
+        assert {column: report["after_dtype"] for column, report in loader.memory_report.items() if column != "id"} == {
+            "small": "int8", "large": "int32", "half": "float32", "precise": "float64", "city": "category", "missing": "int8[pyarrow]"}
+
+        for column, report in loader.memory_report.items():
+            assert report["before_bytes"] == original_df[column].memory_usage(deep=True, index=False)
+            assert report["after_bytes"] == optimized_df[column].memory_usage(deep=True, index=False)
+
+        assert loader.memory_report["city"]["after_bytes"] < loader.memory_report["city"]["before_bytes"]
+
+        # integers with nulls keep their downcast instead of becoming float64
+        assert optimized_df["missing"].isna().sum() == 500
+        assert original_df["missing"].dtype == "float64"
+
+        assert isinstance(optimized_df["city"].dtype, pd.CategoricalDtype)
+        assert optimized_df["large"].tolist() == original_df["large"].tolist()
+        assert optimized_df["half"].tolist() == original_df["half"].tolist()
+        assert optimized_df.memory_usage(deep=True).sum() < original_df.memory_usage(deep=True).sum()
+
+        # the schema keeps the types read from the file, so it can be reused for similar files
+        assert loader.schema["small"] == pl.Int64
+
+        # a later load without optimize_memory does not keep the previous report
+        loader.load_tabular()
+
+        assert loader.memory_report is None
+
+    from datalabx.tabular.data_loader.MemoryOptimizer import optimize_dtypes
+
+    # column names that look like the names of statistics do not clash with them
+    clashing_df, _ = optimize_dtypes(pl.DataFrame({"a": [1, 2], "a_min": [100_000, 200_000], "a_max_unique": ["x", "x"]}))
+
+    assert clashing_df.schema["a"] == pl.Int8 and clashing_df.schema["a_min"] == pl.Int32
+
+"""A test ensuring that load_tabular reports the timings, size and memory of each load."""
+
+def test_load_report():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        csv_path = Path(tempdir) / "values.csv"
+
+        rows = ["id,value"] + [f"{number},{number}" for number in range(200)] + ["200,not a number"]
+        csv_path.write_text("\n".join(rows) + "\n")
+
+        loader = DataLoader(str(csv_path))
+        df = loader.load_tabular(report=True)
+
+        load_report = loader.load_report
+
+        assert (load_report["rows"], load_report["columns"]) == df.shape == (201, 2)
+        assert load_report["bytes_read"] == csv_path.stat().st_size
+        assert load_report["fallback_retries"] >= 1
+        assert {"stat", "parse", "schema_inference", "fallback", "conversion", "total"} <= set(load_report["timings"])
+        assert all(seconds >= 0 for seconds in load_report["timings"].values())
+
+        # peak memory is only sampled when report=True
+        loader.load_tabular(return_type="polars")
+
+        assert loader.load_report["peak_memory_bytes"] is None
+        assert "conversion" not in loader.load_report["timings"]
+
+"""A test ensuring that DatabaseLoader loads SQL queries in chunks and reuses pooled SQLite connections."""
+
+def test_database_loader():
+
+    from datalabx import DatabaseLoader
+    import tempfile
+    import sqlite3
+    from pathlib import Path
+    import pandas as pd
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        database_path = Path(tempdir) / "exports.sqlite"
+
+        with sqlite3.connect(database_path) as connection:
+            connection.execute("CREATE TABLE customers (id INTEGER, age, city TEXT)")
+            connection.executemany(
+                "INSERT INTO customers VALUES (?, ?, ?)",
+                [(number, "unknown" if number == 7 else 20 + number, None if number % 3 else "Paris") for number in range(10)])
+        connection.close()
+
+        loader = DatabaseLoader(str(database_path))
+
+        df = loader.load_query("SELECT * FROM customers", chunk_rows=4)
+
+        assert isinstance(df, pd.DataFrame)
+        assert df.columns.tolist() == ["id", "age", "city"]
+        assert df["id"].tolist() == list(range(10))
+
+        # a column holding numbers and strings is kept as strings
+        assert df["age"].tolist()[6:8] == ["26", "unknown"]
+
+        chunks = list(loader.iter_query("SELECT id FROM customers WHERE id >= ?", params=(3,), chunk_rows=3, return_type="polars"))
+
+        assert [chunk.height for chunk in chunks] == [3, 3, 1]
+
+        empty_df = loader.load_query("SELECT id, city FROM customers WHERE id < 0", return_type="polars")
+
+        assert empty_df.columns == ["id", "city"] and empty_df.height == 0
+
+        # the same database shares its idle connections across loaders
+        assert DatabaseLoader(database_path).pool is loader.pool
+        assert loader.pool.idle_connections.qsize() == 1
+
+        with sqlite3.connect(database_path) as user_connection:
+            arrow_table = DatabaseLoader(user_connection).load_query("SELECT city FROM customers", return_type="arrow")
+
+            assert arrow_table.column("city").null_count == 6
+        user_connection.close()
+
+    import pyarrow as pa
+
+    # an ADBC-like cursor returning its own (larger) Arrow batches
+    class ArrowCursor:
+        description = [("id",)]
+
+        def execute(self, query):
+            pass
+
+        def fetch_record_batch(self):
+            return pa.RecordBatchReader.from_batches(pa.schema([("id", pa.int64())]), [pa.record_batch({"id": list(range(10))})])
+
+        def close(self):
+            pass
+
+    class ArrowConnection:
+        def cursor(self):
+            return ArrowCursor()
+
+    arrow_chunks = list(DatabaseLoader(ArrowConnection()).iter_query("SELECT id FROM customers", chunk_rows=4, return_type="polars"))
+
+    assert [chunk.height for chunk in arrow_chunks] == [4, 4, 2]
+
+"""A test ensuring that load_sample returns the requested number of rows in file order, for seekable and non seekable files."""
+
+def test_load_sample():
+
+    from datalabx import DataLoader
+    import tempfile
+    import gzip
+    import shutil
+    from pathlib import Path
+    import numpy as np
+    import polars as pl
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        tempdir = Path(tempdir)
+
+        polars_df = pl.DataFrame({"id": np.arange(50_000), "value": np.arange(50_000) * 0.5})
+
+        csv_path = tempdir / "events.csv"
+        parquet_path = tempdir / "events.parquet"
+        gzip_path = tempdir / "events.csv.gz"
+
+        polars_df.write_csv(csv_path)
+        polars_df.write_parquet(parquet_path, row_group_size=1_000)
+
+        with open(csv_path, "rb") as source, gzip.open(gzip_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+        for file_path in [csv_path, parquet_path, gzip_path]:
+            loader = DataLoader(str(file_path))
+
+            head_df = loader.load_sample(n_rows=500, method="head", return_type="polars")
+
+            assert head_df["id"].to_list() == list(range(500))
+
+            for method in ["random", "systematic"]:
+                sample_df = loader.load_sample(n_rows=500, method=method, seed=7, return_type="polars")
+
+                assert sample_df.height == 500
+                assert sample_df.columns == ["id", "value"]
+                assert sample_df["id"].is_sorted() and sample_df["id"].n_unique() == 500
+                assert (sample_df["value"] == sample_df["id"] * 0.5).all()
+
+                # the same seed returns the same sample
+                assert sample_df.equals(loader.load_sample(n_rows=500, method=method, seed=7, return_type="polars"))
+
+        # files smaller than the sample are returned whole
+        assert DataLoader(str(csv_path)).load_sample(n_rows=100_000).shape == (50_000, 2)
+
+        # polars reader options work the same whether the file is seeked, read with polars or streamed
+        semicolon_path = tempdir / "semicolon.csv"
+        semicolon_gzip_path = tempdir / "semicolon.csv.gz"
+
+        polars_df.write_csv(semicolon_path, separator=";")
+
+        with open(semicolon_path, "rb") as source, gzip.open(semicolon_gzip_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+        for file_path in [semicolon_path, semicolon_gzip_path]:
+            for method in ["head", "random", "systematic"]:
+                sample_df = DataLoader(str(file_path)).load_sample(n_rows=100, method=method, seed=7, separator=";", return_type="polars")
+
+                assert sample_df.columns == ["id", "value"] and sample_df.height == 100
+
+        parquet_sample = DataLoader(str(parquet_path)).load_sample(n_rows=100, seed=7, columns=["id"], parallel="auto", return_type="polars")
+
+        assert parquet_sample.columns == ["id"]
+
+"""A test ensuring that load_new_rows only returns rows appended since the previous call, and keeps the schema of the previous rows."""
+
+def test_load_new_rows():
+
+    from datalabx import DataLoader
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        csv_path = Path(tempdir) / "events.csv"
+
+        # the last line is still being written
+        csv_path.write_text("id,value\n1,1.5\n2,2.5\n3,3.")
+
+        loader = DataLoader(str(csv_path))
+
+        assert loader.load_new_rows(return_type="polars")["id"].to_list() == [1, 2]
+
+        with open(csv_path, "a") as file:
+            file.write("5\n4,4.5\n")
+
+        new_rows = loader.load_new_rows(return_type="polars")
+
+        assert new_rows["id"].to_list() == [3, 4]
+        assert new_rows["value"].to_list() == [3.5, 4.5]
+
+        assert loader.load_new_rows().empty
+
+        # values that do not fit the previous types widen the column
+        with open(csv_path, "a") as file:
+            file.write("5,n/a\n")
+
+        assert loader.load_new_rows(return_type="polars")["value"].to_list() == ["n/a"]
+
+        # columns passed by the user keep their types when the new rows fall back to inferring the others
+        import polars as pl
+
+        codes_path = Path(tempdir) / "codes.csv"
+        codes_path.write_text("value,code\n1.5,10\n")
+
+        codes_loader = DataLoader(str(codes_path))
+        codes_loader.load_new_rows()
+
+        with open(codes_path, "a") as file:
+            file.write("n/a,20\n")
+
+        assert codes_loader.load_new_rows(return_type="polars", schema_overrides={"code": pl.Float64})["code"].dtype == pl.Float64
+
+        # a truncated file is read again from the start
+        csv_path.write_text("id,value\n9,9.5\n")
+
+        assert loader.load_new_rows(return_type="polars")["id"].to_list() == [9]
+
+        ndjson_path = Path(tempdir) / "events.ndjson"
+        ndjson_path.write_text('{"id": 1}\n')
+
+        loader = DataLoader(str(ndjson_path))
+        loader.load_new_rows()
+
+        with open(ndjson_path, "a") as file:
+            file.write('{"id": 2, "tag": "new"}\n{broken\n')
+
+        new_rows = loader.load_new_rows(return_type="polars")
+
+        assert new_rows.columns == ["id", "tag"] and new_rows["id"].to_list() == [2]
+        assert loader.malformed_records[0]["record"] == 3
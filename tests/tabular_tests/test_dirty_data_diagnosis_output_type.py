@@ -23,3 +23,37 @@ def test_dirty_data_diagnosis_output_type():
 
     assert isinstance(diagnosis, dict)
     assert isinstance(diagnosis['Age']['is_dirty'], pd.DataFrame)
+
+"""A test ensuring that diagnosis results keep the original row ids, without resetting or modifying the user's DataFrame."""
+
+def test_diagnosis_preserves_row_ids():
+
+    import pandas as pd
+    from datalabx import DirtyDataDiagnosis, TextDiagnosis
+
+    df = pd.DataFrame(
+        {'price': ['10', '$20', 'unknown', '3,5'],
+         'city': ['Paris', '', 'Lyon, FR', 'Nice']},
+        index=pd.Index(['a', 'b', 'c', 'd'], name='order_id'))
+
+    original_df = df.copy()
+
+    diagnosis = DirtyDataDiagnosis(df)
+
+    numbers = diagnosis.diagnose_numbers()
+    text = diagnosis.diagnose_text()
+
+    assert numbers['price']['has_currency'].index.tolist() == ['b']
+    assert numbers['price']['is_text'].index.tolist() == ['c']
+    assert text['city']['is_empty'].index.tolist() == ['b']
+
+    # calling several methods does not add index columns
+    assert numbers['price']['is_valid'].columns.tolist() == ['price', 'city']
+    assert text['city']['is_valid'].index.name == 'order_id'
+
+    text_diagnosis = TextDiagnosis(df)
+
+    assert text_diagnosis.detect_empty_string()['city'].index.tolist() == ['b']
+    assert text_diagnosis.detect_splitters()['city'].index.tolist() == ['c']
+
+    pd.testing.assert_frame_equal(df, original_df)